@@ -15,25 +15,71 @@ Integrates with Claude Code via Stop hook.
 
 import sys
 import os
-import argparse
-import json
-import subprocess
-from datetime import datetime
+import importlib
+import time
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
 from typing import Dict, List, Any, Optional
 
 # Add parent directory to path for imports
 # File is in .claude/hooks/scripts/, need to go up to .claude/ for review module
+# Checker and report modules (and heavier stdlib modules such as json and
+# multiprocessing) are imported lazily so the common "not triggered" hook
+# invocation doesn't pay for loading them.
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from review.utils.markdown_gen import MarkdownReportGenerator
-from review.checkers.documentation import DocumentationChecker
-from review.checkers.security import SecurityChecker
-from review.checkers.architecture import ArchitectureChecker
-from review.checkers.quality import QualityChecker
-from review.checkers.dependencies import DependenciesChecker
-from review.checkers.testing import TestingChecker
+# Caches live alongside the review module rather than in /tmp so only the
+# project owner can write the files (including the pickle) we later load.
+CACHE_DIR = Path(__file__).parent.parent.parent / 'review' / '.cache'
+CONFIG_CACHE = CACHE_DIR / 'config.pkl'
+TRIGGER_CACHE = CACHE_DIR / 'last-trigger'
+TRIGGER_CACHE_TTL = 60
+
+DEFAULT_OUTPUT = '.claude/CODEBASE_REVIEW.md'
+DEFAULT_CONFIG = '.claude/review/config/review-config.json'
+
+
+def _count_recent_changes(repo_root: str, commits: int = 10) -> Optional[int]:
+    """
+    Count files changed over the last few commits (HEAD~N..HEAD).
+
+    Diffs in-process with pygit2 when it is installed, avoiding a git
+    fork/exec; otherwise falls back to `git diff --name-only`.
+
+    Returns:
+        Number of changed files, or None if the range can't be resolved
+    """
+    try:
+        import pygit2
+    except ImportError:
+        pygit2 = None
+
+    if pygit2 is not None:
+        try:
+            repo = pygit2.Repository(repo_root)
+            head = repo.head.target
+            ancestor = head
+            for _ in range(commits):
+                parents = repo[ancestor].parents
+                if not parents:
+                    return None
+                ancestor = parents[0].id
+            return len(repo.diff(ancestor, head))
+        except (pygit2.GitError, KeyError, ValueError):
+            pass  # Fall back to the git CLI below
+
+    import subprocess
+    result = subprocess.run(
+        ['git', '-C', repo_root, 'diff', '--name-only', f'HEAD~{commits}..HEAD'],
+        capture_output=True,
+        text=True,
+        timeout=5
+    )
+    if result.returncode != 0:
+        return None
+    return result.stdout.count('\n')
 
 
 def should_run_review() -> bool:
@@ -58,72 +104,343 @@ def should_run_review() -> bool:
             pass
         return True
 
-    # Smart trigger: check git changes
+    # Smart trigger: reuse a decision made within the last TRIGGER_CACHE_TTL
+    # seconds so rapid-fire hook invocations don't each spawn git
     try:
-        result = subprocess.run(
-            ['git', 'diff', '--stat', 'HEAD~10..HEAD'],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        if result.returncode == 0:
-            lines = result.stdout.strip().split('\n')
-            changed_files = len([l for l in lines if l.strip() and '|' in l])
-            if changed_files >= 5:
+        if time.time() - TRIGGER_CACHE.stat().st_mtime < TRIGGER_CACHE_TTL:
+            return TRIGGER_CACHE.read_text() == '1'
+    except OSError:
+        pass
+
+    triggered = False
+    repo_root = os.getcwd()
+    if os.path.isdir(os.path.join(repo_root, '.git')):
+        try:
+            changed_files = _count_recent_changes(repo_root)
+            if changed_files is not None and changed_files >= 5:
                 print(f"[review-agent] Smart trigger: {changed_files} files changed", file=sys.stderr)
-                return True
-    except Exception as e:
-        print(f"[review-agent] Smart trigger check failed: {e}", file=sys.stderr)
+                triggered = True
+        except Exception as e:
+            print(f"[review-agent] Smart trigger check failed: {e}", file=sys.stderr)
+
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        TRIGGER_CACHE.write_text('1' if triggered else '0')
+    except OSError:
+        pass
+
+    return triggered
+
 
-    return False
+def _parse_json_bytes(data: bytes) -> Any:
+    """Decode JSON, using orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:
+        import json
+        return json.loads(data)
+    return orjson.loads(data)
+
+
+# Parsed JSON documents by path, valid while the file's (mtime_ns, size) match
+_JSON_CACHE: Dict[str, Any] = {}
+
+
+def _load_json_cached(path: Path) -> Any:
+    """
+    Load a JSON file, reusing the parsed result while the file is unchanged.
+
+    Raises:
+        OSError: If the file can't be read
+        ValueError: If the file isn't valid JSON
+    """
+    st = os.stat(path)
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _JSON_CACHE.get(str(path))
+    if cached and cached[0] == key:
+        return cached[1]
+
+    with open(path, 'rb') as f:
+        data = _parse_json_bytes(f.read())
+    _JSON_CACHE[str(path)] = (key, data)
+    return data
+
+
+def _tmp_path(path: Path) -> Path:
+    """Sibling temp file used to stage a write before renaming it into place."""
+    return path.with_suffix(path.suffix + '.tmp')
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """
+    Write bytes to a file atomically.
+
+    The data is written to a temp file next to the target and renamed over
+    it, so watchers never see a partially written file.
+
+    Args:
+        path: Destination file
+        data: Encoded file contents
+    """
+    tmp = _tmp_path(path)
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def _dump_json_bytes(data: Any) -> bytes:
+    """
+    Encode JSON with 2-space indentation and sorted keys, using orjson when
+    it is installed. Both paths emit UTF-8 with non-ASCII left unescaped.
+    """
+    try:
+        import orjson
+    except ImportError:
+        import json
+        return json.dumps(data, indent=2, sort_keys=True, ensure_ascii=False).encode('utf-8')
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Parse a config file, memoized per (path, mtime, size) within the process.
+
+    Across processes the parsed dict is pickled to CONFIG_CACHE under the
+    same key, so unchanged configs cost a stat and an unpickle.
+    """
+    import pickle
+
+    key = (path, mtime_ns, size)
+    try:
+        with open(CONFIG_CACHE, 'rb') as f:
+            cached_key, cached_config = pickle.load(f)
+        if cached_key == key:
+            return cached_config
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+        pass
+
+    with open(path, 'rb') as f:
+        config = _parse_json_bytes(f.read())
+
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(CONFIG_CACHE, 'wb') as f:
+            pickle.dump((key, config), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+
+    return config
 
 
 def load_config(config_path: str) -> Dict[str, Any]:
-    """Load configuration from JSON file."""
+    """
+    Load configuration from JSON file.
+
+    Repeated calls for an unchanged file return the same (read-only) dict.
+    """
     try:
-        with open(config_path, 'r') as f:
-            return json.load(f)
+        st = os.stat(config_path)
+        return _load_config_cached(os.path.abspath(config_path), st.st_mtime_ns, st.st_size)
     except FileNotFoundError:
         print(f"[review-agent] ERROR: Config file not found: {config_path}", file=sys.stderr)
         sys.exit(1)
-    except json.JSONDecodeError as e:
+    except ValueError as e:
         print(f"[review-agent] ERROR: Invalid JSON in config file: {e}", file=sys.stderr)
         sys.exit(1)
 
 
-def initialize_checkers(focus: str, config: Dict[str, Any]) -> List[Any]:
+# Focus tag -> (module, class) for every checker, in report order. Classes are
+# resolved by name so unused checkers are never imported, and so only the tag
+# (not a checker instance) has to be pickled into worker processes.
+CHECKER_REGISTRY = {
+    'docs': ('review.checkers.documentation', 'DocumentationChecker'),
+    'security': ('review.checkers.security', 'SecurityChecker'),
+    'architecture': ('review.checkers.architecture', 'ArchitectureChecker'),
+    'quality': ('review.checkers.quality', 'QualityChecker'),
+    'dependencies': ('review.checkers.dependencies', 'DependenciesChecker'),
+    'testing': ('review.checkers.testing', 'TestingChecker'),
+}
+
+
+def initialize_checkers(focus: str, config: Dict[str, Any]) -> List[str]:
     """
-    Initialize checker instances based on focus area.
+    Select the checkers to run based on focus area.
 
     Args:
         focus: Focus area ('all', 'docs', 'security', 'quality', 'architecture', 'dependencies', 'testing')
         config: Configuration dictionary
 
     Returns:
-        List of checker instances
+        List of checker tags (keys of CHECKER_REGISTRY)
     """
-    project_root = config['project_root']
-    checkers = []
+    return [tag for tag in CHECKER_REGISTRY if focus in ('all', tag)]
 
-    if focus in ('all', 'docs'):
-        checkers.append(DocumentationChecker(project_root, config))
 
-    if focus in ('all', 'security'):
-        checkers.append(SecurityChecker(project_root, config))
+def _run_checker(tag: str, project_root: str, config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Construct and run a single checker.
 
-    if focus in ('all', 'architecture'):
-        checkers.append(ArchitectureChecker(project_root, config))
+    Module-level so it can be submitted to a process pool; the checker is
+    imported and built inside the worker.
+    """
+    module_name, class_name = CHECKER_REGISTRY[tag]
+    checker_class = getattr(importlib.import_module(module_name), class_name)
+    return checker_class(project_root, config).run()
 
-    if focus in ('all', 'quality'):
-        checkers.append(QualityChecker(project_root, config))
 
-    if focus in ('all', 'dependencies'):
-        checkers.append(DependenciesChecker(project_root, config))
+def _report_checker_error(e: Any, verbose: bool, tb: Optional[str] = None):
+    """
+    Print a checker failure (with traceback in verbose mode).
 
-    if focus in ('all', 'testing'):
-        checkers.append(TestingChecker(project_root, config))
+    Args:
+        e: The exception, or its message when it was raised in a worker
+        verbose: Print the traceback too
+        tb: Formatted traceback from a worker ('' if it has none); defaults
+            to the exception being handled
+    """
+    print(f"[review-agent] ERROR: Checker failed: {e}", file=sys.stderr)
+    if verbose:
+        if tb is not None:
+            print(tb, file=sys.stderr, end='')
+        else:
+            import traceback
+            traceback.print_exc(file=sys.stderr)
 
-    return checkers
+
+def _checker_worker(tag: str, project_root: str, config: Dict[str, Any], conn) -> None:
+    """
+    Worker process entry point: run one checker and send back the outcome.
+
+    Sends (True, result) on success or (False, (message, traceback)) if the
+    checker raised.
+    """
+    try:
+        conn.send((True, _run_checker(tag, project_root, config)))
+    except Exception as e:
+        import traceback
+        conn.send((False, (str(e), traceback.format_exc())))
+    finally:
+        conn.close()
+
+
+def _timed_out_result(tag: str, timeout: float) -> Dict[str, Any]:
+    """Synthetic checker result recorded when a checker exceeds its timeout."""
+    from review.utils.findings import Finding
+
+    return {
+        'category': tag,
+        'status': 'warning',
+        'findings': [Finding(
+            severity='warning',
+            issue=f'{tag} checker timed out',
+            description=f'The {tag} checker did not finish within {timeout:g}s and was stopped.',
+            recommendation="Raise 'checker_timeout' in review-config.json or narrow the checker's scope"
+        )],
+        'metrics': {}
+    }
+
+
+def run_checkers(checkers: List[str], config: Dict[str, Any],
+                 verbose: bool = False) -> List[Optional[Dict[str, Any]]]:
+    """
+    Run checkers in worker processes, in parallel when there is more than one.
+
+    Each checker is stopped after config['checker_timeout'] seconds (default
+    300); a null or 0 timeout disables the limit.
+
+    Args:
+        checkers: List of checker tags from initialize_checkers()
+        config: Configuration dictionary
+        verbose: Print tracebacks for failed checkers
+
+    Returns:
+        Checker results in the same order as checkers (None for failures)
+    """
+    project_root = config['project_root']
+    timeout = config.get('checker_timeout', 300)
+
+    # Without a timeout to enforce, a single checker (the usual --focus case)
+    # runs inline, skipping worker startup entirely
+    if len(checkers) == 1 and not timeout:
+        try:
+            return [_run_checker(checkers[0], project_root, config)]
+        except Exception as e:
+            _report_checker_error(e, verbose)
+            return [None]
+
+    import multiprocessing
+    from multiprocessing.connection import wait
+
+    # Checkers are CPU-bound (file walks, regex scans), so use separate
+    # processes rather than threads to sidestep the GIL. On Linux, fork
+    # workers rather than starting fresh interpreters; each worker imports
+    # only the checker it runs. The processes are our own rather than a
+    # pool's so a hung one can be terminated.
+    mp_context = multiprocessing.get_context('fork' if sys.platform.startswith('linux') else None)
+    # Leave a core for the parent, which only waits on results
+    max_workers = min(len(checkers), max(1, (os.cpu_count() or 2) - 1))
+    # Each checker's deadline starts when its process does, so checkers
+    # waiting for a free worker aren't charged for the wait
+    never = float('inf')
+
+    # Results are harvested as each checker finishes, but slotted back into
+    # submission order so the report is deterministic.
+    results = [None] * len(checkers)
+    queued = iter(range(len(checkers)))
+    running = {}  # result connection -> (index, process, deadline)
+    try:
+        while True:
+            while len(running) < max_workers:
+                i = next(queued, None)
+                if i is None:
+                    break
+                recv_conn, send_conn = mp_context.Pipe(duplex=False)
+                process = mp_context.Process(
+                    target=_checker_worker,
+                    args=(checkers[i], project_root, config, send_conn),
+                    daemon=True
+                )
+                process.start()
+                send_conn.close()
+                running[recv_conn] = (i, process, time.monotonic() + timeout if timeout else never)
+            if not running:
+                break
+
+            next_deadline = min(deadline for _, _, deadline in running.values())
+            wait_for = None if next_deadline == never else max(0.0, next_deadline - time.monotonic())
+            for conn in wait(list(running), timeout=wait_for):
+                i, process, _ = running.pop(conn)
+                try:
+                    ok, payload = conn.recv()
+                except EOFError:
+                    process.join()
+                    ok, payload = False, (f'{checkers[i]} checker exited with code {process.exitcode}', '')
+                conn.close()
+                process.join()
+                if ok:
+                    results[i] = payload
+                else:
+                    _report_checker_error(payload[0], verbose, payload[1])
+
+            # Record the stragglers instead of aborting the review, and stop
+            # their processes so a hung checker can't block exit
+            now = time.monotonic()
+            for conn, (i, process, deadline) in list(running.items()):
+                if deadline <= now:
+                    del running[conn]
+                    print(f"[review-agent] WARNING: {checkers[i]} checker timed out after {timeout}s",
+                          file=sys.stderr)
+                    results[i] = _timed_out_result(checkers[i], timeout)
+                    process.terminate()
+                    process.join()
+                    conn.close()
+    finally:
+        for conn, (_, process, _) in running.items():
+            process.terminate()
+            process.join()
+            conn.close()
+
+    return results
 
 
 def aggregate_results(results: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -138,7 +455,6 @@ def aggregate_results(results: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     aggregated = {
         'categories': {},
-        'all_findings': [],
         'critical_count': 0,
         'warning_count': 0,
         'info_count': 0,
@@ -152,10 +468,11 @@ def aggregate_results(results: List[Dict[str, Any]]) -> Dict[str, Any]:
         category = result.get('category', 'unknown')
         findings = result.get('findings', [])
 
-        # Count by severity
-        critical = len([f for f in findings if f.get('severity') == 'critical'])
-        warning = len([f for f in findings if f.get('severity') == 'warning'])
-        info = len([f for f in findings if f.get('severity') == 'info'])
+        # Count by severity in a single pass
+        severity_counts = Counter(f.severity for f in findings)
+        critical = severity_counts['critical']
+        warning = severity_counts['warning']
+        info = severity_counts['info']
 
         aggregated['categories'][category] = {
             'status': result.get('status', 'unknown'),
@@ -166,16 +483,76 @@ def aggregate_results(results: List[Dict[str, Any]]) -> Dict[str, Any]:
             'metrics': result.get('metrics', {})
         }
 
-        aggregated['all_findings'].extend(findings)
         aggregated['critical_count'] += critical
         aggregated['warning_count'] += warning
         aggregated['info_count'] += info
-
-    aggregated['total_findings'] = len(aggregated['all_findings'])
+        aggregated['total_findings'] += len(findings)
 
     return aggregated
 
 
+def all_findings(report_data: Dict[str, Any]) -> List[Any]:
+    """
+    Materialize every finding in an aggregated report as a list.
+
+    Only needed where a list is required (e.g. the interactive fixer);
+    everything else should iterate the categories lazily.
+
+    Args:
+        report_data: Aggregated report data
+
+    Returns:
+        Flat list of findings in checker order
+    """
+    from review.utils.findings import iter_findings
+    return list(iter_findings(report_data))
+
+
+def _report_digest(report_data: Dict[str, Any], *context: Any) -> str:
+    """
+    Hash report data (plus any extra context) for change detection.
+
+    Lists are sorted before hashing so that set-iteration order inside the
+    checkers doesn't make identical findings look different.
+    """
+    import hashlib
+    import json
+
+    def canonical(value):
+        if isinstance(value, dict):
+            return {k: canonical(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            items = [canonical(v) for v in value]
+            return sorted(items, key=lambda v: json.dumps(v, sort_keys=True, default=str))
+        if hasattr(value, 'to_dict'):
+            return value.to_dict()
+        return value
+
+    payload = json.dumps([list(context), canonical(report_data)], sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _git_head() -> str:
+    """
+    Get the current commit and branch, as shown in the report header.
+
+    Returns:
+        'rev-parse' output for HEAD and its branch name, or '' outside git
+    """
+    import subprocess
+
+    try:
+        result = subprocess.run(
+            ['git', 'rev-parse', 'HEAD', '--abbrev-ref', 'HEAD'],
+            capture_output=True,
+            text=True,
+            timeout=5
+        )
+    except (OSError, subprocess.SubprocessError):
+        return ''
+    return result.stdout.strip() if result.returncode == 0 else ''
+
+
 def print_summary(report_data: Dict[str, Any], file=sys.stdout):
     """Print a brief summary of findings."""
     print("\n=== Codebase Review Summary ===", file=file)
@@ -188,120 +565,100 @@ def print_summary(report_data: Dict[str, Any], file=sys.stdout):
         print(f"\nDetailed report generated.", file=file)
 
 
-def update_executive_summary(project_root: str, focus: str, report_data: Dict[str, Any]):
-    """Update the executive summary with results from a focused review."""
-    from datetime import datetime, timezone
-
-    # Save all files to results directory
-    results_dir = Path(project_root) / '.claude' / 'review' / 'results'
-    results_dir.mkdir(parents=True, exist_ok=True)
-    summary_path = results_dir / 'codebase_review.md'
-    focus_display = focus.title()
-    focus_lower = focus.lower()
-
-    # Calculate health score
-    base_score = 100
-    critical_penalty = report_data['critical_count'] * 10
-    warning_penalty = report_data['warning_count'] * 3
-    info_penalty = report_data['info_count'] * 1
-    health_score = max(0, base_score - critical_penalty - warning_penalty - info_penalty)
-
-    # Determine status emoji
-    if report_data['critical_count'] > 0:
-        status = '🔴 CRITICAL'
-    elif report_data['warning_count'] > 0:
-        status = '⚠️ WARNING'
-    else:
-        status = '✅ PASS'
+def _render_summary_section(review: Dict[str, Any]) -> str:
+    """Render one review entry from the JSON summary as a markdown section."""
+    metrics = review.get('metrics', {})
+    category = review['category']
+    return f"""## {review['displayName']} Review
 
-    # Create section for this focus area
-    timestamp = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M UTC')
-    section = f"""
-## {focus_display} Review
-
-**Last Updated**: {timestamp}
-**Status**: {status}
-**Health Score**: {health_score}/100
+**Last Updated**: {review['lastUpdated']}
+**Status**: {review['statusDisplay']}
+**Health Score**: {review['healthScore']}/100
 
 | Metric | Count |
 |--------|-------|
-| Critical Issues | {report_data['critical_count']} |
-| Warnings | {report_data['warning_count']} |
-| Info | {report_data['info_count']} |
-| **Total Findings** | **{report_data['total_findings']}** |
+| Critical Issues | {metrics.get('critical', 0)} |
+| Warnings | {metrics.get('warnings', 0)} |
+| Info | {metrics.get('info', 0)} |
+| **Total Findings** | **{metrics.get('total', 0)}** |
 
-**Detailed Report**: [codebase_review_{focus_lower}.md](./codebase_review_{focus_lower}.md)
+**Detailed Report**: [codebase_review_{category}.md](./codebase_review_{category}.md)
 
 ---
 """
 
-    # Read or create executive summary
-    if summary_path.exists():
-        with open(summary_path, 'r') as f:
-            content = f.read()
-
-        # Check if section for this focus exists
-        section_marker = f"## {focus_display} Review"
-        if section_marker in content:
-            # Replace existing section
-            import re
-            # Match from section header to the next ## or end of file
-            pattern = rf'{re.escape(section_marker)}.*?(?=\n## |\Z)'
-            content = re.sub(pattern, section.strip(), content, flags=re.DOTALL)
-        else:
-            # Append new section before the final marker (if exists) or at end
-            if '---\n\n_Last updated:' in content:
-                content = content.replace('---\n\n_Last updated:', section + '\n---\n\n_Last updated:')
-            else:
-                content += '\n' + section
-    else:
-        # Create new executive summary
-        content = f"""# Codebase Review - Executive Summary
 
-This dashboard provides a high-level overview of all review findings. Each focus area maintains its own detailed report.
+def update_executive_summary(claude_dir: Path, summary_data: Dict[str, Any]) -> bool:
+    """
+    Regenerate the markdown executive summary from the JSON summary.
 
----
+    codebase_review.json (see export_json_summary) is the source of truth;
+    the markdown is rendered from its reviews in one go and only written
+    when the content actually changed.
+
+    Args:
+        claude_dir: The project's .claude directory
+        summary_data: Summary data returned by export_json_summary
 
-{section}
+    Returns:
+        True if the summary file was written, False if it was already current
+    """
+    summary_path = claude_dir / 'review' / 'results' / 'codebase_review_summary.md'
+
+    # Placeholder entries for enabled-but-unreviewed checkers stay JSON-only
+    sections = '\n'.join(
+        _render_summary_section(r) for r in summary_data.get('reviews', [])
+        if r.get('lastUpdated') != 'Not yet reviewed'
+    )
+    content = f"""# Codebase Review - Executive Summary
+
+This dashboard provides a high-level overview of all review findings. Each focus area maintains its own detailed report.
 
 ---
 
-_Last updated: {timestamp}_
+{sections}
+_Last updated: {summary_data.get('lastUpdated', 'unknown')}_
 """
+    encoded = content.encode('utf-8')
+
+    # Skip the write (and the mtime bump watchers react to) if nothing changed
+    try:
+        if summary_path.read_bytes() == encoded:
+            return False
+    except OSError:
+        pass
 
-    # Write updated summary
-    with open(summary_path, 'w') as f:
-        f.write(content)
+    _write_atomic(summary_path, encoded)
+    return True
 
 
-def export_json_summary(project_root: str, focus: str = None, report_data: Dict[str, Any] = None):
+def export_json_summary(claude_dir: Path, focus: str = None, report_data: Dict[str, Any] = None) -> Dict[str, Any]:
     """
     Export executive summary as JSON for frontend consumption.
 
     This function is ADDITIVE - it only updates the sections that were just reviewed,
     keeping other sections intact. Each section maintains its own timestamp.
+
+    Args:
+        claude_dir: The project's .claude directory
+        focus: Focus area that was reviewed
+        report_data: Aggregated report data from checkers
+
+    Returns:
+        The summary data, as written or as already on disk
     """
     from datetime import datetime, timezone
-    import re
-    import json
 
     # Save JSON to results directory
-    results_dir = Path(project_root) / '.claude' / 'review' / 'results'
+    results_dir = claude_dir / 'review' / 'results'
     results_dir.mkdir(parents=True, exist_ok=True)
-    summary_path = results_dir / 'codebase_review.md'
     json_path = results_dir / 'codebase_review.json'
 
-    if not summary_path.exists():
-        return
-
     # Load existing JSON data if it exists
-    existing_data = {}
-    if json_path.exists():
-        try:
-            with open(json_path, 'r') as f:
-                existing_data = json.load(f)
-        except (json.JSONDecodeError, IOError):
-            existing_data = {}
+    try:
+        existing_data = _load_json_cached(json_path)
+    except (ValueError, OSError):
+        existing_data = {}
 
     # Get existing reviews as a dictionary for easy updates
     existing_reviews = {r['category']: r for r in existing_data.get('reviews', [])}
@@ -343,9 +700,16 @@ def export_json_summary(project_root: str, focus: str = None, report_data: Dict[
                 status_display = '✅ PASS'
 
             # Build review entry with findings
-            existing_reviews[normalized_key] = {
+            display_name = normalized_key.title() if normalized_key != 'docs' else 'Docs'
+            findings = []
+            for finding in category_data.get('findings', []):
+                finding = finding.to_dict()
+                finding['category'] = normalized_key
+                finding['categoryDisplay'] = display_name
+                findings.append(finding)
+            review = {
                 'category': normalized_key,
-                'displayName': normalized_key.title() if normalized_key != 'docs' else 'Docs',
+                'displayName': display_name,
                 'lastUpdated': timestamp,
                 'status': status,
                 'statusDisplay': status_display,
@@ -356,65 +720,75 @@ def export_json_summary(project_root: str, focus: str = None, report_data: Dict[
                     'info': category_data.get('info', 0),
                     'total': critical_count + warning_count + category_data.get('info', 0)
                 },
-                'findings': category_data.get('findings', [])
+                'findings': findings
             }
 
-    # Clean up legacy 'documentation' category in favor of 'docs'
+            # Keep the previous entry (and its timestamp) if only the clock or
+            # the checker's finding order moved
+            previous = existing_reviews.get(normalized_key)
+            if (previous is None
+                    or _report_digest({**previous, 'lastUpdated': timestamp}) != _report_digest(review)):
+                existing_reviews[normalized_key] = review
+
+    # Clean up legacy 'documentation' category in favor of 'docs'. Findings
+    # are nested in their review, so this drops the legacy findings too.
     if 'docs' in existing_reviews and 'documentation' in existing_reviews:
         del existing_reviews['documentation']
-        if 'documentation' in existing_findings:
-            del existing_findings['documentation']
 
     # Ensure all enabled checkers are included, even if not reviewed yet
-    config_path = Path(project_root) / '.claude' / 'review' / 'config' / 'review-config.json'
-    if config_path.exists():
-        try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
-            enabled_checkers = config.get('enabled_checkers', [])
-
-            # Map checker names to display names
-            checker_display_names = {
-                'documentation': 'Docs',
-                'docs': 'Docs',
-                'architecture': 'Architecture',
-                'security': 'Security',
-                'quality': 'Quality',
-                'dependencies': 'Dependencies',
-                'testing': 'Testing'
-            }
+    config_path = claude_dir / 'review' / 'config' / 'review-config.json'
+    try:
+        config = _load_json_cached(config_path)
+    except FileNotFoundError:
+        pass
+    except (ValueError, OSError) as e:
+        print(f"[review-agent] Warning: Could not load config to check enabled checkers: {e}")
+    else:
+        enabled_checkers = config.get('enabled_checkers', [])
+
+        # Map checker names to display names
+        checker_display_names = {
+            'documentation': 'Docs',
+            'docs': 'Docs',
+            'architecture': 'Architecture',
+            'security': 'Security',
+            'quality': 'Quality',
+            'dependencies': 'Dependencies',
+            'testing': 'Testing'
+        }
 
-            # Add default entries for any missing enabled checkers
-            added_count = 0
-            for checker in enabled_checkers:
-                checker_key = 'docs' if checker == 'documentation' else checker
-                if checker_key not in existing_reviews:
-                    # Create default "passing" entry for this checker
-                    existing_reviews[checker_key] = {
-                        'category': checker_key,
-                        'displayName': checker_display_names.get(checker_key, checker_key.title()),
-                        'lastUpdated': 'Not yet reviewed',
-                        'status': 'pass',
-                        'statusDisplay': '✅ PASS',
-                        'healthScore': 100,
-                        'metrics': {
-                            'critical': 0,
-                            'warnings': 0,
-                            'info': 0,
-                            'total': 0
-                        },
-                        'findings': []
-                    }
-                    added_count += 1
-
-            if added_count > 0:
-                print(f"[review-agent] Added {added_count} default entries for enabled checkers not yet reviewed")
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"[review-agent] Warning: Could not load config to check enabled checkers: {e}")
-
-    # Convert back to lists and build flat findings list
+        # Add default entries for any missing enabled checkers
+        added_count = 0
+        for checker in enabled_checkers:
+            checker_key = 'docs' if checker == 'documentation' else checker
+            if checker_key not in existing_reviews:
+                # Create default "passing" entry for this checker
+                existing_reviews[checker_key] = {
+                    'category': checker_key,
+                    'displayName': checker_display_names.get(checker_key, checker_key.title()),
+                    'lastUpdated': 'Not yet reviewed',
+                    'status': 'pass',
+                    'statusDisplay': '✅ PASS',
+                    'healthScore': 100,
+                    'metrics': {
+                        'critical': 0,
+                        'warnings': 0,
+                        'info': 0,
+                        'total': 0
+                    },
+                    'findings': []
+                }
+                added_count += 1
+
+        if added_count > 0:
+            print(f"[review-agent] Added {added_count} default entries for enabled checkers not yet reviewed")
+
+    # Convert back to lists and build flat findings list, accumulating the
+    # overall metrics in the same pass
     all_reviews = []
     all_findings = []  # Keep flat list for backward compatibility
+    totals = Counter()
+    health_sum = 0
 
     for category_key, review in existing_reviews.items():
         # Ensure findings array exists (might not exist for old entries)
@@ -422,6 +796,8 @@ def export_json_summary(project_root: str, focus: str = None, report_data: Dict[
             review['findings'] = []
 
         all_reviews.append(review)
+        totals.update(review['metrics'])
+        health_sum += review['healthScore']
         # Also keep flat list for backward compatibility
         # Ensure each finding has correct category and categoryDisplay for frontend filtering
         for finding in review['findings']:
@@ -430,19 +806,12 @@ def export_json_summary(project_root: str, focus: str = None, report_data: Dict[
             finding['categoryDisplay'] = review['displayName']
             all_findings.append(finding)
 
-    # Calculate overall metrics from all reviews
-    if all_reviews:
-        overall_health = sum(r['healthScore'] for r in all_reviews) // len(all_reviews)
-        overall_critical = sum(r['metrics']['critical'] for r in all_reviews)
-        overall_warnings = sum(r['metrics']['warnings'] for r in all_reviews)
-        overall_info = sum(r['metrics']['info'] for r in all_reviews)
-        overall_total = sum(r['metrics']['total'] for r in all_reviews)
-    else:
-        overall_health = 0
-        overall_critical = 0
-        overall_warnings = 0
-        overall_info = 0
-        overall_total = 0
+    # Overall metrics from all reviews
+    overall_health = health_sum // max(1, len(all_reviews))
+    overall_critical = totals['critical']
+    overall_warnings = totals['warnings']
+    overall_info = totals['info']
+    overall_total = totals['total']
 
     # Determine overall status
     if overall_critical > 0:
@@ -458,7 +827,7 @@ def export_json_summary(project_root: str, focus: str = None, report_data: Dict[
     # Build JSON structure (preserving existing reviews and only updating what changed)
     # Each review now includes its findings nested within it
     json_data = {
-        'lastUpdated': datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M UTC'),
+        'lastUpdated': existing_data.get('lastUpdated'),
         'overallStatus': overall_status,
         'overallStatusDisplay': overall_status_display,
         'overallHealthScore': overall_health,
@@ -472,210 +841,51 @@ def export_json_summary(project_root: str, focus: str = None, report_data: Dict[
         'findings': all_findings  # Keep for backward compatibility
     }
 
-    # Write JSON file
-    with open(json_path, 'w') as f:
-        json.dump(json_data, f, indent=2)
-
+    # Leave the file (and the mtime watchers react to) alone if it already
+    # holds this summary under its previous timestamp
+    try:
+        if json_path.read_bytes() == _dump_json_bytes(json_data):
+            return json_data
+    except OSError:
+        pass
 
-def _parse_findings_from_markdown(content: str, category: str, category_display: str) -> List[Dict[str, Any]]:
-    """Parse individual findings from detailed markdown report."""
-    import re
+    # Write JSON file, keeping the parsed form so a later export in this
+    # process doesn't have to read it back
+    json_data['lastUpdated'] = timestamp
+    _write_atomic(json_path, _dump_json_bytes(json_data))
+    st = os.stat(json_path)
+    _JSON_CACHE[str(json_path)] = ((st.st_mtime_ns, st.st_size), json_data)
 
-    findings = []
+    return json_data
 
-    # Pattern to match finding sections
-    # Matches: #### Issue Title\n**Location**: `file:line`\nDescription\n**Recommendation**: recommendation
-    finding_pattern = r'####\s+(.+?)\n\n(?:\*\*Location\*\*:\s*`(.+?)`\n\n)?(.+?)(?:\n\n\*\*Recommendation\*\*:\s*(.+?))?(?=\n\n####|\n\n###|\Z)'
 
-    # Find severity sections
-    severity_sections = {
-        'critical': re.search(r'### (?:⚠️|🔴) (?:Critical Issues?|CRITICAL)(.*?)(?=\n### |\Z)', content, re.DOTALL),
-        'warning': re.search(r'### (?:⚠️|WARNING) Warnings?(.*?)(?=\n### |\Z)', content, re.DOTALL),
-        'info': re.search(r'### (?:ℹ️|INFO) Information(.*?)(?=\n### |\Z)', content, re.DOTALL)
-    }
+def _help_text(name: str) -> str:
+    """Read a block of --help text stored next to this script."""
+    return (Path(__file__).parent / f'review-agent-{name}.txt').read_text(encoding='utf-8')
 
-    for severity, section_match in severity_sections.items():
-        if section_match:
-            section_content = section_match.group(1)
-            matches = re.finditer(finding_pattern, section_content, re.DOTALL)
-
-            for match in matches:
-                issue = match.group(1).strip()
-                location = match.group(2).strip() if match.group(2) else ''
-                description = match.group(3).strip()
-                recommendation = match.group(4).strip() if match.group(4) else ''
-
-                # Parse file and line from location
-                file_path = ''
-                line_number = None
-                if location and ':' in location:
-                    parts = location.rsplit(':', 1)
-                    file_path = parts[0]
-                    try:
-                        line_number = int(parts[1])
-                    except (ValueError, IndexError):
-                        file_path = location
-                elif location:
-                    file_path = location
-
-                findings.append({
-                    'category': category,
-                    'categoryDisplay': category_display,
-                    'severity': severity,
-                    'issue': issue,
-                    'file': file_path,
-                    'line': line_number,
-                    'description': description,
-                    'recommendation': recommendation
-                })
-
-    return findings
 
+def build_arg_parser():
+    """Build the command-line argument parser."""
+    import argparse
 
-def main():
-    """Main entry point for review agent."""
+    # The long description and epilog are only needed for --help, so they live
+    # in text files instead of being compiled on every hook invocation.
+    wants_help = any(arg in ('-h', '--help') for arg in sys.argv[1:])
     parser = argparse.ArgumentParser(
-        description='''
-╔══════════════════════════════════════════════════════════════════════════════╗
-║                        ZuZu Codebase Review Agent                            ║
-╚══════════════════════════════════════════════════════════════════════════════╝
-
-Automatically verifies that documentation matches actual code implementation.
-Runs via Claude Code Stop hook or manually via command line.
-
-WHAT IT CHECKS:
-  Documentation Sync:
-    • .claude/CLAUDE.md - Architecture documentation accuracy
-    • .claude/AUTH_IMPLEMENTATION.md - Auth system documentation
-    • README.md - Tech stack and scripts documentation
-    • src/pages/Home.tsx - Displayed tech stack matches dependencies
-    • src/pages/About.tsx - Mentioned technologies are installed
-
-  Security (when enabled):
-    • Hardcoded secrets and credentials
-    • JWT configuration security
-    • Cookie security settings
-    • CORS configuration
-
-  Code Quality (when enabled):
-    • Cyclomatic complexity
-    • Error handling patterns
-    • Logging practices
-    • Code consistency
-
-  Architecture (when enabled):
-    • Design pattern adherence
-    • Circular dependencies
-    • Configuration consistency
-    • Orphaned files
-
-  Dependencies (when enabled):
-    • Unused dependencies
-    • Version consistency
-    • License analysis
-
-  Testing (when enabled):
-    • Test coverage estimation
-    • Critical untested modules
-
-SEVERITY LEVELS:
-  🔴 CRITICAL - Must fix (blocks successful exit code)
-  ⚠️  WARNING  - Should fix (documentation drift, missing info)
-  ℹ️  INFO     - Nice to have (suggestions for improvement)
-
-OUTPUT:
-  Generates a markdown report at .claude/CODEBASE_REVIEW.md with:
-    • Executive summary with health score
-    • Findings organized by category and severity
-    • Specific file locations and line numbers
-    • Actionable recommendations
-''',
+        description=_help_text('description') if wants_help else None,
         formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog='''
-BASIC USAGE:
-  %(prog)s                           # Run full review (auto-triggers on changes)
-  %(prog)s --focus docs              # Documentation sync only
-  %(prog)s --verbose                 # Show detailed progress
-
-FIXING FINDINGS:
-  %(prog)s --fix                     # Interactive mode - prompts for each fix
-  %(prog)s --auto-fix                # Automatic mode - fixes critical/warning only
-  %(prog)s --auto-fix --fix-all      # Fix everything including info-level
-
-OUTPUT CONTROL:
-  %(prog)s --silent                  # Only output when issues found
-  %(prog)s --output /tmp/review.md   # Custom output location
-
-FOCUS AREAS:
-  --focus docs           Documentation sync verification
-  --focus security       Security scanning
-  --focus quality        Code quality analysis
-  --focus architecture   Architecture validation
-  --focus dependencies   Dependency analysis
-  --focus testing        Test coverage assessment
-  --focus all            Everything (default)
-
-COMMON WORKFLOWS:
-
-  1. Quick doc check before committing:
-     %(prog)s --focus docs --silent
-
-  2. Fix all documentation issues automatically:
-     %(prog)s --focus docs --auto-fix --fix-all
-
-  3. Full review with interactive fixes:
-     %(prog)s --fix
-
-  4. Security audit only:
-     %(prog)s --focus security --verbose
-
-  5. Check specific finding types:
-     %(prog)s --focus docs --fix          # Fix only warnings/critical
-     %(prog)s --focus docs --fix --fix-all # Fix warnings/critical/info
-
-TRIGGERING:
-  Automatic:
-    • Runs on Claude Code Stop hook (if configured)
-    • Smart detection: runs when 5+ files changed in last 10 commits
-
-  Manual:
-    • Run directly: python3 .claude/hooks/review-agent.py
-    • Set env var: export CLAUDE_REVIEW=true
-    • Touch trigger: touch /tmp/.claude-review-trigger
-
-CONFIGURATION:
-  Edit .claude/review/config/review-config.json to customize:
-    • Enabled checkers
-    • Severity thresholds
-    • Exclusion patterns
-    • Smart trigger settings
-
-EXIT CODES:
-  0 - Success (no critical issues)
-  1 - Critical issues found
-
-REPORTS:
-  View the generated report at:
-    .claude/CODEBASE_REVIEW.md
-
-  Contains:
-    • Overall health score (0-100)
-    • Findings by severity and category
-    • File locations with line numbers
-    • Specific recommendations
-    • Metrics and statistics
-'''
+        epilog=_help_text('epilog') if wants_help else None
     )
 
     parser.add_argument(
         '--output',
-        default='.claude/CODEBASE_REVIEW.md',
+        default=DEFAULT_OUTPUT,
         help='Output path for markdown report (default: .claude/review/results/CODEBASE_REVIEW.md)'
     )
 
     parser.add_argument(
         '--config',
-        default='.claude/review/config/review-config.json',
+        default=DEFAULT_CONFIG,
         help='Path to configuration file (default: .claude/review/config/review-config.json)'
     )
 
@@ -722,7 +932,27 @@ REPORTS:
         help='Fix all severity levels including info (default: only critical and warning)'
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+def main():
+    """Main entry point for review agent."""
+    # The Stop hook invokes us with no arguments; skip building the parser
+    # for that path and use the defaults directly
+    if len(sys.argv) == 1:
+        args = SimpleNamespace(
+            output=DEFAULT_OUTPUT,
+            config=DEFAULT_CONFIG,
+            focus='all',
+            verbose=False,
+            silent=False,
+            no_git=False,
+            fix=False,
+            auto_fix=False,
+            fix_all=False
+        )
+    else:
+        args = build_arg_parser().parse_args()
 
     # Check if review should run (unless --no-smart-trigger or focus specified)
     if args.focus == 'all' and not should_run_review():
@@ -743,76 +973,72 @@ REPORTS:
     if args.verbose:
         print(f"[review-agent] Initialized {len(checkers)} checker(s)", file=sys.stderr)
 
-    # Run checks in parallel
-    results = []
-    with ThreadPoolExecutor(max_workers=len(checkers)) as executor:
-        futures = [executor.submit(checker.run) for checker in checkers]
-        for future in futures:
-            try:
-                result = future.result()
-                results.append(result)
-            except Exception as e:
-                print(f"[review-agent] ERROR: Checker failed: {e}", file=sys.stderr)
-                if args.verbose:
-                    import traceback
-                    traceback.print_exc(file=sys.stderr)
+    # Run checks
+    results = run_checkers(checkers, config, args.verbose)
 
     # Aggregate results
     report_data = aggregate_results(results)
 
-    # Generate report
-    generator = MarkdownReportGenerator(config, not args.no_git)
-    report = generator.generate(report_data)
-
     # Determine output path based on focus
     # Always save to results directory
-    results_dir = Path(config['project_root']) / '.claude' / 'review' / 'results'
+    claude_dir = Path(config['project_root']) / '.claude'
+    results_dir = claude_dir / 'review' / 'results'
     results_dir.mkdir(parents=True, exist_ok=True)
 
-    if args.output == '.claude/CODEBASE_REVIEW.md':  # Using default output
+    if args.output == DEFAULT_OUTPUT:  # Using default output
         if args.focus != 'all':
             # Use focus-specific filename in results directory (lowercase)
             focus_name = args.focus.lower()
             output_path = results_dir / f'codebase_review_{focus_name}.md'
         else:
-            # Use default for 'all' focus
             output_path = results_dir / 'codebase_review.md'
     else:
         # User specified custom output path
         output_path = Path(config['project_root']) / args.output
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Skip rewriting the per-focus report when the findings (and the commit
+    # its header names) are identical to the previous run for this focus, so
+    # watchers of the report aren't woken for nothing
+    git_head = '' if args.no_git else _git_head()
+    digest = _report_digest(report_data, str(output_path), args.focus, args.no_git, git_head)
+    digest_path = CACHE_DIR / f'report-{args.focus}.hash'
+    try:
+        unchanged = digest_path.read_text() == digest and output_path.exists()
+    except OSError:
+        unchanged = False
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-
-    with open(output_path, 'w') as f:
-        f.write(report)
-
-    if args.verbose:
-        print(f"[review-agent] Report written to: {output_path}", file=sys.stderr)
-
-    # Update executive summary and export JSON
-    if args.focus != 'all':
-        # For focused reviews, update the executive summary section
-        update_executive_summary(config['project_root'], args.focus, report_data)
+    if unchanged:
         if args.verbose:
-            print(f"[review-agent] Executive summary updated for {args.focus}", file=sys.stderr)
+            print("[review-agent] Findings unchanged since last run; report left as-is", file=sys.stderr)
     else:
-        # For full reviews, update executive summary for all reviewed categories
-        for category, data in report_data['categories'].items():
-            category_report = {
-                'critical_count': data.get('critical', 0),
-                'warning_count': data.get('warning', 0),
-                'info_count': data.get('info', 0),
-                'total_findings': len(data.get('findings', []))
-            }
-            update_executive_summary(config['project_root'], category, category_report)
+        # Generate report, streaming sections to a temp file rather than
+        # building the report in memory, then swap it into place atomically
+        from review.utils.markdown_gen import MarkdownReportGenerator
+        generator = MarkdownReportGenerator(config, not args.no_git)
+        tmp_output = _tmp_path(output_path)
+        with open(tmp_output, 'w', encoding='utf-8', buffering=1 << 16) as f:
+            generator.generate_to(f, report_data)
+        os.replace(tmp_output, output_path)
+
         if args.verbose:
-            print(f"[review-agent] Executive summary updated for all categories", file=sys.stderr)
+            print(f"[review-agent] Report written to: {output_path}", file=sys.stderr)
 
-    # Always export JSON summary (for all reviews and focused reviews)
-    export_json_summary(config['project_root'], args.focus, report_data)
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            digest_path.write_text(digest)
+        except OSError:
+            pass
+
+    # The JSON and executive summaries are shared by every focus, so always
+    # merge this run's categories in rather than trusting the per-focus hash
+    summary_data = export_json_summary(claude_dir, args.focus, report_data)
     if args.verbose:
         print(f"[review-agent] JSON summary exported", file=sys.stderr)
 
+    if update_executive_summary(claude_dir, summary_data) and args.verbose:
+        print(f"[review-agent] Executive summary updated", file=sys.stderr)
+
     # Print summary (unless silent mode with no findings)
     if not (args.silent and report_data['total_findings'] == 0):
         print_summary(report_data, file=sys.stderr)
@@ -826,7 +1052,7 @@ REPORTS:
 
         from review.utils.fixer import InteractiveFixer
         fixer = InteractiveFixer(config['project_root'], auto_mode=args.auto_fix, fix_all=args.fix_all)
-        fixed_count = fixer.fix_findings(report_data['all_findings'])
+        fixed_count = fixer.fix_findings(all_findings(report_data))
         print(f"[review-agent] Fixed {fixed_count} finding(s)", file=sys.stderr)
 
     # Exit with appropriate code
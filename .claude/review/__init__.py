@@ -0,0 +1 @@
+# Codebase review package
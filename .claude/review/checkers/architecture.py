@@ -10,19 +10,82 @@ Based on Winston (software-architect agent) principles:
 - Architecture pattern consistency
 """
 
+import os
 import re
-import json
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 import fnmatch
 
+from ..utils.findings import Finding
+from ..utils.gitignore import ignore_matcher, ignore_patterns, read_gitignore
+from ..utils.package_json import load_package_json
+
+
+CODE_EXTENSIONS = ('.ts', '.tsx', '.js', '.jsx')
+
+# The only manifest dependencies the technology check looks at
+TRACKED_DEPS = frozenset({
+    'react', 'redux', '@reduxjs/toolkit', '@tanstack/react-query', 'react-router-dom',
+    '@mui/material', 'tailwindcss', 'express', 'log4js',
+})
+
+# Documentation files looked for anywhere in the project
+API_DOC_NAMES = frozenset({'api.md', 'API.md'})
+ARCHITECTURE_DOC_NAMES = frozenset({'ARCHITECTURE.md', 'architecture.md'})
+
+# Stop caching file contents once this many characters are held
+FILE_CACHE_BUDGET = 32 * 1024 * 1024
+
+# Threads used to read source files ahead of the checks
+PREFETCH_WORKERS = 8
+
+# Hardcoded secret assignments, one named group per kind. Matches never span
+# a line, so each hit maps to a single source line.
+SECRET_RE = re.compile(
+    r'(?P<password>password[^\S\n]*=[^\S\n]*["\'][^"\'\n]{3,}["\'])'
+    r'|(?P<api_key>api[_-]?key[^\S\n]*=[^\S\n]*["\'][^"\'\n]{10,}["\'])'
+    r'|(?P<secret>secret[^\S\n]*=[^\S\n]*["\'][^"\'\n]{10,}["\'])',
+    re.IGNORECASE
+)
+SECRET_ISSUES = {
+    'password': 'Hardcoded password',
+    'api_key': 'Hardcoded API key',
+    'secret': 'Hardcoded secret',
+}
+
+# Express-style route registrations. HTTP_METHOD_RE counts endpoints across
+# the whole file; ROUTE_LINE_RE finds handlers one line at a time.
+HTTP_METHOD_RE = re.compile(r'\.(get|post|put|patch|delete)\s*\(', re.IGNORECASE)
+ROUTE_LINE_RE = re.compile(r'\.(?:get|post|put|patch|delete)[^\S\n]*\(')
+API_VERSION_RE = re.compile(r'/api/v\d+/')
+
+# Express global error-handling middleware
+ERROR_HANDLER_RE = re.compile(r'app\.use\s*\(\s*(?:\(err,\s*req,\s*res,\s*next\)|errorHandler)')
+
+# Case-insensitive probes, so file contents never need lowercasing
+JWT_RE = re.compile(r'jwt', re.IGNORECASE)
+POOL_RE = re.compile(r'pool', re.IGNORECASE)  # Also covers createPool
+
+# Libraries the scalability and security checks look for in code files
+TECH_RE = re.compile(
+    r'(?P<caching>(?i:redis|memcached))'
+    r'|(?P<query_caching>@tanstack/react-query|useQuery)'
+    r'|(?P<validation>joi|yup|zod|express-validator)'
+)
+
 
 class ArchitectureChecker:
     def __init__(self, project_root, config):
         self.project_root = Path(project_root)
         self.config = config
         self.findings = []
-        self.gitignore_patterns = self._load_gitignore()
+        self._file_cache: Dict[Path, str] = {}
+        self._file_cache_size = 0
+        self._code_scan = None
+        gitignore_lines = read_gitignore(self.project_root)
+        self.gitignore_patterns = ignore_patterns(gitignore_lines)
+        self._ignore_matcher = ignore_matcher(gitignore_lines)
         self.metrics = {
             'files_analyzed': 0,
             'architecture_patterns_found': set(),
@@ -31,57 +94,238 @@ class ArchitectureChecker:
             'config_files': 0
         }
 
-    def _load_gitignore(self) -> List[str]:
-        """Load and parse .gitignore patterns."""
-        patterns = []
-        gitignore_path = self.project_root / '.gitignore'
-
-        if gitignore_path.exists():
-            with open(gitignore_path, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#'):
-                        if line.startswith('/'):
-                            line = line[1:]
-                        patterns.append(line)
-
-        # Always ignore common build/dependency directories
-        patterns.extend([
-            'node_modules', 'dist', 'build', '.git',
-            '__pycache__', '*.pyc', '.cache', 'coverage'
-        ])
+    def _is_ignored(self, rel_str: str, is_dir: bool = False) -> bool:
+        """Check a '/'-separated path relative to the project root."""
+        return self._ignore_matcher.matches(rel_str, is_dir)
+
+    def _read(self, path: Path) -> str:
+        """
+        Read a source file, caching its contents for the other checks.
+
+        Several checks scan overlapping file sets, so each file is read and
+        decoded at most once per run (within FILE_CACHE_BUDGET). Read and
+        decode errors propagate to the caller, as with a plain open().
+        """
+        content = self._file_cache.get(path)
+        if content is None:
+            with open(path, 'r', encoding='utf-8') as f:
+                content = f.read()
+            if self._file_cache_size + len(content) <= FILE_CACHE_BUDGET:
+                self._file_cache[path] = content
+                self._file_cache_size += len(content)
+        return content
+
+    @staticmethod
+    def _read_or_none(path: Path) -> Tuple[Path, Optional[str]]:
+        """Read a file for prefetching; failures are left for _read() to raise."""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return path, f.read()
+        except Exception:
+            return path, None
+
+    def _prefetch(self, paths: Iterable[Path]):
+        """
+        Read the files the checks are about to scan on a thread pool.
+
+        The checks themselves run in order (later checks depend on metrics
+        from earlier ones), but their file reads are I/O bound and release
+        the GIL, so they are overlapped up front and served from the cache.
+        """
+        pending = [path for path in dict.fromkeys(paths) if path not in self._file_cache]
+        if len(pending) < 2:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(PREFETCH_WORKERS, len(pending))) as executor:
+            for path, content in executor.map(self._read_or_none, pending):
+                if content is not None and self._file_cache_size + len(content) <= FILE_CACHE_BUDGET:
+                    self._file_cache[path] = content
+                    self._file_cache_size += len(content)
+
+    def _scan_code_files(self) -> Dict[str, Any]:
+        """
+        Scan the first 50 code files once for everything the per-file checks
+        look for, so each file is searched in a single pass.
+
+        Returns:
+            Dict with the hardcoded-secret findings and the caching,
+            query-caching and input-validation flags
+        """
+        if self._code_scan is not None:
+            return self._code_scan
+
+        scan = {'secrets': [], 'caching': False, 'query_caching': False, 'validation': False}
+        for index, code_file in enumerate(self._code_files[:50]):  # Limit to avoid performance issues
+            try:
+                content = self._read(code_file)
+            except Exception:
+                continue
+            # Validation libraries are only looked for in the first 30 files
+            self._scan_code_file(code_file, content, scan, index < 30)
+
+        self._code_scan = scan
+        return scan
+
+    def _scan_code_file(self, code_file: Path, content: str, scan: Dict[str, Any],
+                        check_validation: bool):
+        """Record one code file's secret and library hits into scan."""
+        reported = set()
+        for match in SECRET_RE.finditer(content):
+            start = match.start()
+            line_start = content.rfind('\n', 0, start) + 1
+            line_end = content.find('\n', match.end())
+            line = content[line_start:line_end if line_end != -1 else len(content)]
+
+            # Skip if it's using process.env
+            if 'process.env' in line or 'import.meta.env' in line:
+                continue
+
+            line_no = content.count('\n', 0, start) + 1
+            if (line_no, match.lastgroup) in reported:
+                continue
+            reported.add((line_no, match.lastgroup))
+
+            scan['secrets'].append(Finding(
+                severity='critical',
+                issue=SECRET_ISSUES[match.lastgroup],
+                file=str(code_file.relative_to(self.project_root)),
+                line=line_no,
+                description='Secrets should be stored in environment variables, not hardcoded',
+                recommendation='Move to environment variable and access via process.env.VARIABLE_NAME',
+                category='Configuration Management',
+                code_snippet=line.strip()[:100]
+            ))
+
+        # Stop searching for libraries once every flag has been seen
+        wanted = {'caching', 'query_caching'}
+        if check_validation:
+            wanted.add('validation')
+        wanted = {flag for flag in wanted if not scan[flag]}
+        if not wanted:
+            return
+
+        for match in TECH_RE.finditer(content):
+            if match.lastgroup in wanted:
+                scan[match.lastgroup] = True
+                wanted.discard(match.lastgroup)
+                if not wanted:
+                    break
 
-        return patterns
+    @staticmethod
+    def _child_names(path: Path) -> set:
+        """Names of the entries in a directory (empty if it can't be listed)."""
+        try:
+            with os.scandir(path) as it:
+                return {entry.name for entry in it}
+        except OSError:
+            return set()
+
+    def _walk(self, rel_dir: str = '') -> Iterator[str]:
+        """
+        Yield the relative paths of files under rel_dir (default: the root).
+
+        Ignored directories are pruned rather than descended into. Files in a
+        directory are yielded before its subdirectories are walked, matching
+        the order pathlib's '**' globs produce.
+        """
+        if rel_dir and self._is_ignored(rel_dir, is_dir=True):
+            return
 
-    def _should_ignore_path(self, file_path: Path) -> bool:
-        """Check if file path matches any gitignore pattern."""
         try:
-            rel_path = file_path.relative_to(self.project_root)
-            path_str = str(rel_path)
-
-            for pattern in self.gitignore_patterns:
-                if pattern.endswith('/'):
-                    if path_str.startswith(pattern.rstrip('/')):
-                        return True
-                elif '*' in pattern:
-                    if fnmatch.fnmatch(path_str, pattern):
-                        return True
-                    for part in rel_path.parts:
-                        if fnmatch.fnmatch(part, pattern):
-                            return True
-                else:
-                    if path_str.startswith(pattern + '/') or path_str == pattern:
-                        return True
-                    if pattern in rel_path.parts:
-                        return True
-
-            return False
-        except ValueError:
-            return True
+            with os.scandir(self.project_root / rel_dir) as it:
+                entries = list(it)
+        except OSError:
+            return
+
+        subdirs = []
+        for entry in entries:
+            rel = f'{rel_dir}/{entry.name}' if rel_dir else entry.name
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(rel)
+            elif entry.is_file():
+                yield rel
+
+        for rel in subdirs:
+            yield from self._walk(rel)
+
+    def _collect_files(self):
+        """
+        Walk the project once and bucket the files every check consumes.
+        """
+        code_by_ext = {('src', ext): [] for ext in CODE_EXTENSIONS}
+        code_by_ext.update({('server', ext): [] for ext in CODE_EXTENSIONS})
+        self._route_files = []
+        self._auth_files = []
+        self._server_code_dirs = set()
+        self._doc_files: Dict[str, List[Path]] = {'api': [], 'architecture': []}
+        route_js = []
+
+        for rel in self._walk():
+            if self._is_ignored(rel):
+                continue
+
+            top, _, rest = rel.partition('/')
+            name = rel.rsplit('/', 1)[-1]
+
+            if name in API_DOC_NAMES or (
+                name.endswith('.json') and ('swagger' in name[:-5] or 'openapi' in name[:-5])
+            ):
+                self._doc_files['api'].append(self.project_root / rel)
+            elif name in ARCHITECTURE_DOC_NAMES:
+                self._doc_files['architecture'].append(self.project_root / rel)
+
+            if not rest or top not in ('src', 'server'):
+                continue
+            path = self.project_root / rel
+
+            ext = os.path.splitext(name)[1]
+            if ext in CODE_EXTENSIONS:
+                code_by_ext[(top, ext)].append(path)
+
+            if top == 'src':
+                if fnmatch.fnmatch(name, 'auth*.ts*'):
+                    self._auth_files.append(path)
+                continue
+
+            dirs = rest.split('/')[:-1]
+            if dirs and ext in ('.ts', '.js'):
+                self._server_code_dirs.add(dirs[-1])
+            if 'routes' in dirs:
+                if ext == '.ts':
+                    self._route_files.append(path)
+                elif ext == '.js':
+                    route_js.append(path)
+            if ext == '.ts' and (name.startswith('auth') or 'middleware' in dirs):
+                self._auth_files.append(path)
+
+        self._route_files.extend(route_js)
+
+        # Same order the per-extension src/server globs used to produce, so
+        # the capped scans below look at the same files
+        self._code_files = [
+            path
+            for ext in CODE_EXTENSIONS
+            for top in ('src', 'server')
+            for path in code_by_ext[(top, ext)]
+        ]
+        self._server_ts = code_by_ext[('server', '.ts')]
+
+        # Entry point inspected by several checks, resolved once
+        server_dir = self.project_root / 'server'
+        self._server_index = next(
+            (path for path in (server_dir / 'index.ts', server_dir / 'index.js') if path.is_file()),
+            None
+        )
+
+        self._prefetch([
+            *self._route_files, *self._code_files[:50], *self._server_ts[:20],
+            *self._auth_files, *([self._server_index] if self._server_index else [])
+        ])
 
     def run(self):
         """Run all architecture checks."""
         try:
+            self._collect_files()
             self._check_architecture_patterns()
             self._check_technology_coherence()
             self._check_api_design()
@@ -98,9 +342,9 @@ class ArchitectureChecker:
 
             # Determine overall status
             status = 'pass'
-            if any(f['severity'] == 'critical' for f in self.findings):
+            if any(f.severity == 'critical' for f in self.findings):
                 status = 'critical'
-            elif any(f['severity'] == 'warning' for f in self.findings):
+            elif any(f.severity == 'warning' for f in self.findings):
                 status = 'warning'
 
             return {
@@ -113,57 +357,58 @@ class ArchitectureChecker:
             return {
                 'category': 'architecture',
                 'status': 'error',
-                'findings': [{
-                    'severity': 'critical',
-                    'issue': f'Architecture checker failed: {str(e)}',
-                    'description': str(e)
-                }],
+                'findings': [Finding(
+                    severity='critical',
+                    issue=f'Architecture checker failed: {str(e)}',
+                    description=str(e)
+                )],
                 'metrics': self.metrics
             }
 
     def _check_architecture_patterns(self):
         """Detect and validate architecture patterns."""
-        # Check for monolithic vs microservices indicators
-        server_files = list(self.project_root.glob('server/**/*.ts')) + \
-                      list(self.project_root.glob('server/**/*.js'))
-        server_files = [f for f in server_files if not self._should_ignore_path(f)]
-
         # Detect if this is a monolithic architecture
-        has_single_entry = (self.project_root / 'server' / 'index.ts').exists() or \
-                          (self.project_root / 'server' / 'index.js').exists()
+        has_single_entry = self._server_index is not None
 
         if has_single_entry:
             self.metrics['architecture_patterns_found'].add('monolithic')
 
             # Check for proper layering in monolithic architecture
-            has_routes = any((self.project_root / 'server').glob('**/routes/*.ts')) or \
-                        any((self.project_root / 'server').glob('**/routes/*.js'))
-            has_controllers = any((self.project_root / 'server').glob('**/controllers/*.ts')) or \
-                            any((self.project_root / 'server').glob('**/controllers/*.js'))
-            has_services = any((self.project_root / 'server').glob('**/services/*.ts')) or \
-                          any((self.project_root / 'server').glob('**/services/*.js'))
+            # Any server .ts/.js file directly inside a routes/, controllers/
+            # or services/ directory, from the files collected up front
+            has_routes = 'routes' in self._server_code_dirs
+            has_controllers = 'controllers' in self._server_code_dirs
+            has_services = 'services' in self._server_code_dirs
 
             if not (has_routes or has_controllers or has_services):
-                self.findings.append({
-                    'severity': 'warning',
-                    'issue': 'Missing layered architecture structure',
-                    'file': 'server/',
-                    'description': 'Monolithic architecture should have clear separation of concerns with routes, controllers, and services',
-                    'recommendation': 'Organize code into layers: routes (HTTP), controllers (orchestration), services (business logic)',
-                    'category': 'Architecture Patterns'
-                })
+                self.findings.append(Finding(
+                    severity='warning',
+                    issue='Missing layered architecture structure',
+                    file='server/',
+                    description='Monolithic architecture should have clear separation of concerns with routes, controllers, and services',
+                    recommendation='Organize code into layers: routes (HTTP), controllers (orchestration), services (business logic)',
+                    category='Architecture Patterns'
+                ))
+
+    @staticmethod
+    def _tracked_deps(pkg: Dict[str, Any]) -> set:
+        """
+        Tracked dependency names declared in a manifest's dependencies or
+        devDependencies. Only these names are ever looked up, so this is a
+        handful of key probes rather than a merge of both maps.
+        """
+        deps = pkg.get('dependencies', {})
+        dev_deps = pkg.get('devDependencies', {})
+        return {name for name in TRACKED_DEPS if name in deps or name in dev_deps}
 
     def _check_technology_coherence(self):
         """Verify technology stack coherence and compatibility."""
-        package_json = self.project_root / 'package.json'
-        server_package_json = self.project_root / 'server' / 'package.json'
-
-        if package_json.exists():
-            with open(package_json, 'r') as f:
-                pkg = json.load(f)
+        pkg = load_package_json(self.project_root / 'package.json')
+        server_pkg = load_package_json(self.project_root / 'server' / 'package.json')
 
+        if pkg is not None:
             # Detect frontend technologies
-            deps = {**pkg.get('dependencies', {}), **pkg.get('devDependencies', {})}
+            deps = self._tracked_deps(pkg)
 
             # Check for React ecosystem
             if 'react' in deps:
@@ -187,20 +432,17 @@ class ArchitectureChecker:
 
                     # Check for potential styling conflicts
                     if '@mui/material' in deps and 'tailwindcss' in deps:
-                        self.findings.append({
-                            'severity': 'info',
-                            'issue': 'Multiple styling systems detected',
-                            'file': 'package.json',
-                            'description': 'Both Material-UI and Tailwind CSS are in use. Ensure consistent styling approach.',
-                            'recommendation': 'Document when to use MUI components vs Tailwind utilities to avoid styling conflicts',
-                            'category': 'Technology Stack'
-                        })
-
-        if server_package_json.exists():
-            with open(server_package_json, 'r') as f:
-                server_pkg = json.load(f)
-
-            server_deps = {**server_pkg.get('dependencies', {}), **server_pkg.get('devDependencies', {})}
+                        self.findings.append(Finding(
+                            severity='info',
+                            issue='Multiple styling systems detected',
+                            file='package.json',
+                            description='Both Material-UI and Tailwind CSS are in use. Ensure consistent styling approach.',
+                            recommendation='Document when to use MUI components vs Tailwind utilities to avoid styling conflicts',
+                            category='Technology Stack'
+                        ))
+
+        if server_pkg is not None:
+            server_deps = self._tracked_deps(server_pkg)
 
             # Detect backend technologies
             if 'express' in server_deps:
@@ -211,53 +453,60 @@ class ArchitectureChecker:
 
     def _check_api_design(self):
         """Validate API design patterns and RESTful conventions."""
-        # Find API route files
-        route_files = []
-        for pattern in ['server/**/routes/**/*.ts', 'server/**/routes/**/*.js',
-                       'server/routes/**/*.ts', 'server/routes/**/*.js']:
-            route_files.extend([f for f in self.project_root.glob(pattern)
-                              if not self._should_ignore_path(f)])
-
-        for route_file in route_files:
+        for route_file in self._route_files:
             self.metrics['files_analyzed'] += 1
 
-            with open(route_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                lines = content.split('\n')
+            content = self._read(route_file)
 
             # Check for RESTful HTTP methods
-            http_methods = re.findall(r'\.(get|post|put|patch|delete)\s*\(', content, re.IGNORECASE)
-            self.metrics['api_endpoints'] += len(http_methods)
+            self.metrics['api_endpoints'] += sum(1 for _ in HTTP_METHOD_RE.finditer(content))
 
             # Check for API versioning
             if '/api/' in content:
-                if not re.search(r'/api/v\d+/', content):
-                    self.findings.append({
-                        'severity': 'info',
-                        'issue': 'API versioning not detected',
-                        'file': str(route_file.relative_to(self.project_root)),
-                        'description': 'Consider implementing API versioning for future compatibility',
-                        'recommendation': 'Use versioned routes like /api/v1/ to allow breaking changes without affecting existing clients',
-                        'category': 'API Design'
-                    })
+                if not API_VERSION_RE.search(content):
+                    self.findings.append(Finding(
+                        severity='info',
+                        issue='API versioning not detected',
+                        file=str(route_file.relative_to(self.project_root)),
+                        description='Consider implementing API versioning for future compatibility',
+                        recommendation='Use versioned routes like /api/v1/ to allow breaking changes without affecting existing clients',
+                        category='API Design'
+                    ))
 
             # Check for error handling in routes
-            for i, line in enumerate(lines, 1):
-                if re.search(r'\.(get|post|put|patch|delete)\s*\(', line):
-                    # Look ahead for error handling
-                    route_block = '\n'.join(lines[i:min(i+20, len(lines))])
-                    if 'try' not in route_block and '.catch' not in route_block:
-                        self.findings.append({
-                            'severity': 'warning',
-                            'issue': 'Route handler missing error handling',
-                            'file': str(route_file.relative_to(self.project_root)),
-                            'line': i,
-                            'description': 'API route handlers should include error handling',
-                            'recommendation': 'Wrap route logic in try-catch or use .catch() for promises',
-                            'category': 'API Design',
-                            'code_snippet': line.strip()[:100]
-                        })
-                        break  # Only report once per file
+            line_no, last_start = 1, -1
+            for match in ROUTE_LINE_RE.finditer(content):
+                line_start = content.rfind('\n', 0, match.start()) + 1
+                if line_start == last_start:
+                    continue  # Another handler on a line already checked
+                line_no += content.count('\n', max(last_start, 0), line_start)
+                last_start = line_start
+
+                line_end = content.find('\n', match.end())
+                if line_end == -1:
+                    line_end = len(content)
+
+                # Look ahead for error handling in the next 20 lines
+                block_end = line_end
+                for _ in range(20):
+                    block_end = content.find('\n', block_end + 1)
+                    if block_end == -1:
+                        block_end = len(content)
+                        break
+
+                if content.find('try', line_end, block_end) == -1 and \
+                        content.find('.catch', line_end, block_end) == -1:
+                    self.findings.append(Finding(
+                        severity='warning',
+                        issue='Route handler missing error handling',
+                        file=str(route_file.relative_to(self.project_root)),
+                        line=line_no,
+                        description='API route handlers should include error handling',
+                        recommendation='Wrap route logic in try-catch or use .catch() for promises',
+                        category='API Design',
+                        code_snippet=content[line_start:line_end].strip()[:100]
+                    ))
+                    break  # Only report once per file
 
     def _check_configuration_management(self):
         """Review configuration and environment variable management."""
@@ -269,226 +518,140 @@ class ArchitectureChecker:
         if env_example.exists():
             self.metrics['config_files'] += 1
 
-            # Check if .env is gitignored
-            if env_file.exists():
-                gitignore = self.project_root / '.gitignore'
-                if gitignore.exists():
-                    with open(gitignore, 'r') as f:
-                        gitignore_content = f.read()
-
-                    if '.env' not in gitignore_content:
-                        self.findings.append({
-                            'severity': 'critical',
-                            'issue': '.env file not in .gitignore',
-                            'file': '.env',
-                            'description': 'Environment files containing secrets should never be committed to version control',
-                            'recommendation': 'Add .env to .gitignore immediately',
-                            'category': 'Configuration Management'
-                        })
+            # Check if .env is gitignored, using the patterns loaded at init
+            if env_file.exists() and (self.project_root / '.gitignore').exists() \
+                    and not self._is_ignored('.env'):
+                self.findings.append(Finding(
+                    severity='critical',
+                    issue='.env file not in .gitignore',
+                    file='.env',
+                    description='Environment files containing secrets should never be committed to version control',
+                    recommendation='Add .env to .gitignore immediately',
+                    category='Configuration Management'
+                ))
 
         # Check for hardcoded secrets in code
-        code_files = []
-        for ext in ['*.ts', '*.tsx', '*.js', '*.jsx']:
-            code_files.extend([f for f in self.project_root.glob(f'src/**/{ext}')
-                             if not self._should_ignore_path(f)])
-            code_files.extend([f for f in self.project_root.glob(f'server/**/{ext}')
-                             if not self._should_ignore_path(f)])
-
-        secret_patterns = [
-            (r'password\s*=\s*["\'][^"\']{3,}["\']', 'Hardcoded password'),
-            (r'api[_-]?key\s*=\s*["\'][^"\']{10,}["\']', 'Hardcoded API key'),
-            (r'secret\s*=\s*["\'][^"\']{10,}["\']', 'Hardcoded secret'),
-        ]
-
-        for code_file in code_files[:50]:  # Limit to avoid performance issues
-            try:
-                with open(code_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    lines = content.split('\n')
-
-                for i, line in enumerate(lines, 1):
-                    for pattern, issue_name in secret_patterns:
-                        if re.search(pattern, line, re.IGNORECASE):
-                            # Skip if it's using process.env
-                            if 'process.env' not in line and 'import.meta.env' not in line:
-                                self.findings.append({
-                                    'severity': 'critical',
-                                    'issue': issue_name,
-                                    'file': str(code_file.relative_to(self.project_root)),
-                                    'line': i,
-                                    'description': 'Secrets should be stored in environment variables, not hardcoded',
-                                    'recommendation': 'Move to environment variable and access via process.env.VARIABLE_NAME',
-                                    'category': 'Configuration Management',
-                                    'code_snippet': line.strip()[:100]
-                                })
-            except Exception:
-                continue
+        self.findings.extend(self._scan_code_files()['secrets'])
 
     def _check_error_handling_architecture(self):
         """Assess global error handling and logging architecture."""
         # Check for global error handler in Express
-        server_index = self.project_root / 'server' / 'index.ts'
-        if not server_index.exists():
-            server_index = self.project_root / 'server' / 'index.js'
-
-        if server_index.exists():
-            with open(server_index, 'r', encoding='utf-8') as f:
-                content = f.read()
+        server_index = self._server_index
+        if server_index:
+            content = self._read(server_index)
 
             # Check for error handling middleware
-            has_error_handler = re.search(r'app\.use\s*\(\s*\(err,\s*req,\s*res,\s*next\)', content) or \
-                              re.search(r'app\.use\s*\(\s*errorHandler', content)
+            has_error_handler = 'app.use' in content and ERROR_HANDLER_RE.search(content)
 
             if not has_error_handler:
-                self.findings.append({
-                    'severity': 'warning',
-                    'issue': 'No global error handler detected',
-                    'file': str(server_index.relative_to(self.project_root)),
-                    'description': 'Express applications should have a global error handling middleware',
-                    'recommendation': 'Add error handling middleware: app.use((err, req, res, next) => { ... })',
-                    'category': 'Error Handling'
-                })
+                self.findings.append(Finding(
+                    severity='warning',
+                    issue='No global error handler detected',
+                    file=str(server_index.relative_to(self.project_root)),
+                    description='Express applications should have a global error handling middleware',
+                    recommendation='Add error handling middleware: app.use((err, req, res, next) => { ... })',
+                    category='Error Handling'
+                ))
 
             # Check for logging setup
             has_logging = 'log4js' in content or 'winston' in content or 'morgan' in content
             if not has_logging:
-                self.findings.append({
-                    'severity': 'info',
-                    'issue': 'Logging framework not detected',
-                    'file': str(server_index.relative_to(self.project_root)),
-                    'description': 'Production applications should use a structured logging framework',
-                    'recommendation': 'Consider adding log4js, winston, or pino for structured logging',
-                    'category': 'Error Handling'
-                })
+                self.findings.append(Finding(
+                    severity='info',
+                    issue='Logging framework not detected',
+                    file=str(server_index.relative_to(self.project_root)),
+                    description='Production applications should use a structured logging framework',
+                    recommendation='Consider adding log4js, winston, or pino for structured logging',
+                    category='Error Handling'
+                ))
 
     def _check_scalability_patterns(self):
         """Identify scalability and performance patterns."""
         # Check for caching implementation
-        code_files = []
-        for ext in ['*.ts', '*.tsx', '*.js', '*.jsx']:
-            code_files.extend([f for f in self.project_root.glob(f'src/**/{ext}')
-                             if not self._should_ignore_path(f)])
-            code_files.extend([f for f in self.project_root.glob(f'server/**/{ext}')
-                             if not self._should_ignore_path(f)])
-
-        has_caching = False
-        has_query_caching = False
-
-        for code_file in code_files[:50]:
-            try:
-                with open(code_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-
-                if 'redis' in content.lower() or 'memcached' in content.lower():
-                    has_caching = True
-                    self.metrics['architecture_patterns_found'].add('caching')
-
-                if '@tanstack/react-query' in content or 'useQuery' in content:
-                    has_query_caching = True
-                    self.metrics['architecture_patterns_found'].add('client-side-caching')
-            except Exception:
-                continue
+        scan = self._scan_code_files()
+        if scan['caching']:
+            self.metrics['architecture_patterns_found'].add('caching')
+        if scan['query_caching']:
+            self.metrics['architecture_patterns_found'].add('client-side-caching')
 
         # Check for database connection pooling
-        server_files = [f for f in self.project_root.glob('server/**/*.ts')
-                       if not self._should_ignore_path(f)]
-
-        for server_file in server_files[:20]:
+        for server_file in self._server_ts[:20]:
             try:
-                with open(server_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                content = self._read(server_file)
 
                 # Check for connection pooling patterns
-                if 'createPool' in content or 'pool' in content.lower():
+                if POOL_RE.search(content):
                     self.metrics['architecture_patterns_found'].add('connection-pooling')
+                    break
             except Exception:
                 continue
 
     def _check_security_architecture(self):
         """Review security architecture and patterns."""
         # Check for authentication/authorization
-        auth_files = []
-        for pattern in ['src/**/auth*.ts*', 'server/**/auth*.ts', 'server/**/middleware/**/*.ts']:
-            auth_files.extend([f for f in self.project_root.glob(pattern)
-                             if not self._should_ignore_path(f)])
-
+        auth_files = self._auth_files
         has_auth = len(auth_files) > 0
 
         if has_auth:
             self.metrics['architecture_patterns_found'].add('authentication')
 
             # Check for JWT or session-based auth
+            has_jwt = has_session = False
             for auth_file in auth_files:
-                with open(auth_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                content = self._read(auth_file)
 
-                if 'jsonwebtoken' in content or 'jwt' in content.lower():
+                if not has_jwt and ('jsonwebtoken' in content or JWT_RE.search(content)):
+                    has_jwt = True
                     self.metrics['architecture_patterns_found'].add('jwt-auth')
 
-                if 'express-session' in content:
+                if not has_session and 'express-session' in content:
+                    has_session = True
                     self.metrics['architecture_patterns_found'].add('session-auth')
 
-        # Check for CORS configuration
-        server_index = self.project_root / 'server' / 'index.ts'
-        if not server_index.exists():
-            server_index = self.project_root / 'server' / 'index.js'
+                if has_jwt and has_session:
+                    break
 
-        if server_index.exists():
-            with open(server_index, 'r', encoding='utf-8') as f:
-                content = f.read()
+        # Check for CORS configuration
+        server_index = self._server_index
+        if server_index:
+            content = self._read(server_index)
 
             if 'cors' in content:
                 self.metrics['architecture_patterns_found'].add('cors')
 
                 # Check if CORS is configured properly
                 if 'origin:' not in content and 'credentials:' not in content:
-                    self.findings.append({
-                        'severity': 'warning',
-                        'issue': 'CORS configuration may be too permissive',
-                        'file': str(server_index.relative_to(self.project_root)),
-                        'description': 'CORS should explicitly specify allowed origins',
-                        'recommendation': 'Configure CORS with specific origins and credentials settings',
-                        'category': 'Security'
-                    })
+                    self.findings.append(Finding(
+                        severity='warning',
+                        issue='CORS configuration may be too permissive',
+                        file=str(server_index.relative_to(self.project_root)),
+                        description='CORS should explicitly specify allowed origins',
+                        recommendation='Configure CORS with specific origins and credentials settings',
+                        category='Security'
+                    ))
             else:
-                self.findings.append({
-                    'severity': 'info',
-                    'issue': 'CORS not configured',
-                    'file': str(server_index.relative_to(self.project_root)),
-                    'description': 'If this API is accessed from browsers, CORS should be configured',
-                    'recommendation': 'Add cors middleware if frontend and backend are on different origins',
-                    'category': 'Security'
-                })
+                self.findings.append(Finding(
+                    severity='info',
+                    issue='CORS not configured',
+                    file=str(server_index.relative_to(self.project_root)),
+                    description='If this API is accessed from browsers, CORS should be configured',
+                    recommendation='Add cors middleware if frontend and backend are on different origins',
+                    category='Security'
+                ))
 
         # Check for input validation
-        code_files = []
-        for ext in ['*.ts', '*.tsx', '*.js', '*.jsx']:
-            code_files.extend([f for f in self.project_root.glob(f'src/**/{ext}')
-                             if not self._should_ignore_path(f)])
-            code_files.extend([f for f in self.project_root.glob(f'server/**/{ext}')
-                             if not self._should_ignore_path(f)])
-
-        has_validation = False
-        for code_file in code_files[:30]:
-            try:
-                with open(code_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-
-                if any(lib in content for lib in ['joi', 'yup', 'zod', 'express-validator']):
-                    has_validation = True
-                    self.metrics['architecture_patterns_found'].add('input-validation')
-                    break
-            except Exception:
-                continue
+        has_validation = self._scan_code_files()['validation']
+        if has_validation:
+            self.metrics['architecture_patterns_found'].add('input-validation')
 
         if not has_validation and self.metrics['api_endpoints'] > 0:
-            self.findings.append({
-                'severity': 'warning',
-                'issue': 'Input validation library not detected',
-                'description': 'API endpoints should validate input to prevent injection attacks',
-                'recommendation': 'Consider adding joi, yup, zod, or express-validator for input validation',
-                'category': 'Security'
-            })
+            self.findings.append(Finding(
+                severity='warning',
+                issue='Input validation library not detected',
+                description='API endpoints should validate input to prevent injection attacks',
+                recommendation='Consider adding joi, yup, zod, or express-validator for input validation',
+                category='Security'
+            ))
 
     def _check_code_organization(self):
         """Evaluate code organization and layer separation."""
@@ -496,40 +659,42 @@ class ArchitectureChecker:
         src_path = self.project_root / 'src'
         server_path = self.project_root / 'server'
 
-        # Frontend organization
+        # Frontend organization (one directory listing instead of a stat per probe)
         if src_path.exists():
-            has_components = (src_path / 'components').exists()
-            has_pages = (src_path / 'pages').exists() or (src_path / 'views').exists()
-            has_services = (src_path / 'services').exists() or (src_path / 'api').exists()
-            has_utils = (src_path / 'utils').exists() or (src_path / 'helpers').exists()
+            children = self._child_names(src_path)
+            has_components = 'components' in children
+            has_pages = 'pages' in children or 'views' in children
+            has_services = 'services' in children or 'api' in children
+            has_utils = 'utils' in children or 'helpers' in children
 
             if not has_components:
-                self.findings.append({
-                    'severity': 'info',
-                    'issue': 'No components directory found',
-                    'file': 'src/',
-                    'description': 'React applications typically organize reusable UI in a components directory',
-                    'recommendation': 'Consider creating src/components/ for reusable React components',
-                    'category': 'Code Organization'
-                })
+                self.findings.append(Finding(
+                    severity='info',
+                    issue='No components directory found',
+                    file='src/',
+                    description='React applications typically organize reusable UI in a components directory',
+                    recommendation='Consider creating src/components/ for reusable React components',
+                    category='Code Organization'
+                ))
 
         # Backend organization
         if server_path.exists():
-            has_routes = (server_path / 'routes').exists()
-            has_controllers = (server_path / 'controllers').exists()
-            has_models = (server_path / 'models').exists()
+            children = self._child_names(server_path)
+            has_routes = 'routes' in children
+            has_controllers = 'controllers' in children
+            has_models = 'models' in children
 
             layers_count = sum([has_routes, has_controllers, has_models])
 
             if layers_count < 2:
-                self.findings.append({
-                    'severity': 'warning',
-                    'issue': 'Backend lacks clear layered architecture',
-                    'file': 'server/',
-                    'description': 'Backend should separate concerns into routes, controllers, and models/services',
-                    'recommendation': 'Organize backend code into layers: routes (HTTP), controllers (logic), models (data)',
-                    'category': 'Code Organization'
-                })
+                self.findings.append(Finding(
+                    severity='warning',
+                    issue='Backend lacks clear layered architecture',
+                    file='server/',
+                    description='Backend should separate concerns into routes, controllers, and models/services',
+                    recommendation='Organize backend code into layers: routes (HTTP), controllers (logic), models (data)',
+                    category='Code Organization'
+                ))
 
     def _check_documentation(self):
         """Check for architectural documentation."""
@@ -544,38 +709,30 @@ class ArchitectureChecker:
         has_adr = any(path.exists() for path in adr_paths)
 
         if not has_adr and self.metrics['api_endpoints'] > 10:
-            self.findings.append({
-                'severity': 'info',
-                'issue': 'No Architecture Decision Records found',
-                'description': 'Documenting architectural decisions helps maintain context over time',
-                'recommendation': 'Consider creating ADR directory to document key architectural choices',
-                'category': 'Documentation'
-            })
-
-        # Check for API documentation
-        api_doc_files = list(self.project_root.glob('**/api.md')) + \
-                       list(self.project_root.glob('**/API.md')) + \
-                       list(self.project_root.glob('**/*swagger*.json')) + \
-                       list(self.project_root.glob('**/*openapi*.json'))
-
-        if not api_doc_files and self.metrics['api_endpoints'] > 5:
-            self.findings.append({
-                'severity': 'info',
-                'issue': 'API documentation not found',
-                'description': 'API endpoints should be documented for developers and consumers',
-                'recommendation': 'Consider adding OpenAPI/Swagger documentation or API.md file',
-                'category': 'Documentation'
-            })
+            self.findings.append(Finding(
+                severity='info',
+                issue='No Architecture Decision Records found',
+                description='Documenting architectural decisions helps maintain context over time',
+                recommendation='Consider creating ADR directory to document key architectural choices',
+                category='Documentation'
+            ))
+
+        # Check for API documentation (api.md, swagger/openapi specs)
+        if not self._doc_files['api'] and self.metrics['api_endpoints'] > 5:
+            self.findings.append(Finding(
+                severity='info',
+                issue='API documentation not found',
+                description='API endpoints should be documented for developers and consumers',
+                recommendation='Consider adding OpenAPI/Swagger documentation or API.md file',
+                category='Documentation'
+            ))
 
         # Check for architecture diagram or overview
-        arch_docs = list(self.project_root.glob('**/ARCHITECTURE.md')) + \
-                   list(self.project_root.glob('**/architecture.md'))
-
-        if not arch_docs:
-            self.findings.append({
-                'severity': 'info',
-                'issue': 'Architecture documentation not found',
-                'description': 'High-level architecture documentation helps onboard new developers',
-                'recommendation': 'Create ARCHITECTURE.md documenting system components and their interactions',
-                'category': 'Documentation'
-            })
+        if not self._doc_files['architecture']:
+            self.findings.append(Finding(
+                severity='info',
+                issue='Architecture documentation not found',
+                description='High-level architecture documentation helps onboard new developers',
+                recommendation='Create ARCHITECTURE.md documenting system components and their interactions',
+                category='Documentation'
+            ))
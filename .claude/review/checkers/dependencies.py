@@ -10,19 +10,110 @@ Reviews package dependencies for:
 - Dependency bloat
 """
 
-import json
+import hashlib
+import os
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Set, Any
-import fnmatch
+from typing import Dict, Iterator, List, Optional, Set, Any, Tuple
+
+try:
+    from orjson import dumps as _dumps, loads as _loads
+except ImportError:
+    import json
+    from json import loads as _loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+try:
+    import ijson
+except ImportError:  # Optional; lock versions then come from the file head
+    ijson = None
+
+from ..utils.findings import Finding
+from ..utils.gitignore import ignore_matcher, ignore_patterns, read_gitignore
+from ..utils.package_json import load_package_json
+
+
+CODE_EXTENSIONS = ('.ts', '.tsx', '.js', '.jsx')
+
+# How much of a lock file to search for its top-level "version" without ijson
+LOCK_HEAD_SIZE = 4096
+
+# Top-level keys of an npm-formatted (two-space indented) lock file
+LOCK_TOP_KEY_RE = re.compile(rb'^  "(version|packages|dependencies)"\s*:\s*(?:"([^"]*)")?', re.M)
+
+# Per-file import scan results from earlier runs, keyed by absolute path. Each
+# project gets its own imports-<hash of project root>.json here, so reviewing
+# several projects doesn't evict one's cache for another's
+IMPORT_CACHE_DIR = Path(__file__).parent.parent / '.cache'
+
+# Threads used to read and scan source files for imports
+SCAN_WORKERS = min(16, os.cpu_count() or 4)
+
+# Stop scanning for imports once this many bytes of source are read
+IMPORT_SCAN_BUDGET = 128 * 1024 * 1024
+
+# import ... from 'pkg' | require('pkg') | import('pkg'), one group per form.
+# Matched against raw bytes so files don't need decoding first
+IMPORT_RE = re.compile(
+    rb'import\s+.*?\s+from\s+["\']([^"\']+)["\']'
+    rb'|require\s*\(\s*["\']([^"\']+)["\']\s*\)'
+    rb'|import\s*\(\s*["\']([^"\']+)["\']\s*\)'
+)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_pkg_name(specifier: str) -> Optional[str]:
+    """
+    Reduce an import specifier to the package it comes from.
+
+    Args:
+        specifier: Module specifier as written in the import
+
+    Returns:
+        '@scope/name' for scoped packages, the first path segment for others,
+        or None for relative imports and bare scopes
+    """
+    if specifier.startswith('@'):
+        # Scoped package: @scope/package
+        parts = specifier.split('/')
+        return f'{parts[0]}/{parts[1]}' if len(parts) >= 2 else None
+    if specifier.startswith('.'):
+        # Relative import
+        return None
+    # Regular package, possibly with a subpath
+    return specifier.split('/')[0]
 
 
 class DependenciesChecker:
     def __init__(self, project_root, config):
         self.project_root = Path(project_root)
+        self._root_prefix = os.path.join(str(self.project_root), '')
+        self._pkg_json = self.project_root / 'package.json'
+        self._pkg_lock = self.project_root / 'package-lock.json'
+        self._server_pkg_json = self.project_root / 'server' / 'package.json'
+        self._server_pkg_lock = self.project_root / 'server' / 'package-lock.json'
         self.config = config
         self.findings = []
-        self.gitignore_patterns = self._load_gitignore()
+        self._severity_counts = {'critical': 0, 'warning': 0, 'info': 0}
+        self._scan_budget_lock = threading.Lock()
+        self._scan_bytes = 0
+        self._import_cache: Dict[str, Dict[str, Any]] = {}
+        root_hash = hashlib.blake2b(str(self.project_root).encode('utf-8'), digest_size=8).hexdigest()
+        self._import_cache_path = IMPORT_CACHE_DIR / f'imports-{root_hash}.json'
+        self._root_pkg: Optional[Dict[str, Any]] = None
+        self._server_pkg: Optional[Dict[str, Any]] = None
+        gitignore_lines = read_gitignore(self.project_root)
+        self.gitignore_patterns = ignore_patterns(gitignore_lines)
+        # The project's own entries, for checks that ask what it ignores
+        self._gitignore_lineset = frozenset(
+            line[1:] if line.startswith('/') else line for line in gitignore_lines
+        )
+        self._ignore_matcher = ignore_matcher(gitignore_lines)
         self.metrics = {
             'total_dependencies': 0,
             'dev_dependencies': 0,
@@ -31,57 +122,32 @@ class DependenciesChecker:
             'version_conflicts': 0
         }
 
-    def _load_gitignore(self) -> List[str]:
-        """Load and parse .gitignore patterns."""
-        patterns = []
-        gitignore_path = self.project_root / '.gitignore'
-
-        if gitignore_path.exists():
-            with open(gitignore_path, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#'):
-                        if line.startswith('/'):
-                            line = line[1:]
-                        patterns.append(line)
-
-        # Always ignore common build/dependency directories
-        patterns.extend([
-            'node_modules', 'dist', 'build', '.git',
-            '__pycache__', '*.pyc', '.cache', 'coverage'
-        ])
-
-        return patterns
-
-    def _should_ignore_path(self, file_path: Path) -> bool:
-        """Check if file path matches any gitignore pattern."""
-        try:
-            rel_path = file_path.relative_to(self.project_root)
-            path_str = str(rel_path)
-
-            for pattern in self.gitignore_patterns:
-                if pattern.endswith('/'):
-                    if path_str.startswith(pattern.rstrip('/')):
-                        return True
-                elif '*' in pattern:
-                    if fnmatch.fnmatch(path_str, pattern):
-                        return True
-                    for part in rel_path.parts:
-                        if fnmatch.fnmatch(part, pattern):
-                            return True
-                else:
-                    if path_str.startswith(pattern + '/') or path_str == pattern:
-                        return True
-                    if pattern in rel_path.parts:
-                        return True
-
-            return False
-        except ValueError:
-            return True
+    def _is_ignored(self, rel_str: str, is_dir: bool = False) -> bool:
+        """Check a '/'-separated path relative to the project root."""
+        return self._ignore_matcher.matches(rel_str, is_dir)
+
+    def _emit(self, finding: Finding):
+        """Record a finding and count it towards its severity."""
+        self.findings.append(finding)
+        self._severity_counts[finding.severity] += 1
 
     def run(self):
         """Run all dependency checks."""
         try:
+            # Each manifest is loaded (and checked for existence) once here;
+            # the checks below take None to mean the file is missing
+            self._root_pkg = load_package_json(self._pkg_json)
+            self._server_pkg = load_package_json(self._server_pkg_json)
+
+            if self._root_pkg is None and self._server_pkg is None:
+                # Not an npm project; there is nothing to check
+                return {
+                    'category': 'dependencies',
+                    'status': 'pass',
+                    'findings': self.findings,
+                    'metrics': self.metrics
+                }
+
             self._check_package_lock_sync()
             self._check_duplicate_dependencies()
             self._check_unused_dependencies()
@@ -91,9 +157,9 @@ class DependenciesChecker:
 
             # Determine overall status
             status = 'pass'
-            if any(f['severity'] == 'critical' for f in self.findings):
+            if self._severity_counts['critical']:
                 status = 'critical'
-            elif any(f['severity'] == 'warning' for f in self.findings):
+            elif self._severity_counts['warning']:
                 status = 'warning'
 
             return {
@@ -106,124 +172,134 @@ class DependenciesChecker:
             return {
                 'category': 'dependencies',
                 'status': 'error',
-                'findings': [{
-                    'severity': 'critical',
-                    'issue': f'Dependencies checker failed: {str(e)}',
-                    'description': str(e)
-                }],
+                'findings': [Finding(
+                    severity='critical',
+                    issue=f'Dependencies checker failed: {str(e)}',
+                    description=str(e)
+                )],
                 'metrics': self.metrics
             }
 
     def _check_package_lock_sync(self):
         """Check if package.json and package-lock.json are in sync."""
-        package_json = self.project_root / 'package.json'
-        package_lock = self.project_root / 'package-lock.json'
+        pkg = self._root_pkg
+        package_lock = self._pkg_lock
 
-        if not package_json.exists():
+        if pkg is None:
             return
 
         if not package_lock.exists():
-            self.findings.append({
-                'severity': 'warning',
-                'issue': 'Missing package-lock.json',
-                'file': 'package-lock.json',
-                'description': 'package-lock.json ensures consistent dependency versions across environments',
-                'recommendation': 'Run "npm install" to generate package-lock.json and commit it to version control',
-                'category': 'Dependency Management'
-            })
+            self._emit(Finding(
+                severity='warning',
+                issue='Missing package-lock.json',
+                file='package-lock.json',
+                description='package-lock.json ensures consistent dependency versions across environments',
+                recommendation='Run "npm install" to generate package-lock.json and commit it to version control',
+                category='Dependency Management'
+            ))
             return
 
-        with open(package_json, 'r') as f:
-            pkg = json.load(f)
-
-        with open(package_lock, 'r') as f:
-            pkg_lock = json.load(f)
-
         # Check version mismatch
         pkg_version = pkg.get('version', '0.0.0')
-        lock_version = pkg_lock.get('version', '0.0.0')
+        lock_version = self._read_lock_version(package_lock)
 
         if pkg_version != lock_version:
-            self.findings.append({
-                'severity': 'warning',
-                'issue': 'Version mismatch between package.json and package-lock.json',
-                'file': 'package.json',
-                'description': f'package.json version ({pkg_version}) differs from package-lock.json ({lock_version})',
-                'recommendation': 'Run "npm install" to sync package-lock.json',
-                'category': 'Dependency Management'
-            })
+            self._emit(Finding(
+                severity='warning',
+                issue='Version mismatch between package.json and package-lock.json',
+                file='package.json',
+                description=f'package.json version ({pkg_version}) differs from package-lock.json ({lock_version})',
+                recommendation='Run "npm install" to sync package-lock.json',
+                category='Dependency Management'
+            ))
 
         # Check if package-lock.json is gitignored (it shouldn't be)
-        gitignore = self.project_root / '.gitignore'
-        if gitignore.exists():
-            with open(gitignore, 'r') as f:
-                gitignore_content = f.read()
-
-            if 'package-lock.json' in gitignore_content:
-                self.findings.append({
-                    'severity': 'critical',
-                    'issue': 'package-lock.json is gitignored',
-                    'file': '.gitignore',
-                    'description': 'package-lock.json should be committed to ensure reproducible builds',
-                    'recommendation': 'Remove package-lock.json from .gitignore',
-                    'category': 'Dependency Management'
-                })
+        if not self._gitignore_lineset.isdisjoint(('package-lock.json', '**/package-lock.json')):
+            self._emit(Finding(
+                severity='critical',
+                issue='package-lock.json is gitignored',
+                file='.gitignore',
+                description='package-lock.json should be committed to ensure reproducible builds',
+                recommendation='Remove package-lock.json from .gitignore',
+                category='Dependency Management'
+            ))
 
         # Check server package-lock as well
-        server_pkg_json = self.project_root / 'server' / 'package.json'
-        server_pkg_lock = self.project_root / 'server' / 'package-lock.json'
-
-        if server_pkg_json.exists() and not server_pkg_lock.exists():
-            self.findings.append({
-                'severity': 'warning',
-                'issue': 'Missing server/package-lock.json',
-                'file': 'server/package-lock.json',
-                'description': 'Server dependencies should have a package-lock.json',
-                'recommendation': 'Run "npm install" in server directory',
-                'category': 'Dependency Management'
-            })
+        if self._server_pkg is not None and not self._server_pkg_lock.exists():
+            self._emit(Finding(
+                severity='warning',
+                issue='Missing server/package-lock.json',
+                file='server/package-lock.json',
+                description='Server dependencies should have a package-lock.json',
+                recommendation='Run "npm install" in server directory',
+                category='Dependency Management'
+            ))
+
+    def _read_lock_version(self, package_lock: Path) -> str:
+        """
+        Read the top-level "version" of a lock file without loading all of it.
+
+        With ijson the file is streamed until the key turns up. Otherwise the
+        head of an npm-formatted file is searched, and the whole file is only
+        parsed when the version isn't found there before the package entries.
+
+        Args:
+            package_lock: Path to package-lock.json
+
+        Returns:
+            The lock file's version, or '0.0.0' if it has none
+        """
+        if ijson is not None:
+            with open(package_lock, 'rb') as f:
+                return next(
+                    (value for prefix, event, value in ijson.parse(f)
+                     if prefix == 'version' and event == 'string'),
+                    '0.0.0'
+                )
+
+        with open(package_lock, 'rb') as f:
+            head = f.read(LOCK_HEAD_SIZE)
+        match = LOCK_TOP_KEY_RE.search(head)
+        if match and match.group(1) == b'version' and match.group(2) is not None:
+            return match.group(2).decode('utf-8')
+
+        return load_package_json(package_lock).get('version', '0.0.0')
 
     def _check_duplicate_dependencies(self):
         """Check for packages listed in both dependencies and devDependencies."""
-        for pkg_path in [self.project_root / 'package.json',
-                        self.project_root / 'server' / 'package.json']:
-            if not pkg_path.exists():
+        for pkg_path, pkg in ((self._pkg_json, self._root_pkg),
+                              (self._server_pkg_json, self._server_pkg)):
+            if pkg is None:
                 continue
 
-            with open(pkg_path, 'r') as f:
-                pkg = json.load(f)
-
-            deps = set(pkg.get('dependencies', {}).keys())
-            dev_deps = set(pkg.get('devDependencies', {}).keys())
+            deps = pkg.get('dependencies', {})
+            dev_deps = pkg.get('devDependencies', {})
 
             # Update metrics
             self.metrics['total_dependencies'] += len(deps)
             self.metrics['dev_dependencies'] += len(dev_deps)
 
-            duplicates = deps.intersection(dev_deps)
+            duplicates = deps.keys() & dev_deps.keys()
 
             if duplicates:
                 self.metrics['duplicate_packages'] += len(duplicates)
                 for dup in duplicates:
-                    self.findings.append({
-                        'severity': 'warning',
-                        'issue': f'Duplicate dependency: {dup}',
-                        'file': str(pkg_path.relative_to(self.project_root)),
-                        'description': f'Package "{dup}" appears in both dependencies and devDependencies',
-                        'recommendation': 'Remove from devDependencies if needed at runtime, or from dependencies if only needed for development',
-                        'category': 'Duplicate Dependencies'
-                    })
+                    self._emit(Finding(
+                        severity='warning',
+                        issue=f'Duplicate dependency: {dup}',
+                        file=str(pkg_path.relative_to(self.project_root)),
+                        description=f'Package "{dup}" appears in both dependencies and devDependencies',
+                        recommendation='Remove from devDependencies if needed at runtime, or from dependencies if only needed for development',
+                        category='Duplicate Dependencies'
+                    ))
 
     def _check_unused_dependencies(self):
         """Check for dependencies that appear unused in the codebase."""
-        package_json = self.project_root / 'package.json'
+        pkg = self._root_pkg
 
-        if not package_json.exists():
+        if pkg is None:
             return
 
-        with open(package_json, 'r') as f:
-            pkg = json.load(f)
-
         deps = pkg.get('dependencies', {})
         dev_deps = pkg.get('devDependencies', {})
 
@@ -237,117 +313,192 @@ class DependenciesChecker:
             'eslint', 'prettier', 'cypress', 'jest'
         }
 
+        # One string to substring-search instead of a loop over every import;
+        # package names never contain newlines, so matches can't straddle two
+        imports_text = '\n'.join(imports_found)
+
         for dep_name in deps.keys():
             # Skip scoped packages' parent scope check
             check_name = dep_name.split('/')[1] if dep_name.startswith('@') else dep_name
 
             if dep_name not in implicit_deps and dep_name not in imports_found and check_name not in imports_found:
-                # Double-check if it's imported with different patterns
-                is_used = any(
-                    dep_name in imp or check_name in imp
-                    for imp in imports_found
-                )
-
-                if not is_used:
+                # Double-check if it's imported with different patterns. check_name
+                # is a substring of dep_name, so it alone decides the match
+                if check_name not in imports_text:
                     self.metrics['unused_dependencies'] += 1
-                    self.findings.append({
-                        'severity': 'info',
-                        'issue': f'Potentially unused dependency: {dep_name}',
-                        'file': 'package.json',
-                        'description': f'Package "{dep_name}" is listed in dependencies but no imports were found',
-                        'recommendation': 'Verify if this dependency is needed. Remove if unused to reduce bundle size',
-                        'category': 'Unused Dependencies'
-                    })
+                    self._emit(Finding(
+                        severity='info',
+                        issue=f'Potentially unused dependency: {dep_name}',
+                        file='package.json',
+                        description=f'Package "{dep_name}" is listed in dependencies but no imports were found',
+                        recommendation='Verify if this dependency is needed. Remove if unused to reduce bundle size',
+                        category='Unused Dependencies'
+                    ))
 
     def _scan_imports(self) -> Set[str]:
         """Scan source files to find all imported packages."""
         imports = set()
 
-        # Scan frontend files
-        code_files = []
-        for ext in ['*.ts', '*.tsx', '*.js', '*.jsx']:
-            code_files.extend([f for f in self.project_root.glob(f'src/**/{ext}')
-                             if not self._should_ignore_path(f)])
-            code_files.extend([f for f in self.project_root.glob(f'server/**/{ext}')
-                             if not self._should_ignore_path(f)])
-
-        # Import patterns to match
-        import_patterns = [
-            r'import\s+.*?\s+from\s+["\']([^"\']+)["\']',  # import ... from 'pkg'
-            r'require\s*\(\s*["\']([^"\']+)["\']\s*\)',    # require('pkg')
-            r'import\s*\(\s*["\']([^"\']+)["\']\s*\)',     # import('pkg')
+        code_files = [
+            code_file
+            for top in ('src', 'server')
+            for code_file in self._iter_code_files(top)
         ]
-
-        for code_file in code_files[:100]:  # Limit to avoid performance issues
-            try:
-                with open(code_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-
-                for pattern in import_patterns:
-                    matches = re.findall(pattern, content)
-                    for match in matches:
-                        # Extract package name (handle scoped packages and subpaths)
-                        if match.startswith('@'):
-                            # Scoped package: @scope/package
-                            parts = match.split('/')
-                            if len(parts) >= 2:
-                                imports.add(f'{parts[0]}/{parts[1]}')
-                        elif match.startswith('.'):
-                            # Relative import, skip
-                            continue
-                        else:
-                            # Regular package
-                            pkg_name = match.split('/')[0]
-                            imports.add(pkg_name)
-            except Exception:
-                continue
+        if not code_files:
+            return imports
+
+        # Every file is scanned (within IMPORT_SCAN_BUDGET) so a dependency
+        # imported only by a later file isn't reported as unused. Files are
+        # read and scanned concurrently; results merge here only
+        self._import_cache = self._load_import_cache()
+        scanned = {}
+        with ThreadPoolExecutor(max_workers=min(SCAN_WORKERS, len(code_files))) as executor:
+            for code_file, (entry, file_imports) in zip(
+                code_files, executor.map(self._extract_imports_from_file, code_files)
+            ):
+                imports.update(file_imports)
+                if entry is not None:
+                    scanned[code_file] = entry
+
+        # Rewrite the cache only when a file was (re)scanned or has gone away
+        if scanned != self._import_cache:
+            self._save_import_cache(scanned)
 
         return imports
 
-    def _check_version_conflicts(self):
-        """Check for version conflicts between frontend and backend."""
-        frontend_pkg = self.project_root / 'package.json'
-        backend_pkg = self.project_root / 'server' / 'package.json'
+    def _load_import_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Load the previous run's per-file import results, if any."""
+        try:
+            with open(self._import_cache_path, 'rb') as f:
+                cache = _loads(f.read())
+        except (OSError, ValueError):
+            return {}
+        return cache if isinstance(cache, dict) else {}
+
+    def _save_import_cache(self, cache: Dict[str, Dict[str, Any]]):
+        """Write the import cache atomically (temp file + rename)."""
+        path = self._import_cache_path
+        tmp = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_bytes(_dumps(cache))
+            os.replace(tmp, path)
+        except OSError:
+            pass
+
+    def _extract_imports_from_file(
+        self, code_file: str
+    ) -> Tuple[Optional[Dict[str, Any]], Set[str]]:
+        """
+        Find the packages one source file imports.
+
+        Files whose mtime and size match the import cache aren't read again.
+
+        Args:
+            code_file: Path of a JS/TS source file
+
+        Returns:
+            Tuple of (cache entry for the file, or None if it wasn't
+            scanned, package names scoped as '@scope/name'). The names are
+            empty if the file can't be read or the scan budget is spent
+        """
+        imports = set()
+        try:
+            st = os.stat(code_file)
+        except OSError:
+            return None, imports
+
+        cached = self._import_cache.get(code_file)
+        if (isinstance(cached, dict) and cached.get('mtime_ns') == st.st_mtime_ns
+                and cached.get('size') == st.st_size):
+            return cached, set(cached.get('imports', ()))
 
-        if not (frontend_pkg.exists() and backend_pkg.exists()):
+        try:
+            with open(code_file, 'rb') as f:
+                content = f.read()
+        except OSError:
+            return None, imports
+
+        with self._scan_budget_lock:
+            if self._scan_bytes + len(content) > IMPORT_SCAN_BUDGET:
+                return None, imports
+            self._scan_bytes += len(content)
+
+        for m in IMPORT_RE.finditer(content):
+            # Only the captured specifier is decoded
+            pkg_name = _normalize_pkg_name(m.group(m.lastindex).decode('utf-8', 'replace'))
+            if pkg_name is not None:
+                imports.add(pkg_name)
+
+        entry = {'mtime_ns': st.st_mtime_ns, 'size': st.st_size, 'imports': sorted(imports)}
+        return entry, imports
+
+    def _iter_code_files(self, rel_dir: str) -> Iterator[str]:
+        """
+        Yield the paths of code files under a directory, skipping ignored ones.
+
+        Ignored directories are pruned rather than descended into, and the
+        extension is checked before the ignore patterns. Paths stay strings
+        (os.DirEntry.path) since they are only stat'ed and opened. Files in a
+        directory are yielded before its subdirectories are walked, matching
+        the order pathlib's '**' globs produce.
+
+        Args:
+            rel_dir: '/'-separated directory relative to the project root
+        """
+        try:
+            with os.scandir(self._root_prefix + rel_dir) as it:
+                entries = list(it)
+        except OSError:
             return
 
-        with open(frontend_pkg, 'r') as f:
-            frontend = json.load(f)
+        subdirs = []
+        for entry in entries:
+            rel = f'{rel_dir}/{entry.name}'
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(rel)
+            elif (entry.name.endswith(CODE_EXTENSIONS) and entry.is_file()
+                    and not self._is_ignored(rel)):
+                yield entry.path
+
+        for rel in subdirs:
+            if not self._is_ignored(rel, is_dir=True):
+                yield from self._iter_code_files(rel)
+
+    def _check_version_conflicts(self):
+        """Check for version conflicts between frontend and backend."""
+        frontend = self._root_pkg
+        backend = self._server_pkg
 
-        with open(backend_pkg, 'r') as f:
-            backend = json.load(f)
+        if frontend is None or backend is None:
+            return
 
         frontend_deps = {**frontend.get('dependencies', {}), **frontend.get('devDependencies', {})}
         backend_deps = {**backend.get('dependencies', {}), **backend.get('devDependencies', {})}
 
-        # Find shared packages with different versions
-        shared_packages = set(frontend_deps.keys()).intersection(set(backend_deps.keys()))
-
-        for pkg in shared_packages:
+        # Find shared packages with different versions (key views intersect
+        # without copying either side into a set first)
+        for pkg in frontend_deps.keys() & backend_deps.keys():
             frontend_ver = frontend_deps[pkg]
             backend_ver = backend_deps[pkg]
 
             if frontend_ver != backend_ver:
                 self.metrics['version_conflicts'] += 1
-                self.findings.append({
-                    'severity': 'warning',
-                    'issue': f'Version conflict: {pkg}',
-                    'description': f'Frontend uses {pkg}@{frontend_ver} but backend uses {pkg}@{backend_ver}',
-                    'recommendation': 'Consider aligning versions for shared packages to avoid compatibility issues',
-                    'category': 'Version Conflicts'
-                })
+                self._emit(Finding(
+                    severity='warning',
+                    issue=f'Version conflict: {pkg}',
+                    description=f'Frontend uses {pkg}@{frontend_ver} but backend uses {pkg}@{backend_ver}',
+                    recommendation='Consider aligning versions for shared packages to avoid compatibility issues',
+                    category='Version Conflicts'
+                ))
 
     def _check_dependency_bloat(self):
         """Check for excessive number of dependencies."""
-        package_json = self.project_root / 'package.json'
+        pkg = self._root_pkg
 
-        if not package_json.exists():
+        if pkg is None:
             return
 
-        with open(package_json, 'r') as f:
-            pkg = json.load(f)
-
         deps_count = len(pkg.get('dependencies', {}))
         dev_deps_count = len(pkg.get('devDependencies', {}))
         total = deps_count + dev_deps_count
@@ -357,35 +508,32 @@ class DependenciesChecker:
         max_dev_deps = self.config.get('thresholds', {}).get('max_dev_dependencies', 100)
 
         if deps_count > max_deps:
-            self.findings.append({
-                'severity': 'info',
-                'issue': f'High number of dependencies ({deps_count})',
-                'file': 'package.json',
-                'description': f'Project has {deps_count} production dependencies (threshold: {max_deps})',
-                'recommendation': 'Review dependencies and remove unused packages. Consider if all are necessary.',
-                'category': 'Dependency Bloat'
-            })
+            self._emit(Finding(
+                severity='info',
+                issue=f'High number of dependencies ({deps_count})',
+                file='package.json',
+                description=f'Project has {deps_count} production dependencies (threshold: {max_deps})',
+                recommendation='Review dependencies and remove unused packages. Consider if all are necessary.',
+                category='Dependency Bloat'
+            ))
 
         if dev_deps_count > max_dev_deps:
-            self.findings.append({
-                'severity': 'info',
-                'issue': f'High number of devDependencies ({dev_deps_count})',
-                'file': 'package.json',
-                'description': f'Project has {dev_deps_count} development dependencies (threshold: {max_dev_deps})',
-                'recommendation': 'Review devDependencies and remove unused development tools',
-                'category': 'Dependency Bloat'
-            })
+            self._emit(Finding(
+                severity='info',
+                issue=f'High number of devDependencies ({dev_deps_count})',
+                file='package.json',
+                description=f'Project has {dev_deps_count} development dependencies (threshold: {max_dev_deps})',
+                recommendation='Review devDependencies and remove unused development tools',
+                category='Dependency Bloat'
+            ))
 
     def _check_security_best_practices(self):
         """Check for dependency security best practices."""
-        package_json = self.project_root / 'package.json'
+        pkg = self._root_pkg
 
-        if not package_json.exists():
+        if pkg is None:
             return
 
-        with open(package_json, 'r') as f:
-            pkg = json.load(f)
-
         deps = pkg.get('dependencies', {})
 
         # Check for wildcards or loose version ranges
@@ -397,14 +545,14 @@ class DependenciesChecker:
 
         if loose_versions:
             for dep_name, version in loose_versions[:5]:  # Limit reporting
-                self.findings.append({
-                    'severity': 'warning',
-                    'issue': f'Loose version constraint: {dep_name}@{version}',
-                    'file': 'package.json',
-                    'description': f'Package "{dep_name}" uses loose version "{version}" which can lead to unexpected updates',
-                    'recommendation': 'Use specific version ranges (^x.y.z or ~x.y.z) instead of wildcards',
-                    'category': 'Security Best Practices'
-                })
+                self._emit(Finding(
+                    severity='warning',
+                    issue=f'Loose version constraint: {dep_name}@{version}',
+                    file='package.json',
+                    description=f'Package "{dep_name}" uses loose version "{version}" which can lead to unexpected updates',
+                    recommendation='Use specific version ranges (^x.y.z or ~x.y.z) instead of wildcards',
+                    category='Security Best Practices'
+                ))
 
         # Check for .npmrc file
         npmrc = self.project_root / '.npmrc'
@@ -414,11 +562,11 @@ class DependenciesChecker:
 
             # Check for save-exact
             if 'save-exact=true' in npmrc_content:
-                self.findings.append({
-                    'severity': 'info',
-                    'issue': 'Exact versions enforced',
-                    'file': '.npmrc',
-                    'description': 'save-exact=true is configured, ensuring exact version matches',
-                    'recommendation': 'Good practice for reproducible builds',
-                    'category': 'Security Best Practices'
-                })
+                self._emit(Finding(
+                    severity='info',
+                    issue='Exact versions enforced',
+                    file='.npmrc',
+                    description='save-exact=true is configured, ensuring exact version matches',
+                    recommendation='Good practice for reproducible builds',
+                    category='Security Best Practices'
+                ))
@@ -4,15 +4,181 @@ Documentation Checker
 Verifies that documentation in .claude/ matches actual code implementation.
 """
 
+import hashlib
 import os
+import pickle
+import re
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any, List
-import sys
-
-# Add parent to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from utils.file_parser import FileParser
+from typing import Dict, Any, List, Optional, Set, Tuple
+
+try:
+    import ahocorasick
+except ImportError:  # Optional; tech mentions then use plain substring checks
+    ahocorasick = None
+
+from ..utils.file_parser import FileParser
+from ..utils.findings import Finding
+from ..utils.package_json import load_package_json
+
+
+# Results of earlier runs, reused while none of their inputs have changed
+RESULT_CACHE = Path(__file__).parent.parent / '.cache' / 'docs-results.pkl'
+RESULT_CACHE_MAX_PROJECTS = 8
+
+# Every file the checks read, relative to the project root
+RELEVANT_FILES = (
+    '.claude/CLAUDE.md', '.claude/AUTH_IMPLEMENTATION.md', 'README.md',
+    'package.json', 'server/package.json',
+    'src/index.tsx', 'src/App.tsx', 'src/pages/Home.tsx', 'src/pages/About.tsx',
+    'server/index.ts', 'server/config/jwt.ts',
+    '.env.example', 'server/.env.example',
+)
+
+# File paths referenced in docs, e.g. server/config/jwt.ts
+FILE_PATH_RE = re.compile(r'(?:server|src)/[a-zA-Z0-9_/.-]+\.(?:ts|tsx|js|jsx)')
+# Version mentions such as "React 18" or "MUI v5"
+VERSION_MENTION_RE = re.compile(r'(React|MUI|Material-UI|Redux|Router)\s+v?(\d+)', re.IGNORECASE)
+# Lowercased literals one of which every version mention contains
+VERSION_MENTION_LITERALS = ('react', 'mui', 'material-ui', 'redux', 'router')
+NPM_COMMAND_RE = re.compile(r'npm (?:run )?(\w+)')
+ENV_VAR_RE = re.compile(r'`([A-Z_]+(?:_[A-Z_]+)*)`')
+# CLAUDE.md section anchors: markdown headers, and top-level bullets that
+# open with a bold label ("- **Routing**: ...")
+SECTION_ANCHOR_RE = re.compile(r'(#{1,6})\s+(.+?)\s*$|[-*]\s+\*\*(.+?)\*\*')
+BULLET_SECTION_RANK = 7  # Nested under any header
+# Section labels to look for, and the line range used when none is present
+PROVIDER_SECTIONS = ('providers', 'provider hierarchy', 'entry point')
+PROVIDER_FALLBACK_LINES = (46, 54)  # Lines 47-54 (0-indexed)
+ROUTING_SECTIONS = ('routing', 'routes')
+ROUTING_FALLBACK_LINES = (53, 60)  # Lines 54-60 (0-indexed)
+# Tech arrays rendered on the Home page
+TECH_ARRAYS_RE = re.compile(r'const (frontendTech|backendTech|devTools) = \[(.*?)\];', re.DOTALL)
+REACT_VERSION_RE = re.compile(r'React\s+(\d+)')
+# Route components the CLAUDE.md routing section may list, in report order.
+# No name's suffix is another's prefix, so one non-overlapping scan finds
+# every name that occurs.
+ROUTE_NAMES = ('Home', 'About', 'Dashboard', 'OpenRouter', 'Logs', 'Login', 'Signup', 'VerifyCode', 'Account')
+ROUTE_NAME_RE = re.compile('|'.join(re.escape(name) for name in ROUTE_NAMES))
+
+# Technologies CLAUDE.md may mention that README.md should cover too,
+# with the lowercased phrases that count as a mention
+CLAUDE_TECHS = {
+    'React Router': ['react-router', 'router'],
+    'Redux Toolkit': ['redux toolkit', '@reduxjs/toolkit'],
+    'TanStack Query': ['tanstack query', 'react-query'],
+    'Material-UI': ['mui', 'material-ui', '@mui'],
+    'OpenRouter': ['openrouter'],
+    'log4js': ['log4js', 'logging'],
+    'bcrypt': ['bcrypt'],
+    'JWT': ['jwt', 'json web token'],
+}
+
+# Tech names the About and Home pages may display, and the package each
+# needs (None for services that aren't packages)
+PAGE_TECH_PACKAGES = {
+    'React': 'react',
+    'MUI': '@mui/material',
+    'Material UI': '@mui/material',
+    'TypeScript': 'typescript',
+    'Redux': '@reduxjs/toolkit',
+    'Tailwind CSS': 'tailwindcss',
+    'TanStack Query': '@tanstack/react-query',
+    'Express': 'express',
+    'log4js': 'log4js',
+    'Morgan': 'morgan',
+    'Supabase': '@supabase/supabase-js',
+    'OpenRouter': None,  # Not a package, it's a service
+    'Webpack': 'webpack',
+    'Cypress': 'cypress'
+}
+
+
+def _build_automaton(phrases_by_name: Dict[str, List[str]]):
+    """Build an Aho-Corasick automaton mapping each phrase to its name, if available."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for name, phrases in phrases_by_name.items():
+        for phrase in phrases:
+            automaton.add_word(phrase, name)
+    automaton.make_automaton()
+    return automaton
+
+
+def _find_names(text: str, phrases_by_name: Dict[str, List[str]], automaton) -> Set[str]:
+    """
+    Find which names have at least one of their phrases in the text.
+
+    Args:
+        text: Content to scan
+        phrases_by_name: Name -> phrases that count as a mention
+        automaton: The table's automaton from _build_automaton, or None
+
+    Returns:
+        Names with at least one matching phrase
+    """
+    if automaton is not None:
+        return {name for _, name in automaton.iter(text)}
+    return {
+        name for name, phrases in phrases_by_name.items()
+        if any(phrase in text for phrase in phrases)
+    }
+
+
+CLAUDE_TECH_AUTOMATON = _build_automaton(CLAUDE_TECHS)
+PAGE_TECH_PHRASES = {name: [name] for name in PAGE_TECH_PACKAGES}
+PAGE_TECH_AUTOMATON = _build_automaton(PAGE_TECH_PHRASES)
+
+
+def _mentioned_techs(text_lower: str) -> Set[str]:
+    """
+    Find which CLAUDE_TECHS entries a document mentions.
+
+    Args:
+        text_lower: Lowercased document content
+
+    Returns:
+        Names of the technologies with at least one matching phrase
+    """
+    return _find_names(text_lower, CLAUDE_TECHS, CLAUDE_TECH_AUTOMATON)
+
+
+def _page_techs(text: str) -> Set[str]:
+    """Find which PAGE_TECH_PACKAGES names appear (case-sensitively) in the text."""
+    return _find_names(text, PAGE_TECH_PHRASES, PAGE_TECH_AUTOMATON)
+
+
+# FileParser results by (method, path, args) -> ((size, mtime_ns), result),
+# so a file that hasn't changed since an earlier run() isn't parsed again
+PARSE_CACHE: Dict[Tuple[str, str, Tuple[Any, ...]], Tuple[Tuple[int, int], Any]] = {}
+PARSE_CACHE_MAX_ENTRIES = 256
+# The checks run on a thread pool, so eviction and insertion happen together
+# under this lock
+PARSE_CACHE_LOCK = threading.Lock()
+
+# Threads for running the checks; they mostly wait on file reads
+CHECK_WORKERS = 8
+
+# The check logic itself, so editing it invalidates cached results
+CHECKER_SOURCES = (
+    Path(__file__),
+    Path(__file__).parent.parent / 'utils' / 'file_parser.py',
+    Path(__file__).parent.parent / 'utils' / 'findings.py',
+    Path(__file__).parent.parent / 'utils' / 'package_json.py',
+)
+
+
+@dataclass(frozen=True)
+class DocIndex:
+    """What the cross-document checks extract from a markdown file."""
+
+    npm_commands: Set[str]
+    env_vars: Set[str]
+    techs: Set[str]
 
 
 class DocumentationChecker:
@@ -29,7 +195,20 @@ class DocumentationChecker:
         self.project_root = Path(project_root)
         self.config = config
         self.parser = FileParser()
+        # READMEs shorter than this are too sparse to compare with CLAUDE.md
+        self.min_doc_size = config.get('thresholds', {}).get('min_doc_size', 200)
         self.findings = []
+        self._file_cache: Dict[Path, str] = {}
+        self._lower_cache: Dict[Path, str] = {}
+        self._claude: Optional[Tuple[List[str], str]] = None
+        self._claude_sections: Optional[Dict[str, Tuple[int, int]]] = None
+        self._index_cache: Dict[Path, DocIndex] = {}
+        # RELEVANT_FILES that exist, noted while hashing them
+        self._present: Set[str] = set()
+        # Directory listings by relative path, for other existence checks
+        self._dir_entries: Dict[str, Set[str]] = {}
+        # Existence of the files AUTH_IMPLEMENTATION.md refers to, by path
+        self._probes: Dict[str, bool] = {}
 
     def run(self) -> Dict[str, Any]:
         """
@@ -39,28 +218,51 @@ class DocumentationChecker:
             Dictionary with findings and metrics
         """
         self.findings = []
-
-        # Check CLAUDE.md accuracy
-        self._check_provider_hierarchy()
-        self._check_routing_documentation()
-        self._check_backend_routes()
-        self._check_environment_variables()
-
-        # Check AUTH_IMPLEMENTATION.md accuracy
-        self._check_auth_file_structure()
-        self._check_jwt_configuration()
-
-        # Check README.md accuracy
-        self._check_readme_scripts()
-        self._check_readme_tech_stack()
-        self._check_readme_claude_consistency()
-
-        # Check About.tsx and Home.tsx tech stack
-        self._check_page_tech_stacks()
+        # Start each run from what is on disk now
+        self._file_cache.clear()
+        self._lower_cache.clear()
+        self._claude = None
+        self._claude_sections = None
+        self._index_cache.clear()
+        self._present = set()
+        self._dir_entries = {}
+        self._probes = {}
+
+        digest = self._inputs_digest()
+        cached = self._load_cached_result(digest)
+        if cached is not None:
+            return cached
+
+        checks = (
+            # Check CLAUDE.md accuracy
+            self._check_provider_hierarchy,
+            self._check_routing_documentation,
+            self._check_backend_routes,
+            self._check_environment_variables,
+
+            # Check AUTH_IMPLEMENTATION.md accuracy
+            self._check_auth_file_structure,
+            self._check_jwt_configuration,
+
+            # Check README.md accuracy
+            self._check_readme_scripts,
+            self._check_readme_tech_stack,
+            self._check_readme_claude_consistency,
+
+            # Check About.tsx and Home.tsx tech stack
+            self._check_page_tech_stacks,
+        )
+
+        # The checks are independent; each returns its own findings, which
+        # are concatenated in the order above
+        with ThreadPoolExecutor(max_workers=min(CHECK_WORKERS, len(checks))) as pool:
+            for findings in pool.map(lambda check: check(), checks):
+                self.findings.extend(findings)
 
         # Determine status
-        critical = len([f for f in self.findings if f['severity'] == 'critical'])
-        warning = len([f for f in self.findings if f['severity'] == 'warning'])
+        severity_counts = Counter(f.severity for f in self.findings)
+        critical = severity_counts['critical']
+        warning = severity_counts['warning']
 
         if critical > 0:
             status = 'critical'
@@ -69,7 +271,7 @@ class DocumentationChecker:
         else:
             status = 'pass'
 
-        return {
+        result = {
             'category': 'docs',
             'status': status,
             'findings': self.findings,
@@ -79,82 +281,306 @@ class DocumentationChecker:
                 'discrepancies': len(self.findings)
             }
         }
+        self._store_result(digest, result)
+        return result
+
+    def _inputs_digest(self) -> str:
+        """
+        Hash everything the checks depend on.
+
+        Covers the contents (or absence) of RELEVANT_FILES, the checker
+        sources and the configured thresholds. Files that AUTH_IMPLEMENTATION.md mentions are only checked
+        for existence, which _load_cached_result verifies separately.
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        h = hashlib.sha256()
+        h.update(b'%d\0' % self.min_doc_size)
+        for path in CHECKER_SOURCES:
+            h.update(path.read_bytes())
+        for rel in RELEVANT_FILES:
+            h.update(rel.encode('utf-8') + b'\0')
+            try:
+                data = (self.project_root / rel).read_bytes()
+            except OSError:
+                h.update(b'-')
+                continue
+            self._present.add(rel)
+            h.update(b'%d\0' % len(data))
+            h.update(data)
+        return h.hexdigest()
+
+    def _load_cached_result(self, digest: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the stored result for this project if its inputs are unchanged.
+
+        Args:
+            digest: Current digest from _inputs_digest()
+
+        Returns:
+            The cached result dictionary, or None on a miss
+        """
+        try:
+            with open(RESULT_CACHE, 'rb') as f:
+                cached_digest, probes, result = pickle.load(f)[str(self.project_root)]
+        except (OSError, pickle.UnpicklingError, EOFError, KeyError, ValueError,
+                TypeError, AttributeError):
+            return None
+
+        if cached_digest != digest:
+            return None
+        if any(self._exists(self.project_root / path) != existed for path, existed in probes.items()):
+            return None
+        return result
+
+    def _store_result(self, digest: str, result: Dict[str, Any]):
+        """Save a run's result for _load_cached_result (temp file + rename)."""
+        try:
+            with open(RESULT_CACHE, 'rb') as f:
+                entries = pickle.load(f)
+            if not isinstance(entries, dict):
+                entries = {}
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError, AttributeError):
+            entries = {}
+
+        key = str(self.project_root)
+        entries.pop(key, None)
+        entries[key] = (digest, self._probes, result)
+        # Keep only the most recently reviewed projects
+        for old_key in list(entries)[:-RESULT_CACHE_MAX_PROJECTS]:
+            del entries[old_key]
+
+        tmp = RESULT_CACHE.with_name(f'{RESULT_CACHE.name}.{os.getpid()}.tmp')
+        try:
+            RESULT_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp, 'wb') as f:
+                pickle.dump(entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, RESULT_CACHE)
+        except OSError:
+            pass
+
+    def _exists(self, path: Path) -> bool:
+        """
+        Check whether a file under the project root exists, without a stat per call.
+
+        RELEVANT_FILES are answered from what _inputs_digest found; anything
+        else from a listing of its directory, taken once per run.
+
+        Args:
+            path: Path inside the project root
+
+        Returns:
+            True if the file exists
+        """
+        rel = os.path.relpath(path, self.project_root).replace(os.sep, '/')
+        if rel in RELEVANT_FILES:
+            return rel in self._present
+        if rel.startswith('../'):
+            return Path(path).exists()
+
+        parent, _, name = rel.rpartition('/')
+        names = self._dir_entries.get(parent)
+        if names is None:
+            try:
+                names = set(os.listdir(self.project_root / parent))
+            except OSError:
+                names = set()
+            self._dir_entries[parent] = names
+        return name in names
+
+    def _read(self, path: Path) -> str:
+        """
+        Read a file, caching its contents for the rest of the run.
+
+        Several checks read the same docs (CLAUDE.md, README.md, ...), so
+        each is read from disk once per run(). Files are decoded as UTF-8
+        regardless of locale; errors propagate as they would from
+        Path.read_text().
+        """
+        content = self._file_cache.get(path)
+        if content is None:
+            content = path.read_text(encoding='utf-8')
+            self._file_cache[path] = content
+        return content
+
+    def _read_lower(self, path: Path) -> str:
+        """Lowercased contents of a file read through _read, cached for the run."""
+        content = self._lower_cache.get(path)
+        if content is None:
+            content = self._read(path).lower()
+            self._lower_cache[path] = content
+        return content
+
+    def _get_claude(self) -> Tuple[List[str], str]:
+        """
+        CLAUDE.md split into lines, along with its full content.
+
+        The line-numbered checks all index into the same split, so it is
+        done once per run().
+
+        Returns:
+            Tuple of (lines, content)
+        """
+        if self._claude is None:
+            content = self._read(self.project_root / '.claude' / 'CLAUDE.md')
+            self._claude = (content.split('\n'), content)
+        return self._claude
+
+    def _get_claude_sections(self) -> Dict[str, Tuple[int, int]]:
+        """
+        Index CLAUDE.md sections by label in one pass over its lines.
+
+        A section runs from its anchor to the next anchor of the same or
+        higher rank (headers outrank bullet labels; '#' outranks '##').
+        Anchors inside fenced code blocks are ignored, and the first
+        section with a given label wins.
+
+        Returns:
+            Lowercased label -> (start, end) line indices
+        """
+        if self._claude_sections is None:
+            lines, _ = self._get_claude()
+            anchors = []  # (line index, rank, label)
+            in_fence = False
+            for i, line in enumerate(lines):
+                if line.startswith('```'):
+                    in_fence = not in_fence
+                    continue
+                m = None if in_fence else SECTION_ANCHOR_RE.match(line)
+                if m:
+                    if m.group(1):
+                        anchors.append((i, len(m.group(1)), m.group(2)))
+                    else:
+                        anchors.append((i, BULLET_SECTION_RANK, m.group(3)))
+
+            sections = {}
+            for k, (start, rank, label) in enumerate(anchors):
+                end = next((i for i, r, _ in anchors[k + 1:] if r <= rank), len(lines))
+                sections.setdefault(label.strip().rstrip(':').lower(), (start, end))
+            self._claude_sections = sections
+        return self._claude_sections
+
+    def _claude_section(self, names: Tuple[str, ...],
+                        fallback: Tuple[int, int]) -> Tuple[List[str], int]:
+        """
+        Lines of the first CLAUDE.md section found under any of the given labels.
+
+        Args:
+            names: Lowercased section labels, in order of preference
+            fallback: Line range to use if none of them is present
+
+        Returns:
+            Tuple of (section lines, 1-based line number of the first one)
+        """
+        lines, _ = self._get_claude()
+        sections = self._get_claude_sections()
+        start, end = next((sections[name] for name in names if name in sections), fallback)
+        return lines[start:end], start + 1
+
+    def _parse(self, method: str, path: Path, *args: Any) -> Any:
+        """
+        Call a FileParser method, reusing its result while the file is unchanged.
 
-    def _check_provider_hierarchy(self):
+        Args:
+            method: Name of the FileParser method
+            path: File to parse
+            *args: Extra arguments for the method
+
+        Returns:
+            The method's result, which must be treated as read-only
+        """
+        path = str(path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            # Let the parser report the missing file as usual
+            return getattr(self.parser, method)(path, *args)
+
+        key = (method, path, args)
+        stamp = (st.st_size, st.st_mtime_ns)
+        cached = PARSE_CACHE.get(key)
+        if cached and cached[0] == stamp:
+            return cached[1]
+
+        result = getattr(self.parser, method)(path, *args)
+        with PARSE_CACHE_LOCK:
+            if key not in PARSE_CACHE and len(PARSE_CACHE) >= PARSE_CACHE_MAX_ENTRIES:
+                PARSE_CACHE.pop(next(iter(PARSE_CACHE)))
+            PARSE_CACHE[key] = (stamp, result)
+        return result
+
+    def _doc_index(self, path: Path) -> DocIndex:
+        """Scan a doc for npm commands, env vars and tech mentions, once per run."""
+        index = self._index_cache.get(path)
+        if index is None:
+            content = self._read(path)
+            index = DocIndex(
+                npm_commands=set(NPM_COMMAND_RE.findall(content)),
+                env_vars=set(ENV_VAR_RE.findall(content)),
+                techs=_mentioned_techs(self._read_lower(path)),
+            )
+            self._index_cache[path] = index
+        return index
+
+    def _check_provider_hierarchy(self) -> List[Finding]:
         """Check if CLAUDE.md provider hierarchy matches src/index.tsx."""
+        findings: List[Finding] = []
         try:
             # Read actual provider hierarchy from src/index.tsx
             index_file = self.project_root / 'src' / 'index.tsx'
-            jsx_tree = self.parser.extract_jsx_tree(str(index_file))
+            jsx_tree = self._parse('extract_jsx_tree', index_file)
 
             if jsx_tree:
                 # Check for AuthProvider
                 if 'AuthProvider' in jsx_tree:
                     # AuthProvider exists but may not be in docs
-                    claude_md = self.project_root / '.claude' / 'CLAUDE.md'
-                    with open(claude_md, 'r') as f:
-                        content = f.read()
-
-                    # Check lines 47-54 for provider list
-                    lines = content.split('\n')
-                    provider_section = '\n'.join(lines[46:54])  # Lines 47-54 (0-indexed)
+                    # Find the provider list by its label rather than a fixed line
+                    section_lines, line = self._claude_section(PROVIDER_SECTIONS, PROVIDER_FALLBACK_LINES)
+                    provider_section = '\n'.join(section_lines)
 
                     if 'AuthProvider' not in provider_section and 'AuthContext' not in provider_section:
-                        self.findings.append({
-                            'severity': 'warning',
-                            'issue': 'Missing AuthProvider in CLAUDE.md provider hierarchy',
-                            'file': '.claude/CLAUDE.md',
-                            'line': 47,
-                            'description': 'The provider hierarchy documentation does not mention AuthProvider, but it exists in the code.',
-                            'actual': 'Provider hierarchy includes: Redux, QueryClient, BrowserRouter, ThemeProvider, CssBaseline, AuthProvider',
-                            'documented': 'Provider hierarchy lists: Redux, QueryClient, BrowserRouter, ThemeProvider, CssBaseline (missing AuthProvider)',
-                            'recommendation': 'Add AuthProvider to the provider hierarchy list in CLAUDE.md around line 52'
-                        })
+                        findings.append(Finding(
+                            severity='warning',
+                            issue='Missing AuthProvider in CLAUDE.md provider hierarchy',
+                            file='.claude/CLAUDE.md',
+                            line=line,
+                            description='The provider hierarchy documentation does not mention AuthProvider, but it exists in the code.',
+                            actual='Provider hierarchy includes: Redux, QueryClient, BrowserRouter, ThemeProvider, CssBaseline, AuthProvider',
+                            documented='Provider hierarchy lists: Redux, QueryClient, BrowserRouter, ThemeProvider, CssBaseline (missing AuthProvider)',
+                            recommendation=f'Add AuthProvider to the provider hierarchy list in CLAUDE.md around line {line}'
+                        ))
 
         except Exception as e:
             print(f"[documentation] Error checking provider hierarchy: {e}")
 
-    def _check_routing_documentation(self):
+        return findings
+
+    def _check_routing_documentation(self) -> List[Finding]:
         """Check if routing documentation matches App.tsx."""
+        findings: List[Finding] = []
         try:
             app_file = self.project_root / 'src' / 'App.tsx'
-            routes = self.parser.extract_routes(str(app_file))
+            routes = self._parse('extract_routes', app_file)
 
             if routes:
                 # Count actual routes
                 actual_routes = [r['element'] for r in routes]
                 actual_count = len(actual_routes)
 
-                # Check CLAUDE.md routing section (lines 54-60, handles multi-line format)
-                claude_md = self.project_root / '.claude' / 'CLAUDE.md'
-                with open(claude_md, 'r') as f:
-                    lines = f.readlines()
+                # Check CLAUDE.md routing section (handles multi-line format)
+                section_lines, line = self._claude_section(ROUTING_SECTIONS, ROUTING_FALLBACK_LINES)
 
-                if len(lines) > 53:
+                if section_lines:
                     # Read routing section (may span multiple lines)
-                    routing_section = '\n'.join([l.strip() for l in lines[53:60]])
+                    routing_section = '\n'.join([l.strip() for l in section_lines])
 
                     # Extract mentioned routes from documentation
                     # Handles both single-line and multi-line formats
-                    documented_routes = []
-                    if 'Home' in routing_section:
-                        documented_routes.append('Home')
-                    if 'About' in routing_section:
-                        documented_routes.append('About')
-                    if 'Dashboard' in routing_section:
-                        documented_routes.append('Dashboard')
-                    if 'OpenRouter' in routing_section:
-                        documented_routes.append('OpenRouter')
-                    if 'Logs' in routing_section:
-                        documented_routes.append('Logs')
-                    if 'Login' in routing_section:
-                        documented_routes.append('Login')
-                    if 'Signup' in routing_section:
-                        documented_routes.append('Signup')
-                    if 'VerifyCode' in routing_section or 'verify' in routing_section.lower():
-                        documented_routes.append('VerifyCode')
-                    if 'Account' in routing_section:
-                        documented_routes.append('Account')
+                    found = set(ROUTE_NAME_RE.findall(routing_section))
+                    if 'verify' in routing_section.lower():
+                        found.add('VerifyCode')
+                    documented_routes = [name for name in ROUTE_NAMES if name in found]
 
                     documented_count = len(documented_routes)
 
@@ -169,188 +595,196 @@ class DocumentationChecker:
 
                     # Normalize both lists for comparison
                     normalized_actual = [normalize_route_name(r) for r in actual_routes]
-                    normalized_documented = [normalize_route_name(r) for r in documented_routes]
+                    normalized_documented = {normalize_route_name(r) for r in documented_routes}
 
                     # Check for missing routes (using normalized names)
                     missing_routes = [actual_routes[i] for i, norm in enumerate(normalized_actual)
                                      if norm not in normalized_documented]
 
                     if missing_routes or actual_count != documented_count:
-                        self.findings.append({
-                            'severity': 'warning',
-                            'issue': 'Incomplete routing documentation',
-                            'file': '.claude/CLAUDE.md',
-                            'line': 54,
-                            'description': f'Documentation lists {documented_count} routes but codebase has {actual_count} routes.',
-                            'actual': f'{actual_count} routes: {", ".join(actual_routes)}',
-                            'documented': f'{documented_count} routes: {", ".join(documented_routes)}',
-                            'recommendation': f'Update line 54 to include all routes: {", ".join(actual_routes)}'
-                        })
+                        findings.append(Finding(
+                            severity='warning',
+                            issue='Incomplete routing documentation',
+                            file='.claude/CLAUDE.md',
+                            line=line,
+                            description=f'Documentation lists {documented_count} routes but codebase has {actual_count} routes.',
+                            actual=f'{actual_count} routes: {", ".join(actual_routes)}',
+                            documented=f'{documented_count} routes: {", ".join(documented_routes)}',
+                            recommendation=f'Update line {line} to include all routes: {", ".join(actual_routes)}'
+                        ))
 
         except Exception as e:
             print(f"[documentation] Error checking routing: {e}")
 
-    def _check_backend_routes(self):
+        return findings
+
+    def _check_backend_routes(self) -> List[Finding]:
         """Check if backend routes documentation matches server/index.ts."""
+        findings: List[Finding] = []
         try:
             server_file = self.project_root / 'server' / 'index.ts'
-            routes = self.parser.extract_app_use_routes(str(server_file))
+            routes = self._parse('extract_app_use_routes', server_file)
 
             if routes:
                 # Check if /api/auth is in routes
                 has_auth_route = any('/api/auth' in r or '/auth' in r for r in routes)
 
                 # Check CLAUDE.md line 72
-                claude_md = self.project_root / '.claude' / 'CLAUDE.md'
-                with open(claude_md, 'r') as f:
-                    content = f.read()
+                _, content = self._get_claude()
 
                 # Look for backend routes documentation
-                if '/api/auth' not in content[:5000]:  # Check first part of doc
+                if content.find('/api/auth', 0, 5000) == -1:  # Check first part of doc
                     if has_auth_route:
-                        self.findings.append({
-                            'severity': 'warning',
-                            'issue': 'Missing /api/auth in backend routes documentation',
-                            'file': '.claude/CLAUDE.md',
-                            'line': 72,
-                            'description': 'The backend routes section does not mention /api/auth endpoint.',
-                            'actual': f'Routes include: {", ".join(routes)}',
-                            'documented': 'Routes listed do not include /api/auth',
-                            'recommendation': 'Add /api/auth to the backend routes list'
-                        })
+                        findings.append(Finding(
+                            severity='warning',
+                            issue='Missing /api/auth in backend routes documentation',
+                            file='.claude/CLAUDE.md',
+                            line=72,
+                            description='The backend routes section does not mention /api/auth endpoint.',
+                            actual=f'Routes include: {", ".join(routes)}',
+                            documented='Routes listed do not include /api/auth',
+                            recommendation='Add /api/auth to the backend routes list'
+                        ))
 
         except Exception as e:
             print(f"[documentation] Error checking backend routes: {e}")
 
-    def _check_environment_variables(self):
+        return findings
+
+    def _check_environment_variables(self) -> List[Finding]:
         """Check if environment variables match between docs and .env.example."""
+        findings: List[Finding] = []
         try:
             # Get env vars from .env.example
             env_file = self.project_root / '.env.example'
             server_env_file = self.project_root / 'server' / '.env.example'
 
             actual_vars = set()
-            if env_file.exists():
-                actual_vars.update(self.parser.extract_env_variables(str(env_file)))
-            if server_env_file.exists():
-                actual_vars.update(self.parser.extract_env_variables(str(server_env_file)))
+            if self._exists(env_file):
+                actual_vars.update(self._parse('extract_env_variables', env_file))
+            if self._exists(server_env_file):
+                actual_vars.update(self._parse('extract_env_variables', server_env_file))
 
             # Check for JWT variables
             jwt_vars = [v for v in actual_vars if 'JWT' in v]
 
             # Check CLAUDE.md
-            claude_md = self.project_root / '.claude' / 'CLAUDE.md'
-            with open(claude_md, 'r') as f:
-                content = f.read()
+            _, content = self._get_claude()
 
             # Check if JWT vars are documented
             missing_jwt_vars = [v for v in jwt_vars if v not in content]
 
             if missing_jwt_vars:
-                self.findings.append({
-                    'severity': 'info',
-                    'issue': 'JWT environment variables not documented in CLAUDE.md',
-                    'file': '.claude/CLAUDE.md',
-                    'description': 'Some JWT-related environment variables are not mentioned in the documentation.',
-                    'actual': f'JWT variables in .env.example: {", ".join(jwt_vars)}',
-                    'documented': 'JWT variables may not be fully documented',
-                    'recommendation': 'Consider adding JWT_ACCESS_SECRET, JWT_REFRESH_SECRET to environment variables section'
-                })
+                findings.append(Finding(
+                    severity='info',
+                    issue='JWT environment variables not documented in CLAUDE.md',
+                    file='.claude/CLAUDE.md',
+                    description='Some JWT-related environment variables are not mentioned in the documentation.',
+                    actual=f'JWT variables in .env.example: {", ".join(jwt_vars)}',
+                    documented='JWT variables may not be fully documented',
+                    recommendation='Consider adding JWT_ACCESS_SECRET, JWT_REFRESH_SECRET to environment variables section'
+                ))
 
         except Exception as e:
             print(f"[documentation] Error checking env variables: {e}")
 
-    def _check_auth_file_structure(self):
+        return findings
+
+    def _check_auth_file_structure(self) -> List[Finding]:
         """Check if all files listed in AUTH_IMPLEMENTATION.md actually exist."""
+        findings: List[Finding] = []
         try:
             auth_doc = self.project_root / '.claude' / 'AUTH_IMPLEMENTATION.md'
-            if not auth_doc.exists():
-                return
+            if not self._exists(auth_doc):
+                return findings
 
-            with open(auth_doc, 'r') as f:
-                content = f.read()
+            content = self._read(auth_doc)
 
             # Extract file paths from documentation
             # Look for common patterns like server/config/jwt.ts, server/controllers/auth.controller.ts, etc.
-            import re
-            file_pattern = r'(?:server|src)/[a-zA-Z0-9_/.-]+\.(?:ts|tsx|js|jsx)'
-            potential_files = re.findall(file_pattern, content)
+            if 'server/' in content or 'src/' in content:
+                potential_files = FILE_PATH_RE.findall(content)
+            else:
+                potential_files = []
 
             # Check if files exist
             missing_files = []
             for file_path in set(potential_files):
                 full_path = self.project_root / file_path
-                if not full_path.exists():
+                exists = self._exists(full_path)
+                self._probes[file_path] = exists
+                if not exists:
                     missing_files.append(file_path)
 
             if missing_files:
-                self.findings.append({
-                    'severity': 'warning',
-                    'issue': 'Missing files listed in AUTH_IMPLEMENTATION.md',
-                    'file': '.claude/AUTH_IMPLEMENTATION.md',
-                    'description': 'Some files mentioned in documentation do not exist in the codebase.',
-                    'actual': f'Missing files: {", ".join(missing_files)}',
-                    'recommendation': 'Remove references to non-existent files or create the missing files'
-                })
+                findings.append(Finding(
+                    severity='warning',
+                    issue='Missing files listed in AUTH_IMPLEMENTATION.md',
+                    file='.claude/AUTH_IMPLEMENTATION.md',
+                    description='Some files mentioned in documentation do not exist in the codebase.',
+                    actual=f'Missing files: {", ".join(missing_files)}',
+                    recommendation='Remove references to non-existent files or create the missing files'
+                ))
 
         except Exception as e:
             print(f"[documentation] Error checking auth file structure: {e}")
 
-    def _check_jwt_configuration(self):
+        return findings
+
+    def _check_jwt_configuration(self) -> List[Finding]:
         """Check JWT token expiry configuration matches documentation."""
+        findings: List[Finding] = []
         try:
             # Read actual JWT config
             jwt_config = self.project_root / 'server' / 'config' / 'jwt.ts'
-            if not jwt_config.exists():
-                return
+            if not self._exists(jwt_config):
+                return findings
 
-            refresh_expiry = self.parser.extract_config_value(str(jwt_config), 'refreshTokenExpiry')
+            refresh_expiry = self._parse('extract_config_value', jwt_config, 'refreshTokenExpiry')
 
             if refresh_expiry:
                 # Check AUTH_IMPLEMENTATION.md
                 auth_doc = self.project_root / '.claude' / 'AUTH_IMPLEMENTATION.md'
-                if auth_doc.exists():
-                    with open(auth_doc, 'r') as f:
-                        content = f.read()
+                if self._exists(auth_doc):
+                    content = self._read(auth_doc)
 
                     # Check for discrepancy between documented (7 days) and actual (1 day)
                     if '7 days' in content or '7d' in content:
                         if refresh_expiry == '1d' or refresh_expiry == "'1d'":
-                            self.findings.append({
-                                'severity': 'critical',
-                                'issue': 'JWT refresh token expiry mismatch',
-                                'file': '.claude/AUTH_IMPLEMENTATION.md',
-                                'description': 'Documentation states refresh token expires in 7 days, but code has 1 day.',
-                                'actual': f'Refresh token expiry: 1 day (server/config/jwt.ts:6)',
-                                'documented': 'Refresh token expiry: 7 days',
-                                'recommendation': 'Update code to use 7d OR update documentation to reflect 1d. This is a security configuration that should match documentation.'
-                            })
+                            findings.append(Finding(
+                                severity='critical',
+                                issue='JWT refresh token expiry mismatch',
+                                file='.claude/AUTH_IMPLEMENTATION.md',
+                                description='Documentation states refresh token expires in 7 days, but code has 1 day.',
+                                actual=f'Refresh token expiry: 1 day (server/config/jwt.ts:6)',
+                                documented='Refresh token expiry: 7 days',
+                                recommendation='Update code to use 7d OR update documentation to reflect 1d. This is a security configuration that should match documentation.'
+                            ))
 
         except Exception as e:
             print(f"[documentation] Error checking JWT configuration: {e}")
 
-    def _check_readme_scripts(self):
+        return findings
+
+    def _check_readme_scripts(self) -> List[Finding]:
         """Check if npm scripts in README.md match package.json."""
+        findings: List[Finding] = []
         try:
-            import json
-
             # Read package.json
             package_json = self.project_root / 'package.json'
-            if not package_json.exists():
-                return
+            if not self._exists(package_json):
+                return findings
 
-            with open(package_json, 'r') as f:
-                pkg_data = json.load(f)
+            pkg_data = load_package_json(package_json)
 
             actual_scripts = pkg_data.get('scripts', {})
 
             # Read README.md
             readme = self.project_root / 'README.md'
-            if not readme.exists():
-                return
+            if not self._exists(readme):
+                return findings
 
-            with open(readme, 'r') as f:
-                readme_content = f.read()
+            readme_content = self._read(readme)
 
             # Check for common scripts that should be documented
             important_scripts = ['start', 'build', 'test', 'dev', 'server']
@@ -363,31 +797,31 @@ class DocumentationChecker:
                         missing_from_readme.append(script)
 
             if missing_from_readme:
-                self.findings.append({
-                    'severity': 'info',
-                    'issue': 'npm scripts not documented in README.md',
-                    'file': 'README.md',
-                    'description': 'Some npm scripts exist in package.json but are not documented in README.md.',
-                    'actual': f'Scripts in package.json: {", ".join(missing_from_readme)}',
-                    'documented': 'Missing from README.md',
-                    'recommendation': f'Add documentation for: {", ".join(missing_from_readme)}'
-                })
+                findings.append(Finding(
+                    severity='info',
+                    issue='npm scripts not documented in README.md',
+                    file='README.md',
+                    description='Some npm scripts exist in package.json but are not documented in README.md.',
+                    actual=f'Scripts in package.json: {", ".join(missing_from_readme)}',
+                    documented='Missing from README.md',
+                    recommendation=f'Add documentation for: {", ".join(missing_from_readme)}'
+                ))
 
         except Exception as e:
             print(f"[documentation] Error checking README scripts: {e}")
 
-    def _check_readme_tech_stack(self):
+        return findings
+
+    def _check_readme_tech_stack(self) -> List[Finding]:
         """Check if tech stack in README.md matches package.json dependencies."""
+        findings: List[Finding] = []
         try:
-            import json
-
             # Read package.json
             package_json = self.project_root / 'package.json'
-            if not package_json.exists():
-                return
+            if not self._exists(package_json):
+                return findings
 
-            with open(package_json, 'r') as f:
-                pkg_data = json.load(f)
+            pkg_data = load_package_json(package_json)
 
             dependencies = pkg_data.get('dependencies', {})
 
@@ -403,47 +837,50 @@ class DocumentationChecker:
 
             # Read README.md
             readme = self.project_root / 'README.md'
-            if not readme.exists():
-                return
+            if not self._exists(readme):
+                return findings
 
-            with open(readme, 'r') as f:
-                readme_content = f.read()
+            readme_content = self._read(readme)
+            readme_lower = self._read_lower(readme)
 
             # Check which technologies are missing from README
             missing_tech = []
             for pkg, name in key_tech.items():
                 if pkg in dependencies:
                     # Check if mentioned in README (flexible matching)
-                    if name.lower() not in readme_content.lower():
+                    if name.lower() not in readme_lower:
                         missing_tech.append(name)
 
             if missing_tech:
-                self.findings.append({
-                    'severity': 'info',
-                    'issue': 'Technology stack not fully documented in README.md',
-                    'file': 'README.md',
-                    'description': 'Some major dependencies are not mentioned in the README tech stack section.',
-                    'actual': f'Technologies in use: {", ".join(missing_tech)}',
-                    'documented': 'Missing from README.md tech stack',
-                    'recommendation': f'Consider adding: {", ".join(missing_tech)}'
-                })
+                findings.append(Finding(
+                    severity='info',
+                    issue='Technology stack not fully documented in README.md',
+                    file='README.md',
+                    description='Some major dependencies are not mentioned in the README tech stack section.',
+                    actual=f'Technologies in use: {", ".join(missing_tech)}',
+                    documented='Missing from README.md tech stack',
+                    recommendation=f'Consider adding: {", ".join(missing_tech)}'
+                ))
 
             # Check for outdated versions mentioned
             # Extract version numbers from README (pattern: React 18, MUI v5, etc.)
-            import re
-            version_pattern = r'(React|MUI|Material-UI|Redux|Router)\s+v?(\d+)'
-            version_mentions = re.findall(version_pattern, readme_content, re.IGNORECASE)
+            # Skip the regex scan when no tech name appears at all
+            if any(k in readme_lower for k in VERSION_MENTION_LITERALS):
+                version_mentions = VERSION_MENTION_RE.findall(readme_content)
+            else:
+                version_mentions = []
 
             for tech, version in version_mentions:
                 # Map tech names to package names
                 pkg_name = None
-                if 'react' in tech.lower() and 'router' not in tech.lower():
+                tech_lower = tech.lower()
+                if 'react' in tech_lower and 'router' not in tech_lower:
                     pkg_name = 'react'
-                elif 'mui' in tech.lower() or 'material' in tech.lower():
+                elif 'mui' in tech_lower or 'material' in tech_lower:
                     pkg_name = '@mui/material'
-                elif 'redux' in tech.lower():
+                elif 'redux' in tech_lower:
                     pkg_name = '@reduxjs/toolkit'
-                elif 'router' in tech.lower():
+                elif 'router' in tech_lower:
                     pkg_name = 'react-router-dom'
 
                 if pkg_name and pkg_name in dependencies:
@@ -451,76 +888,71 @@ class DocumentationChecker:
                     major_version = actual_version.split('.')[0]
 
                     if version != major_version:
-                        self.findings.append({
-                            'severity': 'warning',
-                            'issue': f'{tech} version mismatch in README.md',
-                            'file': 'README.md',
-                            'description': f'README mentions {tech} {version} but package.json has version {actual_version}',
-                            'actual': f'{tech} version: {actual_version}',
-                            'documented': f'{tech} version: {version}',
-                            'recommendation': f'Update README to reflect {tech} version {major_version}'
-                        })
+                        findings.append(Finding(
+                            severity='warning',
+                            issue=f'{tech} version mismatch in README.md',
+                            file='README.md',
+                            description=f'README mentions {tech} {version} but package.json has version {actual_version}',
+                            actual=f'{tech} version: {actual_version}',
+                            documented=f'{tech} version: {version}',
+                            recommendation=f'Update README to reflect {tech} version {major_version}'
+                        ))
 
         except Exception as e:
             print(f"[documentation] Error checking README tech stack: {e}")
 
-    def _check_readme_claude_consistency(self):
+        return findings
+
+    def _check_readme_claude_consistency(self) -> List[Finding]:
         """Check if README.md is consistent with CLAUDE.md."""
+        findings: List[Finding] = []
         try:
             # Read both files
             readme = self.project_root / 'README.md'
             claude_md = self.project_root / '.claude' / 'CLAUDE.md'
 
-            if not readme.exists() or not claude_md.exists():
-                return
-
-            with open(readme, 'r') as f:
-                readme_content = f.read()
+            if not self._exists(readme) or not self._exists(claude_md):
+                return findings
+
+            # A stub README can't be consistent with anything; say so once
+            # rather than listing everything CLAUDE.md covers
+            readme_size = len(self._read(readme))
+            if readme_size < self.min_doc_size:
+                findings.append(Finding(
+                    severity='info',
+                    issue='README.md too short for consistency check',
+                    file='README.md',
+                    description='README.md is too short to compare against CLAUDE.md.',
+                    actual=f'README.md has {readme_size} characters',
+                    expected=f'At least {self.min_doc_size} characters',
+                    recommendation='Expand README.md with setup instructions, scripts and the tech stack'
+                ))
+                return findings
+
+            readme_index = self._doc_index(readme)
+            claude_index = self._doc_index(claude_md)
 
-            with open(claude_md, 'r') as f:
-                claude_content = f.read()
-
-            # Extract tech stacks from CLAUDE.md
             # Look for key technologies mentioned in CLAUDE.md that should be in README
-            claude_techs = {
-                'React Router': ['react-router', 'router'],
-                'Redux Toolkit': ['redux toolkit', '@reduxjs/toolkit'],
-                'TanStack Query': ['tanstack query', 'react-query'],
-                'Material-UI': ['mui', 'material-ui', '@mui'],
-                'OpenRouter': ['openrouter'],
-                'log4js': ['log4js', 'logging'],
-                'bcrypt': ['bcrypt'],
-                'JWT': ['jwt', 'json web token'],
-            }
-
-            missing_from_readme = []
-            for tech_name, patterns in claude_techs.items():
-                # Check if mentioned in CLAUDE.md
-                claude_mentions = any(pattern in claude_content.lower() for pattern in patterns)
-
-                if claude_mentions:
-                    # Check if also mentioned in README
-                    readme_mentions = any(pattern in readme_content.lower() for pattern in patterns)
-
-                    if not readme_mentions:
-                        missing_from_readme.append(tech_name)
+            missing_from_readme = [
+                tech_name for tech_name in CLAUDE_TECHS
+                if tech_name in claude_index.techs and tech_name not in readme_index.techs
+            ]
 
             if missing_from_readme:
-                self.findings.append({
-                    'severity': 'warning',
-                    'issue': 'README.md missing technologies documented in CLAUDE.md',
-                    'file': 'README.md',
-                    'description': 'Technologies mentioned in CLAUDE.md are not documented in README.md.',
-                    'actual': f'CLAUDE.md documents: {", ".join(missing_from_readme)}',
-                    'documented': 'Missing from README.md',
-                    'recommendation': f'Add to README.md tech stack section: {", ".join(missing_from_readme)}'
-                })
+                findings.append(Finding(
+                    severity='warning',
+                    issue='README.md missing technologies documented in CLAUDE.md',
+                    file='README.md',
+                    description='Technologies mentioned in CLAUDE.md are not documented in README.md.',
+                    actual=f'CLAUDE.md documents: {", ".join(missing_from_readme)}',
+                    documented='Missing from README.md',
+                    recommendation=f'Add to README.md tech stack section: {", ".join(missing_from_readme)}'
+                ))
 
             # Check development commands consistency
             # Extract commands from CLAUDE.md
-            import re
-            claude_commands = set(re.findall(r'npm (?:run )?(\w+)', claude_content))
-            readme_commands = set(re.findall(r'npm (?:run )?(\w+)', readme_content))
+            claude_commands = claude_index.npm_commands
+            readme_commands = readme_index.npm_commands
 
             # Commands in CLAUDE.md but not in README
             missing_commands = claude_commands - readme_commands
@@ -530,20 +962,20 @@ class DocumentationChecker:
                 missing_important = missing_commands & important_commands
 
                 if missing_important:
-                    self.findings.append({
-                        'severity': 'info',
-                        'issue': 'README.md missing npm scripts from CLAUDE.md',
-                        'file': 'README.md',
-                        'description': 'Some npm commands documented in CLAUDE.md are not in README.md.',
-                        'actual': f'CLAUDE.md documents: npm {", npm ".join(sorted(missing_important))}',
-                        'documented': 'Missing from README.md',
-                        'recommendation': f'Add command documentation to README.md: {", ".join(sorted(missing_important))}'
-                    })
+                    findings.append(Finding(
+                        severity='info',
+                        issue='README.md missing npm scripts from CLAUDE.md',
+                        file='README.md',
+                        description='Some npm commands documented in CLAUDE.md are not in README.md.',
+                        actual=f'CLAUDE.md documents: npm {", npm ".join(sorted(missing_important))}',
+                        documented='Missing from README.md',
+                        recommendation=f'Add command documentation to README.md: {", ".join(sorted(missing_important))}'
+                    ))
 
             # Check environment variables consistency
             # Extract env vars from both files
-            claude_env_vars = set(re.findall(r'`([A-Z_]+(?:_[A-Z_]+)*)`', claude_content))
-            readme_env_vars = set(re.findall(r'`([A-Z_]+(?:_[A-Z_]+)*)`', readme_content))
+            claude_env_vars = claude_index.env_vars
+            readme_env_vars = readme_index.env_vars
 
             # Filter to actual env vars (start with common prefixes)
             env_prefixes = ['REACT_APP_', 'SUPABASE_', 'ZUZU_', 'PORT', 'PRODUCTION_', 'ALLOWED_', 'JWT_']
@@ -553,98 +985,77 @@ class DocumentationChecker:
             # Important vars in CLAUDE.md but not README
             missing_env_vars = claude_env_vars - readme_env_vars
             if missing_env_vars:
-                self.findings.append({
-                    'severity': 'info',
-                    'issue': 'README.md missing environment variables from CLAUDE.md',
-                    'file': 'README.md',
-                    'description': 'Some environment variables in CLAUDE.md are not documented in README.md.',
-                    'actual': f'CLAUDE.md documents: {", ".join(sorted(missing_env_vars))}',
-                    'documented': 'Missing from README.md',
-                    'recommendation': f'Consider adding to README.md: {", ".join(sorted(missing_env_vars))}'
-                })
+                findings.append(Finding(
+                    severity='info',
+                    issue='README.md missing environment variables from CLAUDE.md',
+                    file='README.md',
+                    description='Some environment variables in CLAUDE.md are not documented in README.md.',
+                    actual=f'CLAUDE.md documents: {", ".join(sorted(missing_env_vars))}',
+                    documented='Missing from README.md',
+                    recommendation=f'Consider adding to README.md: {", ".join(sorted(missing_env_vars))}'
+                ))
 
         except Exception as e:
             print(f"[documentation] Error checking README/CLAUDE consistency: {e}")
 
-    def _check_page_tech_stacks(self):
+        return findings
+
+    def _check_page_tech_stacks(self) -> List[Finding]:
         """Check if tech stacks displayed in About.tsx and Home.tsx match package.json."""
+        findings: List[Finding] = []
         try:
-            import json
-            import re
-
             # Read package.json for both frontend and backend
             package_json = self.project_root / 'package.json'
             server_package_json = self.project_root / 'server' / 'package.json'
 
-            if not package_json.exists():
-                return
+            if not self._exists(package_json):
+                return findings
 
-            with open(package_json, 'r') as f:
-                frontend_pkg = json.load(f)
+            frontend_pkg = load_package_json(package_json)
 
             frontend_deps = frontend_pkg.get('dependencies', {})
             frontend_dev_deps = frontend_pkg.get('devDependencies', {})
 
             backend_deps = {}
-            if server_package_json.exists():
-                with open(server_package_json, 'r') as f:
-                    backend_pkg = json.load(f)
+            if self._exists(server_package_json):
+                backend_pkg = load_package_json(server_package_json)
                 backend_deps = backend_pkg.get('dependencies', {})
 
-            # Map display names to package names
-            tech_mapping = {
-                'React': 'react',
-                'MUI': '@mui/material',
-                'Material UI': '@mui/material',
-                'TypeScript': 'typescript',
-                'Redux': '@reduxjs/toolkit',
-                'Tailwind CSS': 'tailwindcss',
-                'TanStack Query': '@tanstack/react-query',
-                'Express': 'express',
-                'log4js': 'log4js',
-                'Morgan': 'morgan',
-                'Supabase': '@supabase/supabase-js',
-                'OpenRouter': None,  # Not a package, it's a service
-                'Webpack': 'webpack',
-                'Cypress': 'cypress'
-            }
-
             # Check Home.tsx
             home_file = self.project_root / 'src' / 'pages' / 'Home.tsx'
-            if home_file.exists():
-                with open(home_file, 'r') as f:
-                    home_content = f.read()
-
-                # Extract tech names from arrays
-                # frontendTech array (lines 61-68)
-                frontend_match = re.search(r'const frontendTech = \[(.*?)\];', home_content, re.DOTALL)
-                # backendTech array (lines 70-76)
-                backend_match = re.search(r'const backendTech = \[(.*?)\];', home_content, re.DOTALL)
-                # devTools array (lines 78-82)
-                devtools_match = re.search(r'const devTools = \[(.*?)\];', home_content, re.DOTALL)
+            if self._exists(home_file):
+                home_content = self._read(home_file)
+
+                # Extract tech names from the frontendTech, backendTech and
+                # devTools arrays in one scan (first declaration of each wins)
+                tech_arrays = {}
+                for m in TECH_ARRAYS_RE.finditer(home_content):
+                    tech_arrays.setdefault(m.group(1), m.group(2))
 
                 missing_techs = []
 
                 # Check frontend techs
-                if frontend_match:
-                    frontend_section = frontend_match.group(1)
-                    for tech_name, package_name in tech_mapping.items():
-                        if tech_name in frontend_section and package_name:
+                frontend_section = tech_arrays.get('frontendTech')
+                if frontend_section is not None:
+                    hits = _page_techs(frontend_section)
+                    for tech_name, package_name in PAGE_TECH_PACKAGES.items():
+                        if tech_name in hits and package_name:
                             # Check if package exists
                             if package_name not in frontend_deps and package_name not in frontend_dev_deps:
                                 missing_techs.append(f'{tech_name} (listed in Home.tsx but not in package.json)')
 
                 # Check backend techs
-                if backend_match:
-                    backend_section = backend_match.group(1)
-                    for tech_name, package_name in tech_mapping.items():
-                        if tech_name in backend_section and package_name:
+                backend_section = tech_arrays.get('backendTech')
+                if backend_section is not None:
+                    hits = _page_techs(backend_section)
+                    for tech_name, package_name in PAGE_TECH_PACKAGES.items():
+                        if tech_name in hits and package_name:
                             # Check if package exists in backend
                             if package_name not in backend_deps:
                                 missing_techs.append(f'{tech_name} (listed in Home.tsx but not in server/package.json)')
 
                 # Check for technologies in package.json but not displayed
-                displayed_techs_lower = home_content.lower()
+                displayed_techs_lower = self._read_lower(home_file)
 
                 # Key packages that should be displayed
                 important_packages = {
@@ -661,26 +1072,26 @@ class DocumentationChecker:
                             missing_from_display.append(display_name)
 
                 if missing_from_display:
-                    self.findings.append({
-                        'severity': 'info',
-                        'issue': 'Technologies missing from Home.tsx display',
-                        'file': 'src/pages/Home.tsx',
-                        'description': 'Some technologies used in the project are not displayed on the home page.',
-                        'actual': f'Technologies in use: {", ".join(missing_from_display)}',
-                        'documented': 'Not displayed on home page',
-                        'recommendation': f'Consider adding to frontendTech or backendTech arrays: {", ".join(missing_from_display)}'
-                    })
+                    findings.append(Finding(
+                        severity='info',
+                        issue='Technologies missing from Home.tsx display',
+                        file='src/pages/Home.tsx',
+                        description='Some technologies used in the project are not displayed on the home page.',
+                        actual=f'Technologies in use: {", ".join(missing_from_display)}',
+                        documented='Not displayed on home page',
+                        recommendation=f'Consider adding to frontendTech or backendTech arrays: {", ".join(missing_from_display)}'
+                    ))
 
             # Check About.tsx
             about_file = self.project_root / 'src' / 'pages' / 'About.tsx'
-            if about_file.exists():
-                with open(about_file, 'r') as f:
-                    about_content = f.read()
+            if self._exists(about_file):
+                about_content = self._read(about_file)
 
                 # Check for mentioned technologies
                 mentioned_techs = []
-                for tech_name, package_name in tech_mapping.items():
-                    if tech_name in about_content and package_name:
+                hits = _page_techs(about_content)
+                for tech_name, package_name in PAGE_TECH_PACKAGES.items():
+                    if tech_name in hits and package_name:
                         mentioned_techs.append((tech_name, package_name))
 
                 # Verify each mentioned tech exists in package.json
@@ -691,33 +1102,35 @@ class DocumentationChecker:
                         missing_from_about.append(f'{tech_name} (mentioned in About.tsx but not in package.json)')
 
                 if missing_from_about:
-                    self.findings.append({
-                        'severity': 'warning',
-                        'issue': 'Technologies mentioned in About.tsx not in package.json',
-                        'file': 'src/pages/About.tsx',
-                        'description': 'About page mentions technologies that are not installed.',
-                        'actual': f'Missing packages: {", ".join(missing_from_about)}',
-                        'recommendation': 'Remove mentions of uninstalled technologies or add them to package.json'
-                    })
+                    findings.append(Finding(
+                        severity='warning',
+                        issue='Technologies mentioned in About.tsx not in package.json',
+                        file='src/pages/About.tsx',
+                        description='About page mentions technologies that are not installed.',
+                        actual=f'Missing packages: {", ".join(missing_from_about)}',
+                        recommendation='Remove mentions of uninstalled technologies or add them to package.json'
+                    ))
 
                 # Check for outdated descriptions
                 # Example: Check if "React" is mentioned with a specific version
-                react_version_match = re.search(r'React\s+(\d+)', about_content)
+                react_version_match = REACT_VERSION_RE.search(about_content)
                 if react_version_match:
                     mentioned_version = react_version_match.group(1)
                     actual_version = frontend_deps.get('react', '').lstrip('^~')
                     if actual_version:
                         actual_major = actual_version.split('.')[0]
                         if mentioned_version != actual_major:
-                            self.findings.append({
-                                'severity': 'info',
-                                'issue': 'React version mismatch in About.tsx',
-                                'file': 'src/pages/About.tsx',
-                                'description': f'About page mentions React {mentioned_version} but package.json has {actual_version}',
-                                'actual': f'React version: {actual_version}',
-                                'documented': f'React {mentioned_version}',
-                                'recommendation': f'Update About.tsx to mention React {actual_major}'
-                            })
+                            findings.append(Finding(
+                                severity='info',
+                                issue='React version mismatch in About.tsx',
+                                file='src/pages/About.tsx',
+                                description=f'About page mentions React {mentioned_version} but package.json has {actual_version}',
+                                actual=f'React version: {actual_version}',
+                                documented=f'React {mentioned_version}',
+                                recommendation=f'Update About.tsx to mention React {actual_major}'
+                            ))
 
         except Exception as e:
             print(f"[documentation] Error checking page tech stacks: {e}")
+
+        return findings
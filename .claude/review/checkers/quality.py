@@ -2,9 +2,28 @@
 
 import re
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 import fnmatch
 
+from ..utils.findings import Finding
+
+
+# A source file read once per run: (path, content, content split into lines)
+SourceFile = Tuple[Path, str, List[str]]
+
+ANY_TYPE_RE = re.compile(r':\s*any\b')
+INTERFACE_RE = re.compile(r'^\s*interface\s+\w+')
+API_CALL_RE = re.compile(r'(fetch|axios\.(get|post|put|delete|patch))\s*\(')
+MAGIC_NUMBER_RE = re.compile(r'\b(\d{3,}|\d+\.\d+)\b')
+# Numbers that are common enough not to need a name
+EXCLUDED_NUMBERS = {'0', '1', '2', '100', '200', '404', '500'}
+# Values of CSS dimension properties (e.g. width: 100, maxHeight: 300})
+DIMENSION_VALUE_RE = re.compile(r'\b(?:width|height|maxWidth|minWidth|maxHeight|minHeight)\s*:\s*([\d.]+)\s*[,}]')
+FUNCTION_START_RE = re.compile(r'(function\s+\w+|const\s+\w+\s*=\s*\([^)]*\)\s*=>|\w+\s*\([^)]*\)\s*\{)')
+# Underscore at the start of an identifier, excluding object properties
+# (e.g. object._property)
+UNDERSCORE_VAR_RE = re.compile(r'(?<![a-zA-Z0-9_\.])_\w+\s*[,=:]')
+
 
 class QualityChecker:
     """
@@ -25,16 +44,21 @@ class QualityChecker:
 
     def run(self) -> Dict[str, Any]:
         """Run all quality checks."""
+        # Read each source file once and share it between the checks
+        ts_files = (self._read_source_files('src/**/*.ts')
+                    + self._read_source_files('src/**/*.tsx'))
+        source_files = ts_files + self._read_source_files('server/**/*.ts')
+
         # Check TypeScript/JavaScript files
-        self._check_typescript_files()
-        self._check_error_handling()
-        self._check_magic_values()
-        self._check_code_complexity()
-        self._check_typescript_best_practices()
+        self._check_typescript_files(ts_files)
+        self._check_error_handling(source_files)
+        self._check_magic_values(ts_files)
+        self._check_code_complexity(source_files)
+        self._check_typescript_best_practices(ts_files)
 
         # Determine status
-        critical = len([f for f in self.findings if f['severity'] == 'critical'])
-        warning = len([f for f in self.findings if f['severity'] == 'warning'])
+        critical = len([f for f in self.findings if f.severity == 'critical'])
+        warning = len([f for f in self.findings if f.severity == 'warning'])
 
         if critical > 0:
             status = 'critical'
@@ -62,6 +86,30 @@ class QualityChecker:
             count += len(files)
         return count
 
+    def _read_source_files(self, pattern: str) -> List[SourceFile]:
+        """
+        Read the files matching a glob, skipping gitignored paths.
+
+        Args:
+            pattern: Glob relative to the project root
+
+        Returns:
+            List of (path, content, lines) in glob order; files that can't
+            be read are reported and left out
+        """
+        files = []
+        for file_path in self.project_root.glob(pattern):
+            if self._should_ignore_path(file_path):
+                continue
+            try:
+                with open(file_path, 'r') as f:
+                    content = f.read()
+            except (OSError, UnicodeDecodeError) as e:
+                print(f"[quality] Error reading {file_path}: {e}")
+                continue
+            files.append((file_path, content, content.split('\n')))
+        return files
+
     def _load_gitignore(self) -> List[str]:
         """Load and parse .gitignore patterns."""
         patterns = []
@@ -164,69 +212,44 @@ class QualityChecker:
 
         return False
 
-    def _check_typescript_files(self):
-        """Check TypeScript files for quality issues."""
+    def _check_typescript_files(self, ts_files: List[SourceFile]):
+        """Check TypeScript files in src/ for quality issues."""
         try:
-            # Find all TypeScript files in src/ (excluding gitignored paths)
-            ts_files = [f for f in self.project_root.glob('src/**/*.ts')
-                       if not self._should_ignore_path(f)] + \
-                      [f for f in self.project_root.glob('src/**/*.tsx')
-                       if not self._should_ignore_path(f)]
-
-            for file_path in ts_files:
-                with open(file_path, 'r') as f:
-                    content = f.read()
-                    lines = content.split('\n')
-
+            for file_path, content, lines in ts_files:
                 # Check for 'any' type usage
-                any_pattern = r':\s*any\b'
                 for i, line in enumerate(lines, 1):
-                    if re.search(any_pattern, line) and 'eslint-disable' not in line:
-                        self.findings.append({
-                            'severity': 'warning',
-                            'issue': 'Use of "any" type reduces type safety',
-                            'file': str(file_path.relative_to(self.project_root)),
-                            'line': i,
-                            'description': f'Line {i} uses "any" type which defeats TypeScript\'s type checking.',
-                            'recommendation': 'Define a proper type or interface instead of using "any"',
-                            'code_snippet': line.strip()
-                        })
+                    if ANY_TYPE_RE.search(line) and 'eslint-disable' not in line:
+                        self.findings.append(Finding(
+                            severity='warning',
+                            issue='Use of "any" type reduces type safety',
+                            file=str(file_path.relative_to(self.project_root)),
+                            line=i,
+                            description=f'Line {i} uses "any" type which defeats TypeScript\'s type checking.',
+                            recommendation='Define a proper type or interface instead of using "any"',
+                            code_snippet=line.strip()
+                        ))
 
                 # Check for interface vs type preference
-                interface_pattern = r'^\s*interface\s+\w+'
                 for i, line in enumerate(lines, 1):
-                    if re.search(interface_pattern, line):
-                        self.findings.append({
-                            'severity': 'info',
-                            'issue': 'Use "type" instead of "interface" per project standards',
-                            'file': str(file_path.relative_to(self.project_root)),
-                            'line': i,
-                            'description': 'Project standards prefer "type" over "interface" for consistency.',
-                            'recommendation': 'Convert interface to type alias',
-                            'code_snippet': line.strip()
-                        })
+                    if INTERFACE_RE.search(line):
+                        self.findings.append(Finding(
+                            severity='info',
+                            issue='Use "type" instead of "interface" per project standards',
+                            file=str(file_path.relative_to(self.project_root)),
+                            line=i,
+                            description='Project standards prefer "type" over "interface" for consistency.',
+                            recommendation='Convert interface to type alias',
+                            code_snippet=line.strip()
+                        ))
 
         except Exception as e:
             print(f"[quality] Error checking TypeScript files: {e}")
 
-    def _check_error_handling(self):
+    def _check_error_handling(self, source_files: List[SourceFile]):
         """Check for proper error handling patterns."""
         try:
-            # Find all TypeScript/JavaScript files (excluding gitignored paths)
-            source_files = [f for f in self.project_root.glob('src/**/*.ts')
-                           if not self._should_ignore_path(f)] + \
-                          [f for f in self.project_root.glob('src/**/*.tsx')
-                           if not self._should_ignore_path(f)] + \
-                          [f for f in self.project_root.glob('server/**/*.ts')
-                           if not self._should_ignore_path(f)]
-
-            for file_path in source_files:
-                with open(file_path, 'r') as f:
-                    content = f.read()
-                    lines = content.split('\n')
-
+            for file_path, content, lines in source_files:
                 # Check for fetch/API calls without error handling
-                fetch_pattern = r'(fetch|axios\.(get|post|put|delete|patch))\s*\('
                 in_try_block = False
                 try_depth = 0
 
@@ -241,42 +264,30 @@ class QualityChecker:
                             in_try_block = False
 
                     # Check for API calls
-                    if re.search(fetch_pattern, line):
+                    if API_CALL_RE.search(line):
                         # Check if followed by .catch() or in try block
                         next_lines = '\n'.join(lines[i:min(i+5, len(lines))])
                         has_catch = '.catch(' in next_lines or 'catch(' in next_lines
 
                         if not in_try_block and not has_catch:
-                            self.findings.append({
-                                'severity': 'warning',
-                                'issue': 'API call without error handling',
-                                'file': str(file_path.relative_to(self.project_root)),
-                                'line': i,
-                                'description': 'API call lacks proper error handling (no try-catch or .catch())',
-                                'recommendation': 'Wrap in try-catch block or add .catch() handler',
-                                'code_snippet': line.strip()
-                            })
+                            self.findings.append(Finding(
+                                severity='warning',
+                                issue='API call without error handling',
+                                file=str(file_path.relative_to(self.project_root)),
+                                line=i,
+                                description='API call lacks proper error handling (no try-catch or .catch())',
+                                recommendation='Wrap in try-catch block or add .catch() handler',
+                                code_snippet=line.strip()
+                            ))
 
         except Exception as e:
             print(f"[quality] Error checking error handling: {e}")
 
-    def _check_magic_values(self):
+    def _check_magic_values(self, source_files: List[SourceFile]):
         """Check for magic numbers and strings that should be constants."""
         try:
-            source_files = [f for f in self.project_root.glob('src/**/*.ts')
-                           if not self._should_ignore_path(f)] + \
-                          [f for f in self.project_root.glob('src/**/*.tsx')
-                           if not self._should_ignore_path(f)]
-
-            for file_path in source_files:
-                with open(file_path, 'r') as f:
-                    content = f.read()
-                    lines = content.split('\n')
-
+            for file_path, content, lines in source_files:
                 # Look for magic numbers (excluding common values)
-                magic_number_pattern = r'\b(\d{3,}|\d+\.\d+)\b'
-                excluded_numbers = {'0', '1', '2', '100', '200', '404', '500'}
-
                 for i, line in enumerate(lines, 1):
                     # Skip comments and strings
                     if line.strip().startswith('//') or line.strip().startswith('*'):
@@ -286,10 +297,10 @@ class QualityChecker:
                     if self._is_inside_sx_block(lines, i - 1):  # i-1 because enumerate starts at 1
                         continue
 
-                    matches = re.finditer(magic_number_pattern, line)
-                    for match in matches:
+                    dimension_values = None
+                    for match in MAGIC_NUMBER_RE.finditer(line):
                         number = match.group(1)
-                        if number not in excluded_numbers:
+                        if number not in EXCLUDED_NUMBERS:
                             # Check if this number is part of a hex color code (e.g., #001133)
                             match_start = match.start()
                             if match_start > 0 and line[match_start - 1] == '#':
@@ -298,45 +309,34 @@ class QualityChecker:
 
                             # Check if this number is a CSS dimension property value
                             # (e.g., width: 100, height: 200, maxWidth: 300, etc.)
-                            dimension_props = r'\b(width|height|maxWidth|minWidth|maxHeight|minHeight)\s*:\s*'
-                            if re.search(dimension_props + re.escape(number) + r'\s*[,}]', line):
+                            if dimension_values is None:
+                                dimension_values = set(DIMENSION_VALUE_RE.findall(line))
+                            if number in dimension_values:
                                 # Skip CSS dimension property values
                                 continue
 
                             # Check if it's already a const
                             if 'const' not in line and '=' not in line.split(number)[0]:
-                                self.findings.append({
-                                    'severity': 'info',
-                                    'issue': f'Magic number "{number}" should be a named constant',
-                                    'file': str(file_path.relative_to(self.project_root)),
-                                    'line': i,
-                                    'description': 'Using magic numbers reduces code readability and maintainability.',
-                                    'recommendation': f'Define a named constant: const MEANINGFUL_NAME = {number}',
-                                    'code_snippet': line.strip()
-                                })
+                                self.findings.append(Finding(
+                                    severity='info',
+                                    issue=f'Magic number "{number}" should be a named constant',
+                                    file=str(file_path.relative_to(self.project_root)),
+                                    line=i,
+                                    description='Using magic numbers reduces code readability and maintainability.',
+                                    recommendation=f'Define a named constant: const MEANINGFUL_NAME = {number}',
+                                    code_snippet=line.strip()
+                                ))
 
         except Exception as e:
             print(f"[quality] Error checking magic values: {e}")
 
-    def _check_code_complexity(self):
+    def _check_code_complexity(self, source_files: List[SourceFile]):
         """Check for overly complex functions using cyclomatic complexity estimation."""
         try:
-            source_files = [f for f in self.project_root.glob('src/**/*.ts')
-                           if not self._should_ignore_path(f)] + \
-                          [f for f in self.project_root.glob('src/**/*.tsx')
-                           if not self._should_ignore_path(f)] + \
-                          [f for f in self.project_root.glob('server/**/*.ts')
-                           if not self._should_ignore_path(f)]
-
             max_complexity = self.config.get('thresholds', {}).get('complexity_max', 10)
 
-            for file_path in source_files:
-                with open(file_path, 'r') as f:
-                    content = f.read()
-                    lines = content.split('\n')
-
+            for file_path, content, lines in source_files:
                 # Simple function detection and complexity counting
-                function_pattern = r'(function\s+\w+|const\s+\w+\s*=\s*\([^)]*\)\s*=>|\w+\s*\([^)]*\)\s*\{)'
                 current_function = None
                 current_function_line = 0
                 brace_depth = 0
@@ -344,7 +344,7 @@ class QualityChecker:
 
                 for i, line in enumerate(lines, 1):
                     # Detect function start
-                    if re.search(function_pattern, line):
+                    if FUNCTION_START_RE.search(line):
                         current_function = line.strip()
                         current_function_line = i
                         complexity = 1
@@ -369,63 +369,51 @@ class QualityChecker:
                         # Function ended
                         if brace_depth == 0 and current_function_line != i:
                             if complexity > max_complexity:
-                                self.findings.append({
-                                    'severity': 'warning',
-                                    'issue': f'High cyclomatic complexity ({complexity})',
-                                    'file': str(file_path.relative_to(self.project_root)),
-                                    'line': current_function_line,
-                                    'description': f'Function has complexity of {complexity}, exceeding threshold of {max_complexity}.',
-                                    'recommendation': 'Consider breaking this function into smaller, more focused functions',
-                                    'code_snippet': current_function[:100]
-                                })
+                                self.findings.append(Finding(
+                                    severity='warning',
+                                    issue=f'High cyclomatic complexity ({complexity})',
+                                    file=str(file_path.relative_to(self.project_root)),
+                                    line=current_function_line,
+                                    description=f'Function has complexity of {complexity}, exceeding threshold of {max_complexity}.',
+                                    recommendation='Consider breaking this function into smaller, more focused functions',
+                                    code_snippet=current_function[:100]
+                                ))
                             current_function = None
 
         except Exception as e:
             print(f"[quality] Error checking complexity: {e}")
 
-    def _check_typescript_best_practices(self):
+    def _check_typescript_best_practices(self, ts_files: List[SourceFile]):
         """Check TypeScript-specific best practices."""
         try:
-            ts_files = [f for f in self.project_root.glob('src/**/*.ts')
-                       if not self._should_ignore_path(f)] + \
-                      [f for f in self.project_root.glob('src/**/*.tsx')
-                       if not self._should_ignore_path(f)]
-
-            for file_path in ts_files:
-                with open(file_path, 'r') as f:
-                    content = f.read()
-                    lines = content.split('\n')
-
+            for file_path, content, lines in ts_files:
                 # Check for unused variables with underscore prefix
-                # Use negative lookbehind to ensure _ is at the start of an identifier
-                # Excludes object properties (e.g., object._property)
-                unused_pattern = r'(?<![a-zA-Z0-9_\.])_\w+\s*[,=:]'
                 for i, line in enumerate(lines, 1):
-                    if re.search(unused_pattern, line):
-                        self.findings.append({
-                            'severity': 'info',
-                            'issue': 'Avoid underscore prefix for unused variables',
-                            'file': str(file_path.relative_to(self.project_root)),
-                            'line': i,
-                            'description': 'Project standards prefer removing unused variables instead of prefixing with underscore.',
-                            'recommendation': 'Remove unused variable or use it if needed',
-                            'code_snippet': line.strip()
-                        })
+                    if UNDERSCORE_VAR_RE.search(line):
+                        self.findings.append(Finding(
+                            severity='info',
+                            issue='Avoid underscore prefix for unused variables',
+                            file=str(file_path.relative_to(self.project_root)),
+                            line=i,
+                            description='Project standards prefer removing unused variables instead of prefixing with underscore.',
+                            recommendation='Remove unused variable or use it if needed',
+                            code_snippet=line.strip()
+                        ))
 
                 # Check for console.log in non-dev files
                 if 'console.log(' in content and '/src/' in str(file_path):
                     log_lines = [i+1 for i, line in enumerate(lines)
                                 if 'console.log(' in line and not line.strip().startswith('//')]
                     if log_lines:
-                        self.findings.append({
-                            'severity': 'info',
-                            'issue': 'console.log() found in source code',
-                            'file': str(file_path.relative_to(self.project_root)),
-                            'line': log_lines[0],
-                            'description': f'Found {len(log_lines)} console.log statement(s) which should be removed or replaced with proper logging.',
-                            'recommendation': 'Remove debug console.log or use a proper logging library',
-                            'code_snippet': f'{len(log_lines)} occurrence(s) found'
-                        })
+                        self.findings.append(Finding(
+                            severity='info',
+                            issue='console.log() found in source code',
+                            file=str(file_path.relative_to(self.project_root)),
+                            line=log_lines[0],
+                            description=f'Found {len(log_lines)} console.log statement(s) which should be removed or replaced with proper logging.',
+                            recommendation='Remove debug console.log or use a proper logging library',
+                            code_snippet=f'{len(log_lines)} occurrence(s) found'
+                        ))
 
         except Exception as e:
             print(f"[quality] Error checking TypeScript best practices: {e}")
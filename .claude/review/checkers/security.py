@@ -16,12 +16,11 @@ import re
 import json
 import sys
 from pathlib import Path
-from typing import Dict, List, Set, Any
+from typing import Dict, List, Set, Any, Optional
 import fnmatch
 
-# Import suppression manager
-sys.path.insert(0, str(Path(__file__).parent.parent))
-from utils.suppressions import SuppressionManager
+from ..utils.suppressions import SuppressionManager
+from ..utils.findings import Finding
 
 
 class SecurityChecker:
@@ -111,11 +110,11 @@ class SecurityChecker:
         except ValueError:
             return True
 
-    def _add_finding(self, finding: Dict[str, Any], code_content: Optional[str] = None):
+    def _add_finding(self, finding: Finding, code_content: Optional[str] = None):
         """Add a finding after checking if it's suppressed."""
-        file_path = finding.get('file', '')
-        line = finding.get('line')
-        issue = finding.get('issue', '')
+        file_path = finding.file or ''
+        line = finding.line
+        issue = finding.issue
 
         # Check if this finding is suppressed
         is_suppressed, justification = self.suppression_manager.is_suppressed(
@@ -136,8 +135,7 @@ class SecurityChecker:
         self.findings.append(finding)
 
         # Update metrics
-        severity = finding.get('severity')
-        if severity == 'critical':
+        if finding.severity == 'critical':
             self.metrics['critical_vulnerabilities'] += 1
         else:
             self.metrics['potential_vulnerabilities'] += 1
@@ -160,9 +158,9 @@ class SecurityChecker:
 
             # Determine overall status
             status = 'pass'
-            if any(f['severity'] == 'critical' for f in self.findings):
+            if any(f.severity == 'critical' for f in self.findings):
                 status = 'critical'
-            elif any(f['severity'] == 'warning' for f in self.findings):
+            elif any(f.severity == 'warning' for f in self.findings):
                 status = 'warning'
 
             return {
@@ -175,11 +173,11 @@ class SecurityChecker:
             return {
                 'category': 'security',
                 'status': 'error',
-                'findings': [{
-                    'severity': 'critical',
-                    'issue': f'Security checker failed: {str(e)}',
-                    'description': str(e)
-                }],
+                'findings': [Finding(
+                    severity='critical',
+                    issue=f'Security checker failed: {str(e)}',
+                    description=str(e)
+                )],
                 'metrics': self.metrics
             }
 
@@ -220,16 +218,16 @@ class SecurityChecker:
                             if 'process.env' in line or 'import.meta.env' in line or '.env' in line:
                                 continue
 
-                            self._add_finding({
-                                'severity': severity,
-                                'issue': issue_name,
-                                'file': str(code_file.relative_to(self.project_root)),
-                                'line': i,
-                                'description': f'Potential {issue_name.lower()} detected in source code',
-                                'recommendation': 'Move sensitive values to environment variables (.env file) and never commit them',
-                                'category': 'Secrets Exposure',
-                                'code_snippet': line.strip()[:80]
-                            }, code_content=content)
+                            self._add_finding(Finding(
+                                severity=severity,
+                                issue=issue_name,
+                                file=str(code_file.relative_to(self.project_root)),
+                                line=i,
+                                description=f'Potential {issue_name.lower()} detected in source code',
+                                recommendation='Move sensitive values to environment variables (.env file) and never commit them',
+                                category='Secrets Exposure',
+                                code_snippet=line.strip()[:80]
+                            ), code_content=content)
             except Exception:
                 continue
 
@@ -270,16 +268,16 @@ class SecurityChecker:
                             else:
                                 self.metrics['potential_vulnerabilities'] += 1
 
-                            self.findings.append({
-                                'severity': severity,
-                                'issue': issue_name,
-                                'file': str(code_file.relative_to(self.project_root)),
-                                'line': i,
-                                'description': f'{issue_name} - user input may be concatenated into query',
-                                'recommendation': 'Use parameterized queries or prepared statements. Never concatenate user input into queries.',
-                                'category': 'Injection Vulnerabilities',
-                                'code_snippet': line.strip()[:100]
-                            })
+                            self.findings.append(Finding(
+                                severity=severity,
+                                issue=issue_name,
+                                file=str(code_file.relative_to(self.project_root)),
+                                line=i,
+                                description=f'{issue_name} - user input may be concatenated into query',
+                                recommendation='Use parameterized queries or prepared statements. Never concatenate user input into queries.',
+                                category='Injection Vulnerabilities',
+                                code_snippet=line.strip()[:100]
+                            ))
             except Exception:
                 continue
 
@@ -318,16 +316,16 @@ class SecurityChecker:
                             else:
                                 self.metrics['potential_vulnerabilities'] += 1
 
-                            self.findings.append({
-                                'severity': severity,
-                                'issue': issue_name,
-                                'file': str(code_file.relative_to(self.project_root)),
-                                'line': i,
-                                'description': description,
-                                'recommendation': 'Avoid dangerous functions. Use safer alternatives.',
-                                'category': 'Dangerous Functions',
-                                'code_snippet': line.strip()[:100]
-                            })
+                            self.findings.append(Finding(
+                                severity=severity,
+                                issue=issue_name,
+                                file=str(code_file.relative_to(self.project_root)),
+                                line=i,
+                                description=description,
+                                recommendation='Avoid dangerous functions. Use safer alternatives.',
+                                category='Dangerous Functions',
+                                code_snippet=line.strip()[:100]
+                            ))
                             break  # Only report once per line
             except Exception:
                 continue
@@ -354,28 +352,28 @@ class SecurityChecker:
                     for i, line in enumerate(lines, 1):
                         if re.search(r'jwt\.sign.*secret\s*:\s*["\'](\w{1,15})["\']', line, re.IGNORECASE):
                             self.metrics['critical_vulnerabilities'] += 1
-                            self.findings.append({
-                                'severity': 'critical',
-                                'issue': 'Weak JWT secret',
-                                'file': str(auth_file.relative_to(self.project_root)),
-                                'line': i,
-                                'description': 'JWT secret appears to be short and weak',
-                                'recommendation': 'Use a strong, random secret (at least 256 bits). Store in environment variables.',
-                                'category': 'Authentication Security'
-                            })
+                            self.findings.append(Finding(
+                                severity='critical',
+                                issue='Weak JWT secret',
+                                file=str(auth_file.relative_to(self.project_root)),
+                                line=i,
+                                description='JWT secret appears to be short and weak',
+                                recommendation='Use a strong, random secret (at least 256 bits). Store in environment variables.',
+                                category='Authentication Security'
+                            ))
 
                         # Check for missing expiration
                         if 'jwt.sign(' in line and 'expiresIn' not in content:
                             self.metrics['potential_vulnerabilities'] += 1
-                            self.findings.append({
-                                'severity': 'warning',
-                                'issue': 'JWT without expiration',
-                                'file': str(auth_file.relative_to(self.project_root)),
-                                'line': i,
-                                'description': 'JWT tokens should have an expiration time',
-                                'recommendation': 'Add expiresIn option to jwt.sign() to prevent token reuse',
-                                'category': 'Authentication Security'
-                            })
+                            self.findings.append(Finding(
+                                severity='warning',
+                                issue='JWT without expiration',
+                                file=str(auth_file.relative_to(self.project_root)),
+                                line=i,
+                                description='JWT tokens should have an expiration time',
+                                recommendation='Add expiresIn option to jwt.sign() to prevent token reuse',
+                                category='Authentication Security'
+                            ))
                             break
 
                 # Check for password hashing
@@ -385,14 +383,14 @@ class SecurityChecker:
 
                     if has_plain_comparison and not has_bcrypt:
                         self.metrics['critical_vulnerabilities'] += 1
-                        self.findings.append({
-                            'severity': 'critical',
-                            'issue': 'Plain text password comparison',
-                            'file': str(auth_file.relative_to(self.project_root)),
-                            'description': 'Passwords appear to be compared in plain text',
-                            'recommendation': 'Use bcrypt, argon2, or scrypt to hash passwords. Never store or compare plain text passwords.',
-                            'category': 'Authentication Security'
-                        })
+                        self.findings.append(Finding(
+                            severity='critical',
+                            issue='Plain text password comparison',
+                            file=str(auth_file.relative_to(self.project_root)),
+                            description='Passwords appear to be compared in plain text',
+                            recommendation='Use bcrypt, argon2, or scrypt to hash passwords. Never store or compare plain text passwords.',
+                            category='Authentication Security'
+                        ))
 
             except Exception:
                 continue
@@ -448,16 +446,16 @@ class SecurityChecker:
 
                     for pattern, issue_name, severity, description in crypto_patterns:
                         if re.search(pattern, line):
-                            finding = {
-                                'severity': severity,
-                                'issue': issue_name,
-                                'file': str(code_file.relative_to(self.project_root)),
-                                'line': i,
-                                'description': description,
-                                'recommendation': 'Use SHA-256 or better for hashing. Use crypto.randomBytes() for random values.',
-                                'category': 'Cryptographic Weaknesses',
-                                'code_snippet': line.strip()[:100]
-                            }
+                            finding = Finding(
+                                severity=severity,
+                                issue=issue_name,
+                                file=str(code_file.relative_to(self.project_root)),
+                                line=i,
+                                description=description,
+                                recommendation='Use SHA-256 or better for hashing. Use crypto.randomBytes() for random values.',
+                                category='Cryptographic Weaknesses',
+                                code_snippet=line.strip()[:100]
+                            )
                             # Use _add_finding to respect suppressions
                             self._add_finding(finding, content)
             except Exception:
@@ -495,26 +493,26 @@ class SecurityChecker:
 
             if missing_headers:
                 self.metrics['potential_vulnerabilities'] += 1
-                self.findings.append({
-                    'severity': 'warning',
-                    'issue': 'Missing security headers',
-                    'file': str(server_index.relative_to(self.project_root)),
-                    'description': 'Security headers protect against common web vulnerabilities',
-                    'recommendation': 'Install and use helmet.js: npm install helmet, then app.use(helmet())',
-                    'category': 'Network Security'
-                })
+                self.findings.append(Finding(
+                    severity='warning',
+                    issue='Missing security headers',
+                    file=str(server_index.relative_to(self.project_root)),
+                    description='Security headers protect against common web vulnerabilities',
+                    recommendation='Install and use helmet.js: npm install helmet, then app.use(helmet())',
+                    category='Network Security'
+                ))
 
         # Check for HTTPS enforcement
         if 'app.use(' in content and 'https' not in content.lower():
             self.metrics['potential_vulnerabilities'] += 1
-            self.findings.append({
-                'severity': 'info',
-                'issue': 'HTTPS enforcement not detected',
-                'file': str(server_index.relative_to(self.project_root)),
-                'description': 'No HTTPS enforcement found in server configuration',
-                'recommendation': 'Consider enforcing HTTPS in production with middleware or reverse proxy',
-                'category': 'Network Security'
-            })
+            self.findings.append(Finding(
+                severity='info',
+                issue='HTTPS enforcement not detected',
+                file=str(server_index.relative_to(self.project_root)),
+                description='No HTTPS enforcement found in server configuration',
+                recommendation='Consider enforcing HTTPS in production with middleware or reverse proxy',
+                category='Network Security'
+            ))
 
     def _check_file_security(self):
         """Check for file security issues."""
@@ -541,16 +539,16 @@ class SecurityChecker:
                     for pattern, issue_name, severity in file_patterns:
                         if re.search(pattern, line):
                             self.metrics['critical_vulnerabilities'] += 1
-                            self.findings.append({
-                                'severity': severity,
-                                'issue': issue_name,
-                                'file': str(code_file.relative_to(self.project_root)),
-                                'line': i,
-                                'description': 'User input used in file operations can lead to path traversal attacks',
-                                'recommendation': 'Validate and sanitize file paths. Use path.join() and check for ".." sequences.',
-                                'category': 'File Security',
-                                'code_snippet': line.strip()[:100]
-                            })
+                            self.findings.append(Finding(
+                                severity=severity,
+                                issue=issue_name,
+                                file=str(code_file.relative_to(self.project_root)),
+                                line=i,
+                                description='User input used in file operations can lead to path traversal attacks',
+                                recommendation='Validate and sanitize file paths. Use path.join() and check for ".." sequences.',
+                                category='File Security',
+                                code_snippet=line.strip()[:100]
+                            ))
             except Exception:
                 continue
 
@@ -572,16 +570,16 @@ class SecurityChecker:
                     if 'dangerouslySetInnerHTML' in line:
                         if 'DOMPurify' not in content and 'sanitize' not in content:
                             self.metrics['potential_vulnerabilities'] += 1
-                            self.findings.append({
-                                'severity': 'warning',
-                                'issue': 'Unsanitized HTML content',
-                                'file': str(code_file.relative_to(self.project_root)),
-                                'line': i,
-                                'description': 'dangerouslySetInnerHTML without sanitization can lead to XSS',
-                                'recommendation': 'Use DOMPurify or similar library to sanitize HTML before rendering',
-                                'category': 'XSS Vulnerabilities',
-                                'code_snippet': line.strip()[:100]
-                            })
+                            self.findings.append(Finding(
+                                severity='warning',
+                                issue='Unsanitized HTML content',
+                                file=str(code_file.relative_to(self.project_root)),
+                                line=i,
+                                description='dangerouslySetInnerHTML without sanitization can lead to XSS',
+                                recommendation='Use DOMPurify or similar library to sanitize HTML before rendering',
+                                category='XSS Vulnerabilities',
+                                code_snippet=line.strip()[:100]
+                            ))
             except Exception:
                 continue
 
@@ -653,13 +651,13 @@ class SecurityChecker:
                 # Use configured severity or default to warning
                 severity = csrf_check_config.get('severity', 'warning')
 
-                finding = {
-                    'severity': severity,
-                    'issue': 'No CSRF protection detected',
-                    'description': f'Application has state-changing endpoints but no CSRF protection. Auth method: {auth_method}, SameSite: {same_site}',
-                    'recommendation': 'Implement CSRF protection using csurf middleware or change SameSite cookie attribute to "lax" or "strict"',
-                    'category': 'CSRF Protection'
-                }
+                finding = Finding(
+                    severity=severity,
+                    issue='No CSRF protection detected',
+                    description=f'Application has state-changing endpoints but no CSRF protection. Auth method: {auth_method}, SameSite: {same_site}',
+                    recommendation='Implement CSRF protection using csurf middleware or change SameSite cookie attribute to "lax" or "strict"',
+                    category='CSRF Protection'
+                )
 
                 # Use _add_finding to respect suppressions
                 self._add_finding(finding)
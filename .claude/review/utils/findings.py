@@ -0,0 +1,56 @@
+"""
+Finding Type
+
+Shared record type for the findings emitted by every checker.
+"""
+
+from dataclasses import dataclass, fields
+from itertools import chain
+from typing import Dict, Any, Iterator, Optional
+
+
+@dataclass(slots=True, frozen=True)
+class Finding:
+    """A single review finding."""
+
+    severity: str
+    issue: str
+    description: str
+    recommendation: Optional[str] = None
+    file: Optional[str] = None
+    line: Optional[int] = None
+    category: Optional[str] = None
+    actual: Optional[str] = None
+    expected: Optional[str] = None
+    documented: Optional[str] = None
+    code: Optional[str] = None
+    code_snippet: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to a plain dict for JSON export.
+
+        Returns:
+            Dictionary of the fields that are set (None values are omitted)
+        """
+        result = {}
+        for field in fields(self):
+            value = getattr(self, field.name)
+            if value is not None:
+                result[field.name] = value
+        return result
+
+
+def iter_findings(report_data: Dict[str, Any]) -> Iterator[Finding]:
+    """
+    Iterate every finding in an aggregated report, category by category.
+
+    Args:
+        report_data: Aggregated report data from checkers
+
+    Returns:
+        Lazy iterator over the findings of all categories
+    """
+    return chain.from_iterable(
+        data['findings'] for data in report_data['categories'].values()
+    )
@@ -7,7 +7,9 @@ Walks through review findings and offers to automatically fix documentation issu
 import os
 import re
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import List
+
+from .findings import Finding
 
 
 class InteractiveFixer:
@@ -27,12 +29,12 @@ class InteractiveFixer:
         self.fix_all = fix_all
         self.fixed_count = 0
 
-    def fix_findings(self, findings: List[Dict[str, Any]]) -> int:
+    def fix_findings(self, findings: List[Finding]) -> int:
         """
         Walk through findings and offer to fix each one.
 
         Args:
-            findings: List of finding dictionaries
+            findings: List of findings
 
         Returns:
             Number of findings fixed
@@ -44,16 +46,16 @@ class InteractiveFixer:
 
         for i, finding in enumerate(findings, 1):
             # Skip info-level findings unless fix_all is enabled
-            if finding.get('severity') == 'info' and not self.fix_all:
+            if finding.severity == 'info' and not self.fix_all:
                 continue
 
             print(f"\n--- Finding {i}/{len(findings)} ---")
-            print(f"Severity: {finding.get('severity', 'unknown').upper()}")
-            print(f"Issue: {finding.get('issue', 'Unknown issue')}")
-            print(f"File: {finding.get('file', 'Unknown file')}")
+            print(f"Severity: {finding.severity.upper()}")
+            print(f"Issue: {finding.issue or 'Unknown issue'}")
+            print(f"File: {finding.file or 'Unknown file'}")
 
-            if finding.get('description'):
-                print(f"Description: {finding['description']}")
+            if finding.description:
+                print(f"Description: {finding.description}")
 
             # Try to fix based on issue type
             if self._can_fix(finding):
@@ -78,9 +80,9 @@ class InteractiveFixer:
 
         return self.fixed_count
 
-    def _can_fix(self, finding: Dict[str, Any]) -> bool:
+    def _can_fix(self, finding: Finding) -> bool:
         """Check if a finding can be automatically fixed."""
-        issue = finding.get('issue', '')
+        issue = finding.issue
 
         # Fixable issues
         fixable_patterns = [
@@ -96,18 +98,18 @@ class InteractiveFixer:
 
         return any(pattern.lower() in issue.lower() for pattern in fixable_patterns)
 
-    def _apply_fix(self, finding: Dict[str, Any]) -> bool:
+    def _apply_fix(self, finding: Finding) -> bool:
         """
         Apply a fix for the finding.
 
         Args:
-            finding: Finding dictionary
+            finding: Finding to fix
 
         Returns:
             True if fix was applied, False otherwise
         """
-        issue = finding.get('issue', '')
-        file_path = finding.get('file', '')
+        issue = finding.issue
+        file_path = finding.file or ''
 
         try:
             # Fix missing AuthProvider in CLAUDE.md
@@ -166,10 +168,10 @@ class InteractiveFixer:
 
         return False
 
-    def _fix_incomplete_routing(self, file_path: str, finding: Dict[str, Any]) -> bool:
+    def _fix_incomplete_routing(self, file_path: str, finding: Finding) -> bool:
         """Update routing documentation with all routes."""
         full_path = self.project_root / file_path
-        actual = finding.get('actual', '')
+        actual = finding.actual or ''
 
         # Extract route list from actual
         # Format: "9 routes: Home, About, Login, ..."
@@ -230,10 +232,10 @@ class InteractiveFixer:
 
         return False
 
-    def _fix_readme_tech_stack(self, file_path: str, finding: Dict[str, Any]) -> bool:
+    def _fix_readme_tech_stack(self, file_path: str, finding: Finding) -> bool:
         """Add missing technologies to README.md tech stack."""
         full_path = self.project_root / file_path
-        actual = finding.get('actual', '')
+        actual = finding.actual or ''
 
         # Extract missing tech list
         match = re.search(r'Technologies in use: (.+)$', actual)
@@ -248,10 +250,10 @@ class InteractiveFixer:
 
         return False
 
-    def _fix_home_tech_stack(self, file_path: str, finding: Dict[str, Any]) -> bool:
+    def _fix_home_tech_stack(self, file_path: str, finding: Finding) -> bool:
         """Add missing technologies to Home.tsx arrays."""
         full_path = self.project_root / file_path
-        actual = finding.get('actual', '')
+        actual = finding.actual or ''
 
         # Extract missing tech list
         match = re.search(r'Technologies in use: (.+)$', actual)
@@ -301,10 +303,10 @@ class InteractiveFixer:
 
         return False
 
-    def _fix_jwt_env_vars(self, file_path: str, finding: Dict[str, Any]) -> bool:
+    def _fix_jwt_env_vars(self, file_path: str, finding: Finding) -> bool:
         """Add missing JWT environment variables to CLAUDE.md."""
         full_path = self.project_root / file_path
-        actual = finding.get('actual', '')
+        actual = finding.actual or ''
 
         # Extract JWT variables from actual
         match = re.search(r'JWT variables in \.env\.example: (.+)$', actual)
@@ -0,0 +1,141 @@
+"""
+Gitignore Matcher
+
+Reads a project's .gitignore and matches relative paths against it, shared
+by the checkers that walk the project tree.
+"""
+
+import fnmatch
+import re
+from pathlib import Path
+from typing import Iterable, List, Union
+
+try:
+    from pathspec import GitIgnoreSpec
+except ImportError:  # Optional; fall back to IgnoreMatcher's approximation
+    GitIgnoreSpec = None
+
+
+# Ignored in addition to whatever .gitignore lists
+DEFAULT_IGNORES = (
+    'node_modules', 'dist', 'build', '.git',
+    '__pycache__', '*.pyc', '.cache', 'coverage'
+)
+
+
+def read_gitignore(project_root: Path) -> List[str]:
+    """
+    Read the pattern lines of a project's .gitignore.
+
+    Args:
+        project_root: Directory containing the .gitignore
+
+    Returns:
+        Stripped lines, skipping blanks and comments ([] if there's no file)
+    """
+    lines = []
+    gitignore_path = Path(project_root) / '.gitignore'
+
+    if gitignore_path.exists():
+        with open(gitignore_path, 'r') as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith('#'):
+                    lines.append(line)
+
+    return lines
+
+
+def ignore_patterns(lines: Iterable[str]) -> List[str]:
+    """
+    Normalize .gitignore lines for IgnoreMatcher.
+
+    Leading slashes are dropped (patterns are matched against paths relative
+    to the project root) and DEFAULT_IGNORES are appended.
+    """
+    patterns = [line[1:] if line.startswith('/') else line for line in lines]
+    patterns.extend(DEFAULT_IGNORES)
+    return patterns
+
+
+class IgnoreMatcher:
+    """
+    Approximate gitignore matching for '/'-separated relative paths.
+
+    Patterns are bucketed up front so matching a path is a few C-level calls
+    (a tuple startswith, set lookups and one regex) rather than a loop over
+    every pattern.
+    """
+
+    __slots__ = ('_prefixes', '_exact', '_names', '_glob_re')
+
+    def __init__(self, patterns: Iterable[str]):
+        prefixes, exact, names, globs = [], [], [], []
+        for pattern in patterns:
+            if pattern.endswith('/'):
+                # Directory patterns match as a literal path prefix
+                prefixes.append(pattern.rstrip('/'))
+            elif '*' in pattern:
+                globs.append(fnmatch.translate(pattern))
+            elif '/' in pattern:
+                # The path itself, or anything beneath it
+                exact.append(pattern)
+                prefixes.append(pattern + '/')
+            elif pattern:
+                # Any whole path component
+                names.append(pattern)
+
+        self._prefixes = tuple(prefixes)
+        self._exact = frozenset(exact)
+        self._names = frozenset(names)
+        # Tried against the whole path and each of its parts
+        self._glob_re = re.compile('|'.join(globs)) if globs else None
+
+    def matches(self, rel_str: str, is_dir: bool = False) -> bool:
+        """
+        Check a '/'-separated path relative to the project root.
+
+        is_dir is accepted for parity with SpecMatcher; directory patterns
+        already match as path prefixes here.
+        """
+        if rel_str.startswith(self._prefixes) or rel_str in self._exact:
+            return True
+        parts = rel_str.split('/')
+        if not self._names.isdisjoint(parts):
+            return True
+        if self._glob_re:
+            match = self._glob_re.match
+            return bool(match(rel_str)) or any(match(part) for part in parts)
+        return False
+
+
+class SpecMatcher:
+    """
+    Gitignore matching backed by pathspec, which implements the full syntax
+    (anchoring, negation, '**' and character classes).
+    """
+
+    __slots__ = ('_spec',)
+
+    def __init__(self, lines: Iterable[str]):
+        self._spec = GitIgnoreSpec.from_lines(list(lines) + list(DEFAULT_IGNORES))
+
+    def matches(self, rel_str: str, is_dir: bool = False) -> bool:
+        """Check a '/'-separated path relative to the project root."""
+        # Directory-only patterns ('logs/') need the trailing slash
+        return self._spec.match_file(rel_str + '/' if is_dir else rel_str)
+
+
+def ignore_matcher(lines: List[str]) -> Union[SpecMatcher, IgnoreMatcher]:
+    """
+    Build the matcher for a project's .gitignore lines.
+
+    Args:
+        lines: Pattern lines from read_gitignore()
+
+    Returns:
+        A SpecMatcher when pathspec is installed, else an IgnoreMatcher
+    """
+    if GitIgnoreSpec is not None:
+        return SpecMatcher(lines)
+    return IgnoreMatcher(ignore_patterns(lines))
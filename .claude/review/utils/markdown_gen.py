@@ -5,9 +5,14 @@ Generates comprehensive markdown reports from review findings.
 """
 
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator, List, TextIO
 import subprocess
 
+from .findings import Finding, iter_findings
+
+
+SECTION_SEPARATOR = '\n\n---\n\n'
+
 
 class MarkdownReportGenerator:
     """Generates markdown reports from review data."""
@@ -33,26 +38,42 @@ class MarkdownReportGenerator:
         Returns:
             Formatted markdown string
         """
-        sections = []
+        return SECTION_SEPARATOR.join(self._iter_sections(report_data))
+
+    def generate_to(self, fp: TextIO, report_data: Dict[str, Any]) -> None:
+        """
+        Write the full markdown report to a file, one section at a time.
+
+        Produces the same output as generate() without holding the whole
+        report in memory.
 
+        Args:
+            fp: Writable text file object
+            report_data: Aggregated report data from checkers
+        """
+        for i, section in enumerate(self._iter_sections(report_data)):
+            if i:
+                fp.write(SECTION_SEPARATOR)
+            fp.write(section)
+
+    def _iter_sections(self, report_data: Dict[str, Any]) -> Iterator[str]:
+        """Yield report sections in order as they are formatted."""
         # Header
-        sections.append(self._generate_header(report_data))
+        yield self._generate_header(report_data)
 
         # Executive Summary
-        sections.append(self._generate_executive_summary(report_data))
+        yield self._generate_executive_summary(report_data)
 
         # Detailed Findings by Category
         for category, data in sorted(report_data['categories'].items()):
             if data['findings']:
-                sections.append(self._generate_category_section(category, data))
+                yield self._generate_category_section(category, data)
 
         # Recommendations
-        sections.append(self._generate_recommendations(report_data))
+        yield self._generate_recommendations(report_data)
 
         # Metrics
-        sections.append(self._generate_metrics(report_data))
-
-        return '\n\n---\n\n'.join(sections)
+        yield self._generate_metrics(report_data)
 
     def _generate_header(self, report_data: Dict[str, Any]) -> str:
         """Generate report header with metadata."""
@@ -132,8 +153,8 @@ class MarkdownReportGenerator:
 
         # Priority actions
         priority_findings = [
-            f for f in report_data['all_findings']
-            if f.get('severity') == 'critical'
+            f for f in iter_findings(report_data)
+            if f.severity == 'critical'
         ]
 
         if priority_findings:
@@ -142,7 +163,7 @@ class MarkdownReportGenerator:
                 ""
             ])
             for i, finding in enumerate(priority_findings[:5], 1):  # Top 5
-                lines.append(f"{i}. [CRITICAL] {finding.get('issue', 'Unknown issue')}")
+                lines.append(f"{i}. [CRITICAL] {finding.issue or 'Unknown issue'}")
             lines.append("")
 
         return '\n'.join(lines)
@@ -154,10 +175,12 @@ class MarkdownReportGenerator:
             ""
         ]
 
-        # Group findings by severity
-        critical = [f for f in data['findings'] if f.get('severity') == 'critical']
-        warning = [f for f in data['findings'] if f.get('severity') == 'warning']
-        info = [f for f in data['findings'] if f.get('severity') == 'info']
+        # Group findings by severity in a single pass
+        by_severity = {'critical': [], 'warning': [], 'info': []}
+        for f in data['findings']:
+            if f.severity in by_severity:
+                by_severity[f.severity].append(f)
+        critical, warning, info = by_severity['critical'], by_severity['warning'], by_severity['info']
 
         # Critical findings
         if critical:
@@ -193,44 +216,44 @@ class MarkdownReportGenerator:
 
         return '\n'.join(lines)
 
-    def _format_finding(self, finding: Dict[str, Any]) -> List[str]:
+    def _format_finding(self, finding: Finding) -> List[str]:
         """Format a single finding."""
         lines = [
-            f"#### {finding.get('issue', 'Unknown Issue')}",
+            f"#### {finding.issue or 'Unknown Issue'}",
             ""
         ]
 
-        if finding.get('file'):
-            location = finding['file']
-            if finding.get('line'):
-                location += f":{finding['line']}"
+        if finding.file:
+            location = finding.file
+            if finding.line:
+                location += f":{finding.line}"
             lines.append(f"**Location**: `{location}`")
             lines.append("")
 
-        if finding.get('description'):
-            lines.append(finding['description'])
+        if finding.description:
+            lines.append(finding.description)
             lines.append("")
 
-        if finding.get('actual'):
-            lines.append(f"**Actual**: {finding['actual']}")
+        if finding.actual:
+            lines.append(f"**Actual**: {finding.actual}")
             lines.append("")
 
-        if finding.get('expected'):
-            lines.append(f"**Expected**: {finding['expected']}")
+        if finding.expected:
+            lines.append(f"**Expected**: {finding.expected}")
             lines.append("")
 
-        if finding.get('documented'):
-            lines.append(f"**Documented**: {finding['documented']}")
+        if finding.documented:
+            lines.append(f"**Documented**: {finding.documented}")
             lines.append("")
 
-        if finding.get('code'):
+        if finding.code:
             lines.append("```")
-            lines.append(finding['code'])
+            lines.append(finding.code)
             lines.append("```")
             lines.append("")
 
-        if finding.get('recommendation'):
-            lines.append(f"**Recommendation**: {finding['recommendation']}")
+        if finding.recommendation:
+            lines.append(f"**Recommendation**: {finding.recommendation}")
             lines.append("")
 
         return lines
@@ -249,10 +272,9 @@ class MarkdownReportGenerator:
             'info': []
         }
 
-        for finding in report_data['all_findings']:
-            if finding.get('recommendation'):
-                severity = finding.get('severity', 'info')
-                recommendations[severity].append(finding['recommendation'])
+        for finding in iter_findings(report_data):
+            if finding.recommendation:
+                recommendations[finding.severity].append(finding.recommendation)
 
         # Output by priority
         if recommendations['critical']:
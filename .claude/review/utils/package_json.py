@@ -0,0 +1,51 @@
+"""
+Package Manifest Loader
+
+Parses package.json files once per process so checkers share the result.
+"""
+
+import os
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+
+# Path -> ((size, mtime_ns), parsed manifest)
+_PKG_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+
+def load_package_json(path) -> Optional[Dict[str, Any]]:
+    """
+    Load a package.json, reusing the parsed result while the file is unchanged.
+
+    The returned dict is shared between callers and must be treated as
+    read-only.
+
+    Args:
+        path: Path to the package.json file
+
+    Returns:
+        Parsed manifest, or None if the file doesn't exist
+
+    Raises:
+        ValueError: If the file isn't valid JSON (orjson's decode error
+            subclasses it too)
+    """
+    path = os.fspath(path)
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+
+    stamp = (st.st_size, st.st_mtime_ns)
+    cached = _PKG_CACHE.get(path)
+    if cached and cached[0] == stamp:
+        return cached[1]
+
+    with open(path, 'rb') as f:
+        pkg = _loads(f.read())
+    _PKG_CACHE[path] = (stamp, pkg)
+    return pkg